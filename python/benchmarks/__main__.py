@@ -0,0 +1,163 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import print_function
+
+import getopt
+import sys
+
+from .corpus import load_corpus
+from .results import compare, load_results, make_results, write_results
+from .runner import run_case
+
+
+def usage(stream=sys.stdout):
+    print(
+        """Usage: python -m benchmarks [options]
+
+ --filter=STRING       Only run cases whose name contains STRING
+ --language=LIST       Only run cases in these languages (js,css,html)
+ --repeat=NUMBER       Timed runs per case (default 10)
+ --warmup=NUMBER       Untimed runs before timing (default 1)
+ --no-memory           Skip measuring peak memory
+ --output=FILE         Write JSON results to FILE ("-" for stdout)
+ --baseline=FILE       Compare against results stored in FILE
+ --threshold=FRACTION  Allowed slowdown before failing (default 0.1 = 10%)
+ -h, --help            Show this help
+""",
+        file=stream,
+    )
+    return 1 if stream == sys.stderr else 0
+
+
+def _milliseconds(seconds):
+    return "%9.2f ms" % (seconds * 1000)
+
+
+def _megabytes(size):
+    return "%7.1f MB" % (size / (1024.0 * 1024.0))
+
+
+def report_case(name, result):
+    line = "%-36s %9d chars  median %s  p95 %s" % (
+        name,
+        result["size"],
+        _milliseconds(result["time"]["median"]),
+        _milliseconds(result["time"]["p95"]),
+    )
+    if "peak_memory" in result:
+        line += "  peak " + _megabytes(result["peak_memory"])
+    for phase, timing in sorted(result["phases"].items()):
+        line += "  %s %s" % (phase, _milliseconds(timing["median"]))
+    print(line, file=sys.stderr)
+
+
+def report_comparison(rows):
+    regressions = 0
+    for name, metric, old, new, ratio, regressed in rows:
+        if regressed:
+            regressions += 1
+        print(
+            "%-36s %-12s %+7.1f%%%s"
+            % (name, metric, (ratio - 1) * 100, "  REGRESSION" if regressed else ""),
+            file=sys.stderr,
+        )
+    return regressions
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    try:
+        opts, args = getopt.getopt(
+            argv,
+            "h",
+            [
+                "baseline=",
+                "filter=",
+                "help",
+                "language=",
+                "no-memory",
+                "output=",
+                "repeat=",
+                "threshold=",
+                "warmup=",
+            ],
+        )
+    except getopt.GetoptError as ex:
+        print(ex, file=sys.stderr)
+        return usage(sys.stderr)
+
+    name_filter = None
+    languages = None
+    repeat = 10
+    warmup = 1
+    memory = True
+    output = None
+    baseline = None
+    threshold = 0.1
+
+    for opt, arg in opts:
+        if opt in ("--filter",):
+            name_filter = arg
+        elif opt in ("--language",):
+            languages = arg.split(",")
+        elif opt in ("--repeat",):
+            repeat = int(arg)
+        elif opt in ("--warmup",):
+            warmup = int(arg)
+        elif opt in ("--no-memory",):
+            memory = False
+        elif opt in ("--output",):
+            output = arg
+        elif opt in ("--baseline",):
+            baseline = load_results(arg)
+        elif opt in ("--threshold",):
+            threshold = float(arg)
+        elif opt in ("--help", "-h"):
+            return usage()
+
+    cases = {}
+    for case in load_corpus(languages):
+        if name_filter is not None and name_filter not in case.name:
+            continue
+        cases[case.name] = run_case(case, repeat, warmup, memory)
+        report_case(case.name, cases[case.name])
+
+    results = make_results(cases)
+    if output is not None:
+        write_results(results, output)
+
+    if baseline is not None:
+        regressions = report_comparison(compare(results, baseline, threshold))
+        if regressions:
+            print("%d regressions" % regressions, file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
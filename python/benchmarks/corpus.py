@@ -0,0 +1,167 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import os
+import re
+
+__all__ = ["Case", "load_corpus", "SYNTHETIC"]
+
+RESOURCES = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "test", "resources"
+)
+
+# deliberately invalid utf-8, used to test error reporting
+EXCLUDED_RESOURCES = ["unicode-error.js"]
+
+LANGUAGES = {".js": "js", ".css": "css", ".html": "html"}
+
+
+class Case:
+    def __init__(self, name, language, source):
+        self.name = name
+        self.language = language
+        self.source = source
+
+
+def deep_nesting_js(depth=400):
+    return "function f(){" + "if(a){" * depth + "b();" + "}" * depth + "}"
+
+
+def long_lines_js(length=200000):
+    terms = ["a%d" % i for i in range(length // 5)]
+    return "var s=" + "+".join(terms) + ";"
+
+
+def huge_array_js(count=100000):
+    return "var a=[" + ",".join(str(i) for i in range(count)) + "];"
+
+
+def deep_nesting_css(depth=200):
+    return ".a{" * depth + "color:red;" + "}" * depth
+
+
+def long_lines_css(length=200000):
+    selectors = [".s%d" % i for i in range(length // 6)]
+    return ",".join(selectors) + "{color:red}"
+
+
+def huge_stylesheet_css(count=20000):
+    return "".join(".r%d{width:%dpx;height:%dpx}" % (i, i, i) for i in range(count))
+
+
+BASE62 = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _base62(number):
+    digits = ""
+    while True:
+        number, digit = divmod(number, 62)
+        digits = BASE62[digit] + digits
+        if not number:
+            return digits
+
+
+def string_table_js(count, name):
+    # a table of count strings, each looked up once
+    table = ",".join('"v%d"' % i for i in range(count))
+    return "var %s=[%s];" % (name, table) + "".join(
+        "f(%s[%d]);" % (name, i) for i in range(count)
+    )
+
+
+def packed_js(count=10000):
+    """P.A.C.K.E.R. output of a script with a table of count strings."""
+    words = []
+    codes = {}
+
+    def encode(match):
+        word = match.group(0)
+        if word not in codes:
+            codes[word] = _base62(len(words))
+            words.append(word)
+        return codes[word]
+
+    payload = re.sub(r"\b\w+\b", encode, string_table_js(count, "_s"))
+    return (
+        "eval(function(p,a,c,k,e,r){e=function(c){return(c<a?'':e(parseInt(c/a)))"
+        "+((c=c%%a)>35?String.fromCharCode(c+29):c.toString(36))};"
+        "if(!''.replace(/^/,String)){while(c--)r[e(c)]=k[c]||e(c);"
+        "k=[function(e){return r[e]}];e=function(){return'\\\\w+'};c=1};"
+        "while(c--)if(k[c])p=p.replace(new RegExp('\\\\b'+e(c)+'\\\\b','g'),k[c]);"
+        "return p}('%s',62,%d,'%s'.split('|'),0,{}))"
+        % (payload, len(words), "|".join(words))
+    )
+
+
+def obfuscated_js(count=10000):
+    """javascriptobfuscator.com style script with a table of count strings."""
+    return string_table_js(count, "_0xabc")
+
+
+def many_scripts_html(count=1000):
+    blocks = [
+        "<p onclick=f(%d)>%d</p><script>var a%d={b:%d};f(a%d)</script>"
+        "<style>.c%d{width:%dpx}</style>" % (i, i, i, i, i, i, i)
+        for i in range(count)
+    ]
+    return "<div>" + "".join(blocks) + "</div>"
+
+
+SYNTHETIC = [
+    ("synthetic/deep-nesting.js", "js", deep_nesting_js),
+    ("synthetic/long-lines.js", "js", long_lines_js),
+    ("synthetic/huge-array.js", "js", huge_array_js),
+    ("synthetic/packed-10k.js", "js", packed_js),
+    ("synthetic/packed-40k.js", "js", lambda: packed_js(40000)),
+    ("synthetic/obfuscated-10k.js", "js", obfuscated_js),
+    ("synthetic/obfuscated-40k.js", "js", lambda: obfuscated_js(40000)),
+    ("synthetic/deep-nesting.css", "css", deep_nesting_css),
+    ("synthetic/long-lines.css", "css", long_lines_css),
+    ("synthetic/huge-stylesheet.css", "css", huge_stylesheet_css),
+    ("synthetic/many-scripts.html", "html", many_scripts_html),
+]
+
+
+def load_corpus(languages=None):
+    """The files in test/resources followed by the synthetic inputs."""
+
+    def wanted(language):
+        return languages is None or language in languages
+
+    cases = []
+    for name in sorted(os.listdir(RESOURCES)):
+        language = LANGUAGES.get(os.path.splitext(name)[1])
+        if language is None or name in EXCLUDED_RESOURCES or not wanted(language):
+            continue
+        with io.open(
+            os.path.join(RESOURCES, name), "rt", newline="", encoding="UTF-8"
+        ) as f:
+            cases.append(Case("resources/" + name, language, f.read()))
+
+    # only generate the inputs that are asked for, some of them are large
+    for name, language, generate in SYNTHETIC:
+        if wanted(language):
+            cases.append(Case(name, language, generate()))
+    return cases
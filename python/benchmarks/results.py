@@ -0,0 +1,101 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import json
+import platform
+import sys
+
+import jsbeautifier
+
+__all__ = ["make_results", "write_results", "load_results", "compare"]
+
+RESULTS_VERSION = 1
+
+# Only these are gated; p95 and stdev are too noisy to fail a run on
+GATED_METRICS = [("time", "median"), ("peak_memory", None)]
+
+
+def make_results(cases):
+    return {
+        "version": RESULTS_VERSION,
+        "jsbeautifier": jsbeautifier.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cases": cases,
+    }
+
+
+def write_results(results, path):
+    text = json.dumps(results, indent=2, sort_keys=True) + "\n"
+    if path == "-":
+        sys.stdout.write(text)
+    else:
+        with io.open(path, "wt", encoding="UTF-8") as f:
+            f.write(text)
+
+
+def load_results(path):
+    with io.open(path, "rt", encoding="UTF-8") as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            "%s: unsupported benchmark results version %r"
+            % (path, results.get("version"))
+        )
+    return results
+
+
+def _metric(case, metric, field):
+    value = case.get(metric)
+    if field is not None and value is not None:
+        value = value.get(field)
+    return value
+
+
+def compare(results, baseline, threshold):
+    """Compare the gated metrics of the cases found in both runs.
+
+    Returns a list of (case, metric, baseline value, value, ratio, regressed)
+    where regressed means value exceeds the baseline by more than threshold,
+    a fraction (0.1 is 10%).
+    """
+    rows = []
+    for name in sorted(results["cases"]):
+        old_case = baseline["cases"].get(name)
+        if old_case is None:
+            continue
+
+        new_case = results["cases"][name]
+        for metric, field in GATED_METRICS:
+            old = _metric(old_case, metric, field)
+            new = _metric(new_case, metric, field)
+            if not old or new is None:
+                continue
+
+            ratio = float(new) / old
+            label = metric if field is None else metric + "." + field
+            rows.append((name, label, old, new, ratio, ratio > 1 + threshold))
+    return rows
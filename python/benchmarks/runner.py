@@ -0,0 +1,131 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import gc
+import time
+import tracemalloc
+
+import cssbeautifier
+import htmlbeautifier
+import jsbeautifier
+from jsbeautifier.core.stats import BeautifierStats
+
+__all__ = ["run_case", "summarize", "percentile"]
+
+
+def _options(module):
+    # the same settings as the test-perf scripts
+    options = module.default_options()
+    options.wrap_line_length = 80
+    return options
+
+
+def _beautify_js(source, stats=None):
+    jsbeautifier.beautify(source, _options(jsbeautifier), stats=stats)
+
+
+def _beautify_css(source, stats=None):
+    cssbeautifier.beautify(source, _options(cssbeautifier), stats=stats)
+
+
+def _beautify_html(source, stats=None):
+    htmlbeautifier.beautify(source, _options(htmlbeautifier), stats=stats)
+
+
+BEAUTIFIERS = {"js": _beautify_js, "css": _beautify_css, "html": _beautify_html}
+
+
+def percentile(samples, fraction):
+    # nearest rank, so the result is always one of the samples
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(samples):
+    mean = sum(samples) / len(samples)
+    variance = sum((sample - mean) ** 2 for sample in samples) / len(samples)
+    return {
+        "median": percentile(samples, 0.5),
+        "p95": percentile(samples, 0.95),
+        "min": min(samples),
+        "mean": mean,
+        "stdev": variance**0.5,
+    }
+
+
+def measure(run, source, repeat, warmup):
+    for _ in range(warmup):
+        run(source)
+
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run(source)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def measure_phases(run, source, repeat):
+    # Separate runs, so the cost of collecting stats stays out of the timings
+    samples = {}
+    stats = BeautifierStats()
+    for _ in range(repeat):
+        stats = BeautifierStats()
+        run(source, stats)
+        for phase, seconds in stats.phases.items():
+            samples.setdefault(phase, []).append(seconds)
+    return stats, dict((phase, summarize(s)) for phase, s in samples.items())
+
+
+def peak_memory(run, source):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(source)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(case, repeat=10, warmup=1, memory=True):
+    """Time one corpus case, returning a JSON-serializable dict."""
+    run = BEAUTIFIERS[case.language]
+    stats, phases = measure_phases(run, case.source, repeat)
+    result = {
+        "language": case.language,
+        "size": len(case.source),
+        "repeat": repeat,
+        "time": summarize(measure(run, case.source, repeat, warmup)),
+        "phases": phases,
+        "tokens": sum(stats.token_counts.values()),
+        "output_lines": stats.output_lines,
+        "wraps": stats.wraps,
+    }
+
+    if memory:
+        result["peak_memory"] = peak_memory(run, case.source)
+
+    return result
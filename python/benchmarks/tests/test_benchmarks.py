@@ -0,0 +1,73 @@
+import io
+import unittest
+from jsbeautifier import unpackers
+from ..corpus import Case, load_corpus, obfuscated_js, packed_js
+from ..memory import peak_rss, report_peak_rss
+from ..results import compare, make_results
+from ..runner import percentile, run_case, summarize
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_summarize(self):
+        samples = [float(i) for i in range(1, 21)]
+        summary = summarize(samples)
+
+        self.assertEqual(summary["median"], 10.0)
+        self.assertEqual(summary["p95"], 19.0)
+        self.assertEqual(summary["min"], 1.0)
+        self.assertEqual(summary["mean"], 10.5)
+        self.assertEqual(percentile([3.0], 0.95), 3.0)
+
+    def test_corpus(self):
+        names = [case.name for case in load_corpus(["css"])]
+
+        self.assertIn("resources/github.css", names)
+        self.assertIn("synthetic/deep-nesting.css", names)
+        self.assertFalse([name for name in names if name.endswith(".js")])
+
+        names = [case.name for case in load_corpus(["html"])]
+        self.assertEqual(
+            names,
+            [
+                "resources/github.html",
+                "resources/html-with-base64image.html",
+                "synthetic/many-scripts.html",
+            ],
+        )
+
+    def test_peak_rss(self):
+        peak = peak_rss()
+        stream = io.StringIO()
+        report_peak_rss(stream)
+        if peak is None:
+            self.assertEqual(stream.getvalue(), "")
+        else:
+            self.assertGreater(peak, 1024 * 1024)
+            self.assertTrue(stream.getvalue().startswith("peak RSS: "))
+
+    def test_packed_corpus(self):
+        expected = 'f("v0");f("v1");f("v2");'
+
+        self.assertEqual(unpackers.run(packed_js(3)), expected)
+        self.assertEqual(unpackers.run(obfuscated_js(3)), expected)
+
+    def test_run_and_compare(self):
+        result = run_case(Case("tiny.js", "js", "if(a){b()}"), repeat=2, warmup=0)
+
+        self.assertEqual(result["size"], 10)
+        self.assertIn("tokenize", result["phases"])
+        self.assertGreater(result["peak_memory"], 0)
+
+        baseline = make_results({"tiny.js": result})
+        slower = dict(result, time=dict(result["time"]))
+        slower["time"]["median"] = result["time"]["median"] * 1.5
+        rows = compare(make_results({"tiny.js": slower}), baseline, 0.1)
+
+        self.assertEqual(
+            [(row[0], row[1], row[5]) for row in rows],
+            [("tiny.js", "time.median", True), ("tiny.js", "peak_memory", False)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
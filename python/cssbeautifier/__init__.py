@@ -24,6 +24,7 @@
 # SOFTWARE.
 
 import sys
+from cssbeautifier.__version__ import __version__
 
 
 def default_options():
@@ -31,14 +32,24 @@ def default_options():
     return _main.default_options()
 
 
-def beautify(string, opts=None):
+def beautify(string, opts=None, sink=None, stats=None):
     _main = __import__("cssbeautifier", globals(), locals(), ["_main"])._main
-    return _main.beautify(string, opts)
+    return _main.beautify(string, opts, sink, stats)
 
 
-def beautify_file(file_name, opts=None):
+def beautify_file(file_name, opts=None, sink=None, cache=None):
     _main = __import__("cssbeautifier", globals(), locals(), ["_main"])._main
-    return _main.beautify_file(file_name, opts)
+    return _main.beautify_file(file_name, opts, sink, cache)
+
+
+def formatter(opts=None):
+    _main = __import__("cssbeautifier", globals(), locals(), ["_main"])._main
+    return _main.formatter(opts)
+
+
+def beautify_many(sources, opts=None, workers=None, chunk_size=None, lazy=False):
+    _main = __import__("cssbeautifier", globals(), locals(), ["_main"])._main
+    return _main.beautify_many(sources, opts, workers, chunk_size, lazy)
 
 
 def usage(stream=sys.stdout):
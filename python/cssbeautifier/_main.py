@@ -34,21 +34,57 @@ from cssbeautifier.__version__ import __version__
 from jsbeautifier.cli import *
 from cssbeautifier.css.options import BeautifierOptions
 from cssbeautifier.css.beautifier import Beautifier
-
-__all__ = ["default_options", "beautify", "beautify_file", "usage", "main"]
+from jsbeautifier.core.formatter import Formatter
+from jsbeautifier.core import batch
+from jsbeautifier.core.cache import ResultCache
+from jsbeautifier.core.fileindex import FileIndex
+
+__all__ = [
+    "default_options",
+    "beautify",
+    "beautify_file",
+    "formatter",
+    "beautify_many",
+    "usage",
+    "main",
+]
 
 
 def default_options():
     return BeautifierOptions()
 
 
-def beautify(string, opts=None):
+def beautify(string, opts=None, sink=None, stats=None):
     b = Beautifier(string, opts)
-    return b.beautify()
+    pretty = b.beautify(stats=stats)
+    if sink is None:
+        return pretty
+
+    # CSS is not formatted incrementally, the result is written in one go
+    sink.write(pretty)
+    return ""
+
+
+def beautify_file(file_name, opts=None, sink=None, cache=None):
+    def beautify_code(string, opts):
+        if cache is not None:
+            return cache.beautify(beautify, string, opts, sink)
+        return beautify(string, opts, sink)
+
+    return process_file(file_name, opts, beautify_code)
+
+
+def formatter(opts=None):
+    # Every Beautifier parses the options it is given, so it gets a private
+    # copy of them as given, which later changes to opts don't reach. Parse
+    # once here anyway so invalid options fail now, not on first use.
+    options = copy.deepcopy(opts)
+    BeautifierOptions(options)
+    return Formatter(lambda: Beautifier(None, options))
 
 
-def beautify_file(file_name, opts=None):
-    return process_file(file_name, opts, beautify)
+def beautify_many(sources, opts=None, workers=None, chunk_size=None, lazy=False):
+    return batch.beautify_many(formatter, sources, opts, workers, chunk_size, lazy)
 
 
 def usage(stream=sys.stdout):
@@ -85,6 +121,11 @@ Output options:
       --indent-empty-lines         Keep indentation on empty lines
  -r,  --replace                    Write output in-place, replacing input
  -o,  --outfile=FILE               Specify a file to output to (default stdout)
+      --jobs=NUMBER                Number of files to beautify in parallel when
+                                   replacing several files. (default CPU count)
+      --cache-dir=DIR              Reuse results stored in DIR for unchanged inputs
+      --skip-unchanged=FILE        With --replace, skip files already beautified
+                                   since the last run, as recorded in FILE
 
 Rarely needed options:
 
@@ -115,6 +156,9 @@ def main():
                 "stdin",
                 "outfile=",
                 "replace",
+                "jobs=",
+                "cache-dir=",
+                "skip-unchanged=",
                 "indent-size=",
                 "indent-char=",
                 "eol=",
@@ -139,6 +183,9 @@ def main():
 
     outfile_param = "stdout"
     replace = False
+    jobs = get_default_jobs()
+    cache = None
+    index = None
 
     for opt, arg in opts:
         if opt in ("--stdin", "-i"):
@@ -147,6 +194,12 @@ def main():
             outfile = arg
         elif opt in ("--replace", "-r"):
             replace = True
+        elif opt in ("--jobs",):
+            jobs = int(arg)
+        elif opt in ("--cache-dir",):
+            cache = ResultCache(arg)
+        elif opt in ("--skip-unchanged",):
+            index = FileIndex(arg)
         elif opt in ("--version", "-v"):
             return print(__version__)
         elif opt in ("--help", "--usage", "-h"):
@@ -179,30 +232,25 @@ def main():
 
     try:
         filepaths, replace = get_filepaths_from_params(filepath_params, replace)
-        for filepath in filepaths:
-            if not replace:
-                outfile = outfile_param
-            else:
-                outfile = filepath
-
-            css_options = integrate_editorconfig_options(
-                filepath, css_options, outfile, "js"
-            )
-
-            pretty = beautify_file(filepath, css_options)
-
-            write_beautified_output(pretty, css_options, outfile)
+        failures = beautify_files(
+            filepaths,
+            replace,
+            outfile_param,
+            css_options,
+            "css",
+            beautify,
+            jobs,
+            cache,
+            index,
+        )
+        if failures:
+            return 1
 
     except MissingInputStreamError:
         print("Must pipe input or define at least one file.\n", file=sys.stderr)
         usage(sys.stderr)
         return 1
 
-    except UnicodeError as ex:
-        print("Error while decoding input or encoding output:", file=sys.stderr)
-        print(ex, file=sys.stderr)
-        return 1
-
     except Exception as ex:
         print(ex, file=sys.stderr)
         return 1
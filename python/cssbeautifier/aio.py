@@ -0,0 +1,63 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Beautify from asyncio code without blocking the event loop:
+#
+#   import cssbeautifier.aio
+#   res = await cssbeautifier.aio.beautify(source, opts, timeout=5)
+#
+# Inputs are handed to a pool of worker processes, started on first use and
+# shared by every caller; small ones are beautified right away. For a pool
+# with other settings create a BeautifierPool(cssbeautifier.formatter, ...).
+
+import threading
+
+import cssbeautifier
+from jsbeautifier.core.aio import BeautifierPool
+
+__all__ = ["beautify", "get_pool", "shutdown", "BeautifierPool"]
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BeautifierPool(cssbeautifier.formatter)
+        return _pool
+
+
+async def beautify(string, opts=None, timeout=None):
+    return await get_pool().beautify(string, opts, timeout)
+
+
+def shutdown(wait=True):
+    global _pool
+    with _pool_lock:
+        pool = _pool
+        _pool = None
+    if pool is not None:
+        pool.shutdown(wait)
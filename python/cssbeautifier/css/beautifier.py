@@ -44,6 +44,18 @@ directives_core = Directives(r"/\*", r"\*/")
 whitespaceChar = re.compile(r"\s")
 whitespacePattern = re.compile(r"(?:\s|\n)+")
 
+# in javascript, these two differ
+# in python they are the same, different methods are called on them
+# IMPORTANT: This string must be run through six to handle \u chars
+lineBreak = re.compile(six.u(r"\r\n|[\n\r]"))
+allLineBreaks = lineBreak
+
+comment_pattern = re.compile(six.u(r"\/\/(?:[^\n\r\u2028\u2029]*)"))
+block_comment_pattern = re.compile(r"\/\*(?:[\s\S]*?)((?:\*\/)|$)")
+
+# characters that end a $variable or @rule name
+variableOrRuleEnd = re.compile(r"[: ,;{}()[\]\/='\"]")
+
 # WORD_RE = re.compile("[\w$\-_]")
 
 
@@ -85,14 +97,12 @@ CSS beautifier (https://beautifier.io/)
 
 class Beautifier:
     def __init__(self, source_text, opts=default_options()):
-        # in javascript, these two differ
-        # in python they are the same, different methods are called on them
-        # IMPORTANT: This string must be run through six to handle \u chars
-        self.lineBreak = re.compile(six.u(r"\r\n|[\n\r]"))
-        self.allLineBreaks = self.lineBreak
+        # compiled once at module level, shared by every Beautifier
+        self.lineBreak = lineBreak
+        self.allLineBreaks = allLineBreaks
 
-        self.comment_pattern = re.compile(six.u(r"\/\/(?:[^\n\r\u2028\u2029]*)"))
-        self.block_comment_pattern = re.compile(r"\/\*(?:[\s\S]*?)((?:\*\/)|$)")
+        self.comment_pattern = comment_pattern
+        self.block_comment_pattern = block_comment_pattern
 
         if not source_text:
             source_text = ""
@@ -100,6 +110,7 @@ class Beautifier:
         self.__source_text = source_text
 
         self._options = BeautifierOptions(opts)
+        self._eol = None
         self._input = None
         self._ch = None
 
@@ -191,16 +202,27 @@ class Beautifier:
         self._output.non_breaking_space = True
         self._output.add_token(output_string)
 
-    def beautify(self):
+    def beautify(self, source_text=None, stats=None):
+        # With a BeautifierStats, the phases of this call are timed and
+        # counted into it.
+        if source_text is not None:
+            self.__source_text = source_text
+
         if self._options.disabled:
             return self.__source_text
 
+        recorder = None
+        if stats is not None:
+            recorder = stats.begin()
+
         source_text = self.__source_text
 
-        if self._options.eol == "auto":
-            self._options.eol = "\n"
+        # detected per input so the options can be reused
+        self._eol = self._options.eol
+        if self._eol == "auto":
+            self._eol = "\n"
             if self.lineBreak.search(source_text or ""):
-                self._options.eol = self.lineBreak.search(source_text).group()
+                self._eol = self.lineBreak.search(source_text).group()
 
         # HACK: newline parsing inconsistent. This brute force normalizes the
         # input newlines.
@@ -214,6 +236,9 @@ class Beautifier:
         self._indentLevel = 0
         self._nestedLevel = 0
 
+        if recorder is not None:
+            recorder.lap("setup")
+
         self._ch = None
         parenLevel = 0
 
@@ -275,9 +300,7 @@ class Beautifier:
                 self.print_string(self._ch)
 
                 # strip trailing space, for hash property check
-                variable = self._input.peekUntilAfter(
-                    re.compile(r"[: ,;{}()[\]\/='\"]")
-                )
+                variable = self._input.peekUntilAfter(variableOrRuleEnd)
 
                 if variable[-1] in ": ":
                     # we have a variable or pseudo-class, add it and
@@ -300,9 +323,7 @@ class Beautifier:
                 else:
                     self.print_string(self._ch)
                     # strip trailing space, for hash property check
-                    variableOrRule = self._input.peekUntilAfter(
-                        re.compile(r"[: ,;{}()[\]\/='\"]")
-                    )
+                    variableOrRule = self._input.peekUntilAfter(variableOrRuleEnd)
 
                     if variableOrRule[-1] in ": ":
                         # we have a variable or pseudo-class, add it and
@@ -564,6 +585,13 @@ class Beautifier:
                 ):
                     self._output.add_new_line()
 
-        sweet_code = self._output.get_code(self._options.eol)
+        if recorder is not None:
+            recorder.lap("handle")
+
+        sweet_code = self._output.get_code(self._eol)
+
+        if recorder is not None:
+            recorder.lap("output")
+            recorder.finish(self._output)
 
         return sweet_code
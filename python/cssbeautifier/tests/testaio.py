@@ -0,0 +1,26 @@
+import asyncio
+import unittest
+import cssbeautifier
+import cssbeautifier.aio
+
+
+class TestAio(unittest.TestCase):
+    def test_beautify(self):
+        sources = ["a{color:red}", ".b{margin:0}\n" * 500]
+
+        async def run():
+            return await asyncio.gather(
+                *[cssbeautifier.aio.beautify(s, {"indent_size": 2}) for s in sources]
+            )
+
+        try:
+            self.assertEqual(
+                asyncio.run(run()),
+                [cssbeautifier.beautify(s, {"indent_size": 2}) for s in sources],
+            )
+        finally:
+            cssbeautifier.aio.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import cssbeautifier
+from jsbeautifier.core.cache import ResultCache
+
+
+class TestCSSBeautifierBatch(unittest.TestCase):
+    def test_formatter_matches_beautify(self):
+        formatter = cssbeautifier.formatter({"indent_size": 2})
+
+        for source in ["a{color:red}", "a{b:c}\r\nd{e:f}", "@media x{a{b:c}}"]:
+            self.assertEqual(
+                formatter.beautify(source),
+                cssbeautifier.beautify(source, {"indent_size": 2}),
+            )
+
+    def test_pool_keeps_order(self):
+        sources = [".a%d{width:%dpx}" % (i, i) for i in range(30)]
+        expected = [cssbeautifier.beautify(source) for source in sources]
+
+        self.assertEqual(
+            cssbeautifier.beautify_many(sources, workers=2, chunk_size=50), expected
+        )
+
+
+class TestCSSBeautifierWrappers(unittest.TestCase):
+    def test_beautify_sink(self):
+        sink = io.StringIO()
+        self.assertEqual(cssbeautifier.beautify("a{color:red}", sink=sink), "")
+        self.assertEqual(sink.getvalue(), cssbeautifier.beautify("a{color:red}"))
+
+    def test_beautify_file_cache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            file_name = os.path.join(directory, "a.css")
+            with io.open(file_name, "w", encoding="UTF-8") as f:
+                f.write("a{color:red}")
+
+            cache = ResultCache(os.path.join(directory, "cache"))
+            expected = cssbeautifier.beautify("a{color:red}")
+            self.assertEqual(
+                cssbeautifier.beautify_file(file_name, cache=cache), expected
+            )
+            self.assertEqual(
+                cssbeautifier.beautify_file(file_name, cache=cache), expected
+            )
+            self.assertEqual(cache.info().hits, 1)
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
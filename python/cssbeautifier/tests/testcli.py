@@ -0,0 +1,41 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+
+class TestCSSBeautifierCli(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_editorconfig_for_stdin(self):
+        # stdin is looked up as stdin.css, so [*.css] sections apply and
+        # [*.js] sections don't
+        with open(os.path.join(self.directory, ".editorconfig"), "w") as f:
+            f.write("root = true\n[*.js]\nindent_size = 7\n[*.css]\nindent_size = 3\n")
+
+        environ = dict(os.environ)
+        environ["PYTHONPATH"] = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import cssbeautifier; cssbeautifier.main()"]
+            + ["--editorconfig"],
+            cwd=self.directory,
+            env=environ,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        output = process.communicate(b"a{color:red}")[0]
+
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(output.decode("UTF-8"), "a {\n   color: red\n}")
+
+
+if __name__ == "__main__":
+    unittest.main()
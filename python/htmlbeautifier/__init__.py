@@ -0,0 +1,83 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# Use it as a module:
+#
+#   import htmlbeautifier
+#   res = htmlbeautifier.beautify('<div><p>your html</p></div>')
+#   res = htmlbeautifier.beautify_file('some_file.html')
+#
+# <script> and <style> contents are formatted in-process by jsbeautifier
+# and cssbeautifier, with the same options. Settings for only one of the
+# languages can be given in a nested "js", "css" or "html" dict:
+#
+#   opts = htmlbeautifier.default_options()
+#   opts.indent_size = 2
+#   opts.js = {"indent_size": 4}
+#   res = htmlbeautifier.beautify('some html', opts)
+#
+#  or, to format many inputs with the same options, compile them once:
+#
+#   formatter = htmlbeautifier.formatter(opts)
+#   res = formatter.beautify('some html')
+
+import copy
+from htmlbeautifier.__version__ import __version__
+from htmlbeautifier.html.options import BeautifierOptions
+from htmlbeautifier.html.beautifier import Beautifier
+from jsbeautifier.cli import process_file
+from jsbeautifier.core.formatter import Formatter
+from jsbeautifier.core import batch
+
+__all__ = [
+    "default_options",
+    "beautify",
+    "beautify_file",
+    "formatter",
+    "beautify_many",
+]
+
+
+def default_options():
+    return BeautifierOptions()
+
+
+def beautify(string, opts=None, stats=None):
+    b = Beautifier(string, opts)
+    return b.beautify(stats=stats)
+
+
+def beautify_file(file_name, opts=None):
+    return process_file(file_name, opts, beautify)
+
+
+def formatter(opts=None):
+    # Keep a copy of the options as given, see jsbeautifier.formatter
+    options = copy.deepcopy(opts)
+    BeautifierOptions(options)
+    return Formatter(lambda: Beautifier(None, options))
+
+
+def beautify_many(sources, opts=None, workers=None, chunk_size=None, lazy=False):
+    return batch.beautify_many(formatter, sources, opts, workers, chunk_size, lazy)
@@ -0,0 +1,412 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import re
+from jsbeautifier.core.inputscanner import InputScanner
+from jsbeautifier.core.tokenizer import TokenType
+from jsbeautifier.core.tokenizer import TokenTypes as BaseTokenTypes
+from jsbeautifier.core.tokenizer import Tokenizer as BaseTokenizer
+from jsbeautifier.core.tokenizer import TokenizerPatterns as BaseTokenizerPatterns
+from jsbeautifier.core.directives import Directives
+from jsbeautifier.core.pattern import Pattern
+from jsbeautifier.core.templatablepattern import TemplatablePattern
+
+__all__ = ["TOKEN", "Tokenizer", "TokenTypes"]
+
+
+class TokenTypes(BaseTokenTypes):
+    TAG_OPEN = TokenType(18, "TK_TAG_OPEN")
+    TAG_CLOSE = TokenType(19, "TK_TAG_CLOSE")
+    CONTROL_FLOW_OPEN = TokenType(20, "TK_CONTROL_FLOW_OPEN")
+    CONTROL_FLOW_CLOSE = TokenType(21, "TK_CONTROL_FLOW_CLOSE")
+    ATTRIBUTE = TokenType(22, "TK_ATTRIBUTE")
+    EQUALS = TokenType(23, "TK_EQUALS")
+    VALUE = TokenType(24, "TK_VALUE")
+    COMMENT = TokenType(25, "TK_COMMENT")
+    TEXT = TokenType(26, "TK_TEXT")
+    UNKNOWN = TokenType(27, "TK_UNKNOWN")
+    # not produced by the tokenizer, the beautifier marks text it has handled
+    CONTENT = TokenType(28, "TK_CONTENT")
+
+    def __init__(self):
+        pass
+
+
+TOKEN = TokenTypes()
+
+directives_core = Directives(r"<\!--", r"-->")
+
+
+class TokenizerPatterns(BaseTokenizerPatterns):
+    def __init__(self, options):
+        BaseTokenizerPatterns.__init__(self)
+
+        # Words end at whitespace or when a tag starts
+        # if we are indenting handlebars, they are considered tags
+        templatable = TemplatablePattern().read_options(options)
+        pattern = Pattern()
+
+        self.word = templatable.until(r"[\n\r\t <]")
+        self.word_control_flow_close_excluded = templatable.until(r"[\n\r\t <}]")
+        self.single_quote = templatable.until_after(r"'")
+        self.double_quote = templatable.until_after(r'"')
+        self.attribute = templatable.until(r"[\n\r\t =>]|/>")
+        self.element_name = templatable.until(r"[\n\r\t >/]")
+
+        self.angular_control_flow_start = pattern.matching(r"\@[a-zA-Z]+[^({]*[({]")
+        self.handlebars_comment = pattern.starting_with(r"{{!--").until_after(r"--}}")
+        self.handlebars = pattern.starting_with(r"{{").until_after(r"}}")
+        self.handlebars_open = pattern.until(r"[\n\r\t }]")
+        self.handlebars_raw_close = pattern.until(r"}}")
+        self.comment = pattern.starting_with(r"<!--").until_after(r"-->")
+        self.cdata = pattern.starting_with(r"<!\[CDATA\[").until_after(r"]]>")
+        # https://en.wikipedia.org/wiki/Conditional_comment
+        self.conditional_comment = pattern.starting_with(r"<!\[").until_after(r"]>")
+        self.processing = pattern.starting_with(r"<\?").until_after(r"\?>")
+
+        if options.indent_handlebars:
+            self.word = self.word.exclude("handlebars")
+            self.word_control_flow_close_excluded = (
+                self.word_control_flow_close_excluded.exclude("handlebars")
+            )
+
+        self.unformatted_content_delimiter = None
+        if options.unformatted_content_delimiter:
+            literal_regexp = InputScanner.get_literal_regexp(
+                options.unformatted_content_delimiter
+            )
+            self.unformatted_content_delimiter = pattern.matching(
+                literal_regexp
+            ).until_after(literal_regexp)
+
+
+# As for the javascript tokenizer, the patterns only depend on a few options
+# and are built once per combination, then shared by every Tokenizer.
+_patterns_cache = {}
+
+
+def _get_patterns(options):
+    key = (
+        frozenset(options.templating),
+        options.indent_handlebars,
+        options.unformatted_content_delimiter,
+    )
+    patterns = _patterns_cache.get(key)
+    if patterns is None:
+        patterns = TokenizerPatterns(options)
+        _patterns_cache[key] = patterns
+    return patterns
+
+
+class Tokenizer(BaseTokenizer):
+    def __init__(self, input_string, options):
+        BaseTokenizer.__init__(self, input_string, options)
+        self._current_tag_name = ""
+
+        self._patterns = _get_patterns(options)
+
+    def _is_comment(self, current_token):
+        return False
+
+    def _is_opening(self, current_token):
+        return (
+            current_token.type == TOKEN.TAG_OPEN
+            or current_token.type == TOKEN.CONTROL_FLOW_OPEN
+        )
+
+    def _is_closing(self, current_token, open_token):
+        return (
+            current_token.type == TOKEN.TAG_CLOSE
+            and open_token is not None
+            and (
+                (
+                    (current_token.text == ">" or current_token.text == "/>")
+                    and open_token.text[0] == "<"
+                )
+                or (current_token.text == "}}" and open_token.text[:2] == "{{")
+            )
+        ) or (
+            current_token.type == TOKEN.CONTROL_FLOW_CLOSE
+            and current_token.text == "}"
+            and open_token.text.endswith("{")
+        )
+
+    def _reset(self):
+        self._current_tag_name = ""
+
+    def _get_next_token(self, previous_token, open_token):
+        token = None
+        self._readWhitespace()
+        c = self._input.peek()
+
+        if c is None:
+            return self._create_token(TOKEN.EOF, "")
+
+        token = token or self._read_open_handlebars(c, open_token)
+        token = token or self._read_attribute(c, previous_token, open_token)
+        token = token or self._read_close(c, open_token)
+        token = token or self._read_script_and_style(c, previous_token)
+        token = token or self._read_control_flows(c, open_token)
+        token = token or self._read_raw_content(c, previous_token, open_token)
+        token = token or self._read_content_word(c, open_token)
+        token = token or self._read_comment_or_cdata(c)
+        token = token or self._read_processing(c)
+        token = token or self._read_open(c, open_token)
+        token = token or self._create_token(TOKEN.UNKNOWN, self._input.next())
+
+        return token
+
+    def _read_comment_or_cdata(self, c):
+        token = None
+        resulting_string = None
+        directives = None
+
+        if c == "<":
+            peek1 = self._input.peek(1)
+            # We treat all comments as literals, even more than preformatted tags
+            # we only look for the appropriate closing marker
+            if peek1 == "!":
+                resulting_string = self._patterns.comment.read(self._input)
+
+                # only process directive on html comments
+                if resulting_string:
+                    directives = directives_core.get_directives(resulting_string)
+                    if directives and directives.get("ignore") == "start":
+                        resulting_string += directives_core.readIgnored(self._input)
+                else:
+                    resulting_string = self._patterns.cdata.read(self._input)
+
+            if resulting_string:
+                token = self._create_token(TOKEN.COMMENT, resulting_string)
+                token.directives = directives
+
+        return token
+
+    def _read_processing(self, c):
+        token = None
+        resulting_string = None
+
+        if c == "<":
+            peek1 = self._input.peek(1)
+            if peek1 == "!" or peek1 == "?":
+                resulting_string = self._patterns.conditional_comment.read(self._input)
+                resulting_string = resulting_string or self._patterns.processing.read(
+                    self._input
+                )
+
+            if resulting_string:
+                token = self._create_token(TOKEN.COMMENT, resulting_string)
+
+        return token
+
+    def _read_open(self, c, open_token):
+        resulting_string = None
+        token = None
+        if open_token is None or open_token.type == TOKEN.CONTROL_FLOW_OPEN:
+            if c == "<":
+                resulting_string = self._input.next()
+                if self._input.peek() == "/":
+                    resulting_string += self._input.next()
+                resulting_string += self._patterns.element_name.read(self._input)
+                token = self._create_token(TOKEN.TAG_OPEN, resulting_string)
+        return token
+
+    def _read_open_handlebars(self, c, open_token):
+        resulting_string = None
+        token = None
+        if open_token is None or open_token.type == TOKEN.CONTROL_FLOW_OPEN:
+            if (
+                (
+                    "angular" in self._options.templating
+                    or self._options.indent_handlebars
+                )
+                and c == "{"
+                and self._input.peek(1) == "{"
+            ):
+                if self._options.indent_handlebars and self._input.peek(2) == "!":
+                    resulting_string = self._patterns.handlebars_comment.read(
+                        self._input
+                    )
+                    resulting_string = (
+                        resulting_string or self._patterns.handlebars.read(self._input)
+                    )
+                    token = self._create_token(TOKEN.COMMENT, resulting_string)
+                else:
+                    resulting_string = self._patterns.handlebars_open.read(self._input)
+                    token = self._create_token(TOKEN.TAG_OPEN, resulting_string)
+        return token
+
+    def _read_control_flows(self, c, open_token):
+        resulting_string = ""
+        token = None
+        # Only check for control flows if angular templating is set
+        if "angular" not in self._options.templating:
+            return token
+
+        if c == "@":
+            resulting_string = self._patterns.angular_control_flow_start.read(
+                self._input
+            )
+            if resulting_string == "":
+                return token
+
+            opening_parentheses_count = 1 if resulting_string.endswith("(") else 0
+            closing_parentheses_count = 0
+            # The opening brace of the control flow is where the number of opening and closing parentheses equal
+            # e.g. @if({value: true} !== null) {
+            while not (
+                resulting_string.endswith("{")
+                and opening_parentheses_count == closing_parentheses_count
+            ):
+                next_char = self._input.next()
+                if next_char is None:
+                    break
+                elif next_char == "(":
+                    opening_parentheses_count += 1
+                elif next_char == ")":
+                    closing_parentheses_count += 1
+                resulting_string += next_char
+            token = self._create_token(TOKEN.CONTROL_FLOW_OPEN, resulting_string)
+        elif (
+            c == "}"
+            and open_token is not None
+            and open_token.type == TOKEN.CONTROL_FLOW_OPEN
+        ):
+            resulting_string = self._input.next()
+            token = self._create_token(TOKEN.CONTROL_FLOW_CLOSE, resulting_string)
+        return token
+
+    def _read_close(self, c, open_token):
+        resulting_string = None
+        token = None
+        if open_token is not None and open_token.type == TOKEN.TAG_OPEN:
+            if open_token.text[0] == "<" and (
+                c == ">" or (c == "/" and self._input.peek(1) == ">")
+            ):
+                resulting_string = self._input.next()
+                if c == "/":  # for close tag "/>"
+                    resulting_string += self._input.next()
+                token = self._create_token(TOKEN.TAG_CLOSE, resulting_string)
+            elif open_token.text[0] == "{" and c == "}" and self._input.peek(1) == "}":
+                self._input.next()
+                self._input.next()
+                token = self._create_token(TOKEN.TAG_CLOSE, "}}")
+
+        return token
+
+    def _read_attribute(self, c, previous_token, open_token):
+        token = None
+        resulting_string = ""
+        if open_token is not None and open_token.text[0] == "<":
+            if c == "=":
+                token = self._create_token(TOKEN.EQUALS, self._input.next())
+            elif c == '"' or c == "'":
+                content = self._input.next()
+                if c == '"':
+                    content += self._patterns.double_quote.read(self._input)
+                else:
+                    content += self._patterns.single_quote.read(self._input)
+                token = self._create_token(TOKEN.VALUE, content)
+            else:
+                resulting_string = self._patterns.attribute.read(self._input)
+
+                if resulting_string:
+                    if previous_token.type == TOKEN.EQUALS:
+                        token = self._create_token(TOKEN.VALUE, resulting_string)
+                    else:
+                        token = self._create_token(TOKEN.ATTRIBUTE, resulting_string)
+        return token
+
+    def _is_content_unformatted(self, tag_name):
+        # void_elements have no content and so cannot have unformatted content
+        # script and style tags should always be read as unformatted content
+        # finally content_unformatted and unformatted element contents are unformatted
+        return tag_name not in self._options.void_elements and (
+            tag_name in self._options.content_unformatted
+            or tag_name in self._options.unformatted
+        )
+
+    def _read_until_close_tag(self, tag_name):
+        return self._input.readUntil(
+            InputScanner.get_regexp(
+                r"</" + tag_name + r"[\n\r\t ]*?>", flags=re.IGNORECASE
+            )
+        )
+
+    def _read_raw_content(self, c, previous_token, open_token):
+        resulting_string = ""
+        if open_token is not None and open_token.text[0] == "{":
+            resulting_string = self._patterns.handlebars_raw_close.read(self._input)
+        elif (
+            previous_token.type == TOKEN.TAG_CLOSE
+            and previous_token.opened.text[0] == "<"
+            and previous_token.text[0] != "/"
+        ):
+            # ^^ empty tag has no content
+            tag_name = previous_token.opened.text[1:].lower()
+            if self._is_content_unformatted(tag_name):
+                resulting_string = self._read_until_close_tag(tag_name)
+
+        if resulting_string:
+            return self._create_token(TOKEN.TEXT, resulting_string)
+
+        return None
+
+    def _read_script_and_style(self, c, previous_token):
+        if (
+            previous_token.type == TOKEN.TAG_CLOSE
+            and previous_token.opened.text[0] == "<"
+            and previous_token.text[0] != "/"
+        ):
+            tag_name = previous_token.opened.text[1:].lower()
+            if tag_name == "script" or tag_name == "style":
+                # Script and style tags are allowed to have comments wrapping their content
+                # or just have regular content.
+                token = self._read_comment_or_cdata(c)
+                if token:
+                    token.type = TOKEN.TEXT
+                    return token
+                resulting_string = self._read_until_close_tag(tag_name)
+                if resulting_string:
+                    return self._create_token(TOKEN.TEXT, resulting_string)
+        return None
+
+    def _read_content_word(self, c, open_token):
+        resulting_string = ""
+        if self._options.unformatted_content_delimiter:
+            if c == self._options.unformatted_content_delimiter[0]:
+                resulting_string = self._patterns.unformatted_content_delimiter.read(
+                    self._input
+                )
+
+        if not resulting_string:
+            if open_token is not None and open_token.type == TOKEN.CONTROL_FLOW_OPEN:
+                resulting_string = self._patterns.word_control_flow_close_excluded.read(
+                    self._input
+                )
+            else:
+                resulting_string = self._patterns.word.read(self._input)
+        if resulting_string:
+            return self._create_token(TOKEN.TEXT, resulting_string)
+        return None
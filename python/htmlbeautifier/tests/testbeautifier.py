@@ -0,0 +1,111 @@
+import unittest
+import htmlbeautifier
+from htmlbeautifier.html.beautifier import Beautifier
+from htmlbeautifier.html.tokenizer import TOKEN
+from jsbeautifier.javascript.tokenizer import TOKEN as JS_TOKEN
+from jsbeautifier.core.stats import BeautifierStats
+
+
+class TestHTMLBeautifier(unittest.TestCase):
+    source = "<div><script>if(a){b()}</script>\n" "<style>a{color:red}</style></div>"
+
+    def test_embedded_options(self):
+        # the js and css sections only reach their own beautifier
+        options = htmlbeautifier.default_options()
+        options.indent_size = 2
+        options.js = {"indent_size": 3}
+        options.css = {"indent_size": 1}
+
+        self.assertEqual(
+            htmlbeautifier.beautify(self.source, options),
+            "<div>\n"
+            "  <script>\n"
+            "    if (a) {\n"
+            "       b()\n"
+            "    }\n"
+            "  </script>\n"
+            "  <style>\n"
+            "    a {\n"
+            "     color: red\n"
+            "    }\n"
+            "  </style>\n"
+            "</div>",
+        )
+
+    def test_formatter_matches_beautify(self):
+        formatter = htmlbeautifier.formatter({"indent_size": 2})
+
+        for source in [self.source, "<p>a<br>b</p>", "<ul><li>x<li>y</ul>"]:
+            self.assertEqual(
+                formatter.beautify(source),
+                htmlbeautifier.beautify(source, {"indent_size": 2}),
+            )
+
+    def test_embedded_beautifiers_are_reused(self):
+        beautifier = Beautifier(None, {"indent_size": 2})
+        source = self.source + "<script>c()</script><script>d()</script>"
+        expected = htmlbeautifier.beautify(source, {"indent_size": 2})
+
+        self.assertEqual(beautifier.beautify(source), expected)
+        embedded = dict(beautifier._embedded_beautifiers)
+        self.assertEqual(sorted(embedded), ["css", "javascript"])
+
+        self.assertEqual(beautifier.beautify(source), expected)
+        self.assertEqual(beautifier._embedded_beautifiers, embedded)
+
+    def test_custom_beautifiers(self):
+        calls = []
+
+        def js_beautify(source_text, options):
+            calls.append(options["eol"])
+            return "js"
+
+        beautifier = Beautifier(self.source, {"eol": "\r\n"}, js_beautify)
+        self.assertEqual(
+            beautifier.beautify(),
+            "<div>\r\n"
+            "    <script>\r\n"
+            "js\r\n"
+            "    </script>\r\n"
+            "    <style>\r\n"
+            "        a {\r\n"
+            "            color: red\r\n"
+            "        }\r\n"
+            "    </style>\r\n"
+            "</div>",
+        )
+        self.assertEqual(calls, ["\n"])
+
+    def test_stats(self):
+        stats = BeautifierStats()
+        source = self.source + '<script type="text/html"><p><script>c()</script>'
+        result = htmlbeautifier.beautify(source, stats=stats)
+
+        self.assertEqual(result, htmlbeautifier.beautify(source))
+        self.assertEqual(stats.calls, 1)
+        self.assertEqual(stats.delegated, {"javascript": 1, "css": 1, "html": 1})
+        self.assertEqual(
+            sorted(stats.phases),
+            ["css", "handle", "html", "javascript", "output", "setup", "tokenize"],
+        )
+        self.assertEqual(stats.token_counts["TK_TAG_OPEN"], 8)
+
+    def test_token_types(self):
+        def codes(token):
+            return set(
+                int(getattr(token, name)) for name in dir(token) if name.isupper()
+            )
+
+        # each language has its own numbers beyond the shared ones
+        shared = codes(TOKEN) & codes(JS_TOKEN)
+        self.assertEqual(
+            shared, set(int(t) for t in [TOKEN.START, TOKEN.RAW, TOKEN.EOF])
+        )
+        self.assertNotEqual(TOKEN.TEXT, JS_TOKEN.EQUALS)
+        # types compare as their names
+        self.assertEqual(TOKEN.EQUALS, JS_TOKEN.EQUALS)
+        self.assertEqual(TOKEN.TEXT, "TK_TEXT")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,25 @@
 #!/usr/bin/env python
 
+import os
 import sys
 import unittest
 
 
 def run_tests():
-    suite = unittest.TestLoader().discover("jsbeautifier", pattern="test*.py")
-    suite.addTests(unittest.TestLoader().discover("cssbeautifier", pattern="test*.py"))
+    # Discover from the directory of this script, wherever it is run from, so
+    # the generated "tests" modules of the different packages are imported
+    # under their full names and don't clash
+    top_level_dir = os.path.dirname(os.path.abspath(__file__))
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    for package in ["jsbeautifier", "cssbeautifier", "htmlbeautifier", "benchmarks"]:
+        suite.addTests(
+            loader.discover(
+                os.path.join(top_level_dir, package),
+                pattern="test*.py",
+                top_level_dir=top_level_dir,
+            )
+        )
     return unittest.TextTestRunner(verbosity=2).run(suite)
 
 
@@ -1,18 +1,19 @@
 from __future__ import print_function
 import sys
 import os
-import platform
 import io
 import getopt
 import re
 import string
 import errno
 import copy
+import functools
 import glob
 from jsbeautifier.__version__ import __version__
 from jsbeautifier.cli import *
 from jsbeautifier.javascript.options import BeautifierOptions
-from jsbeautifier.javascript.beautifier import Beautifier
+from jsbeautifier.core.formatter import Formatter
+from jsbeautifier.core.stats import BeautifierStats
 
 #
 # The MIT License (MIT)
@@ -61,6 +62,15 @@ from jsbeautifier.javascript.beautifier import Beautifier
 #   opts.indent_size = 2
 #   res = jsbeautifier.beautify('some javascript', opts)
 #
+#  or, to format many inputs with the same options, compile them once:
+#
+#   formatter = jsbeautifier.formatter(opts)
+#   res = formatter.beautify('some javascript')
+#
+#  or, to spread a large number of inputs over all CPUs:
+#
+#   results = jsbeautifier.beautify_many(sources, opts)
+#
 #
 # Here are the available options: (read source)
 
@@ -68,22 +78,61 @@ __all__ = [
     "default_options",
     "beautify",
     "beautify_file",
+    "formatter",
+    "beautify_many",
+    "BeautifierStats",
     "usage",
     "main",
 ]
 
 
+def __getattr__(name):
+    # The beautifier, with the tokenizer tables, is only imported when it is
+    # used, so that js-beautify --connect starts quickly
+    if name == "Beautifier":
+        from jsbeautifier.javascript.beautifier import Beautifier
+
+        return Beautifier
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
 def default_options():
     return BeautifierOptions()
 
 
-def beautify(string, opts=default_options()):
-    b = Beautifier()
-    return b.beautify(string, opts)
+def beautify(string, opts=default_options(), sink=None, stats=None):
+    from jsbeautifier.javascript.beautifier import Beautifier
+
+    b = Beautifier(opts)
+    return b.beautify(string, sink=sink, stats=stats)
+
+
+def beautify_file(file_name, opts=default_options(), sink=None, cache=None):
+    def beautify_code(string, opts):
+        if cache is not None:
+            return cache.beautify(beautify, string, opts, sink)
+        return beautify(string, opts, sink)
+
+    return process_file(file_name, opts, beautify_code)
+
+
+def formatter(opts=default_options()):
+    from jsbeautifier.javascript.beautifier import Beautifier
 
+    # Keep a copy of the options as given: parsed options lose settings such
+    # as preserve-inline when parsed again. Parse once here anyway so invalid
+    # options fail now, not on first use.
+    options = copy.deepcopy(opts)
+    BeautifierOptions(options)
+    return Formatter(lambda: Beautifier(options))
 
-def beautify_file(file_name, opts=default_options()):
-    return process_file(file_name, opts, beautify)
+
+def beautify_many(
+    sources, opts=default_options(), workers=None, chunk_size=None, lazy=False
+):
+    from jsbeautifier.core import batch
+
+    return batch.beautify_many(formatter, sources, opts, workers, chunk_size, lazy)
 
 
 def usage(stream=sys.stdout):
@@ -120,6 +169,11 @@ Output options:
  --quiet                           Suppress info about a file if nothing was changed.
  -r,  --replace                    Write output in-place, replacing input
  -o,  --outfile=FILE               Specify a file to output to (default stdout)
+ --jobs=NUMBER                     Number of files to beautify in parallel when
+                                   replacing several files. (default CPU count)
+ --cache-dir=DIR                   Reuse results stored in DIR for unchanged inputs
+ --skip-unchanged=FILE             With --replace, skip files already beautified
+                                   since the last run, as recorded in FILE
  -f,  --keep-function-indentation  Do not re-indent function bodies defined in var lines.
  -x,  --unescape-strings           Decode printable chars encoded in \\xNN notation.
  -X,  --e4x                        Pass E4X xml literals through untouched
@@ -132,8 +186,24 @@ Output options:
  -n,  --end-with-newline           End output with newline
  --indent-empty-lines              Keep indentation on empty lines
  --templating                      List of templating languages (auto,none,django,erb,handlebars,php,smarty,angular) ["auto"] auto = none in JavaScript, all in html
+ --tokenizer=STRING                Tokenizer engine (default, master-regex)
+ --disable-unpacking               Do not look for packed or obfuscated scripts
  --editorconfig                    Enable setting configuration from EditorConfig
 
+Daemon options:
+
+ --serve                           Run as a daemon beautifying requests sent to
+                                   --socket, with --jobs worker processes
+ --connect                         Send the files to the daemon on --socket
+                                   instead of beautifying them here
+ --socket=PATH                     Unix socket of the daemon
+                                   (default $XDG_RUNTIME_DIR/js-beautify-UID.sock,
+                                   or js-beautify-UID/daemon.sock in the
+                                   temporary directory)
+ --idle-timeout=SECONDS            Stop the daemon after this long without a
+                                   request, 0 for never. (default 600)
+ --server-stats                    Print the statistics of the daemon and exit
+
 Rarely needed options:
 
  --eval-code                       evaluate code if a JS interpreter is
@@ -165,6 +235,7 @@ def main():
                 "brace-style=",
                 "comma-first",
                 "disable-preserve-newlines",
+                "disable-unpacking",
                 "e4x",
                 "editorconfig",
                 "end-with-newline",
@@ -177,6 +248,14 @@ def main():
                 "indent-level=",
                 "indent-size=",
                 "indent-with-tabs",
+                "jobs=",
+                "cache-dir=",
+                "skip-unchanged=",
+                "serve",
+                "connect",
+                "socket=",
+                "idle-timeout=",
+                "server-stats",
                 "jslint-happy",
                 "keep-array-indentation",
                 "keep-function-indentation",
@@ -191,6 +270,7 @@ def main():
                 "space-in-paren",
                 "stdin",
                 "templating",
+                "tokenizer=",
                 "unescape-strings",
                 "usage",
                 "version",
@@ -208,6 +288,14 @@ def main():
 
     outfile_param = "stdout"
     replace = False
+    jobs = get_default_jobs()
+    cache = None
+    index = None
+    serve = False
+    connect = False
+    server_stats = False
+    socket_path = None
+    idle_timeout = None
 
     for opt, arg in opts:
         if opt in ("--file", "-f"):
@@ -220,6 +308,26 @@ def main():
             outfile_param = arg
         elif opt in ("--replace", "-r"):
             replace = True
+        elif opt in ("--jobs",):
+            jobs = int(arg)
+        elif opt in ("--cache-dir",):
+            from jsbeautifier.core.cache import ResultCache
+
+            cache = ResultCache(arg)
+        elif opt in ("--skip-unchanged",):
+            from jsbeautifier.core.fileindex import FileIndex
+
+            index = FileIndex(arg)
+        elif opt in ("--serve",):
+            serve = True
+        elif opt in ("--connect",):
+            connect = True
+        elif opt in ("--socket",):
+            socket_path = arg
+        elif opt in ("--idle-timeout",):
+            idle_timeout = float(arg)
+        elif opt in ("--server-stats",):
+            server_stats = True
         elif opt in ("--indent-size", "-s"):
             js_options.indent_size = int(arg)
         elif opt in ("--indent-char", "-c"):
@@ -230,6 +338,8 @@ def main():
             js_options.indent_with_tabs = True
         elif opt in ("--disable-preserve-newlines", "-d"):
             js_options.preserve_newlines = False
+        elif opt in ("--disable-unpacking",):
+            js_options.unpack = False
         elif opt in ("--max-preserve-newlines", "-m"):
             js_options.max_preserve_newlines = int(arg)
         elif opt in ("--space-in-paren", "-P"):
@@ -264,6 +374,8 @@ def main():
             js_options.indent_empty_lines = True
         elif opt in ("--templating",):
             js_options.templating = arg.split(",")
+        elif opt in ("--tokenizer",):
+            js_options.tokenizer = arg
         elif opt in ("--stdin", "-i"):
             # stdin is the default if no files are passed
             filepath_params = []
@@ -274,36 +386,72 @@ def main():
         elif opt in ("--help", "--usage", "-h"):
             return usage()
 
+    client = None
     try:
-        filepaths, replace = get_filepaths_from_params(filepath_params, replace)
-        for filepath in filepaths:
-            if not replace:
-                outfile = outfile_param
-            else:
-                outfile = filepath
-
-            js_options = integrate_editorconfig_options(
-                filepath, js_options, outfile, "js"
-            )
-
-            pretty = beautify_file(filepath, js_options)
+        if serve:
+            from jsbeautifier.cli import daemon
+
+            if idle_timeout is None:
+                idle_timeout = daemon.DEFAULT_IDLE_TIMEOUT
+            daemon.serve(socket_path, jobs, idle_timeout)
+            return 0
+
+        beautify_code = beautify
+        if server_stats or connect:
+            from jsbeautifier.cli.client import Client, DaemonError
+
+            client = Client(socket_path)
+            if server_stats:
+                stats = client.stats()
+                for name in sorted(stats):
+                    print("%s: %s" % (name, stats[name]))
+                return 0
+
+            if cache is not None or index is not None:
+                # Results are cached and indexed as those of beautify(), so
+                # they have to come from the same version of it
+                version = client.stats().get("version")
+                if version != __version__:
+                    raise DaemonError(
+                        "the daemon runs js-beautify %s, not %s: restart it to "
+                        "use --cache-dir or --skip-unchanged" % (version, __version__)
+                    )
+
+            @functools.wraps(beautify)
+            def beautify_code(string, opts, sink=None):
+                return client.beautify(string, opts, sink)
+
+            # the daemon runs the workers, the files are just sent in turn
+            jobs = 1
 
-            write_beautified_output(pretty, js_options, outfile)
+        filepaths, replace = get_filepaths_from_params(filepath_params, replace)
+        failures = beautify_files(
+            filepaths,
+            replace,
+            outfile_param,
+            js_options,
+            "js",
+            beautify_code,
+            jobs,
+            cache,
+            index,
+        )
+        if failures:
+            return 1
 
     except MissingInputStreamError:
         print("Must pipe input or define at least one file.\n", file=sys.stderr)
         usage(sys.stderr)
         return 1
 
-    except UnicodeError as ex:
-        print("Error while decoding input or encoding output:", file=sys.stderr)
-        print(ex, file=sys.stderr)
-        return 1
-
     except Exception as ex:
         print(ex, file=sys.stderr)
         return 1
 
+    finally:
+        if client is not None:
+            client.close()
+
     # Success
     return 0
 
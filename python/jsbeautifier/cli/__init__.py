@@ -1,7 +1,6 @@
 from __future__ import print_function
 import sys
 import os
-import platform
 import io
 import getopt
 import re
@@ -9,9 +8,8 @@ import string
 import errno
 import copy
 import glob
+import collections
 from jsbeautifier.__version__ import __version__
-from jsbeautifier.javascript.options import BeautifierOptions
-from jsbeautifier.javascript.beautifier import Beautifier
 
 #
 # The MIT License (MIT)
@@ -41,9 +39,13 @@ from jsbeautifier.javascript.beautifier import Beautifier
 __all__ = [
     "MissingInputStreamError",
     "process_file",
+    "read_input",
     "get_filepaths_from_params",
     "integrate_editorconfig_options",
     "write_beautified_output",
+    "get_stdout_stream",
+    "beautify_files",
+    "get_default_jobs",
 ]
 
 
@@ -89,18 +91,23 @@ def set_file_editorconfig_opts(filename, js_options):
         print("Error loading EditorConfig.  Ignoring.", file=sys.stderr)
 
 
-def process_file(file_name, opts, beautify_code):
-    input_string = ""
+def _is_32bit():
+    import platform
+
+    return platform.architecture()[0] == "32bit"
+
+
+def read_input(file_name):
     if file_name == "-":  # stdin
         if sys.stdin.isatty():
             raise MissingInputStreamError()
 
         stream = sys.stdin
-        if platform.platform().lower().startswith("windows"):
+        if sys.platform == "win32":
             if sys.version_info.major >= 3:
                 # for python 3 on windows this prevents conversion
                 stream = io.TextIOWrapper(sys.stdin.buffer, newline="")
-            elif platform.architecture()[0] == "32bit":
+            elif _is_32bit():
                 # for python 2 x86 on windows this prevents conversion
                 import msvcrt
 
@@ -116,10 +123,47 @@ def process_file(file_name, opts, beautify_code):
         if input_string == "":
             raise MissingInputStreamError()
     else:
-        stream = io.open(file_name, "rt", newline="", encoding="UTF-8")
-        input_string = stream.read()
+        input_string = _read_mapped(file_name)
+        if input_string is None:
+            with io.open(file_name, "rt", newline="", encoding="UTF-8") as stream:
+                input_string = stream.read()
+
+    return input_string
+
+
+# Files at least this large are decoded straight from a memory map of the
+# file, so the raw bytes are never copied into the process first.
+MMAP_THRESHOLD = 1024 * 1024
+
 
-    return beautify_code(input_string, opts)
+def _read_mapped(file_name):
+    # python 2 cannot decode from a memory map
+    if sys.version_info.major < 3:
+        return None
+
+    import mmap
+
+    with io.open(file_name, "rb") as stream:
+        if os.fstat(stream.fileno()).st_size < MMAP_THRESHOLD:
+            return None
+        try:
+            mapping = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # not every file can be mapped, read those as usual
+            return None
+
+    try:
+        if hasattr(mapping, "madvise"):
+            mapping.madvise(mmap.MADV_SEQUENTIAL)
+        # The UTF-8 decoder copies runs of ASCII directly, so for most
+        # sources this is a single pass from the mapped pages into the str
+        return str(mapping, "UTF-8")
+    finally:
+        mapping.close()
+
+
+def process_file(file_name, opts, beautify_code):
+    return beautify_code(read_input(file_name), opts)
 
 
 def mkdir_p(path):
@@ -200,29 +244,39 @@ def integrate_editorconfig_options(filepath, local_options, outfile, default_fil
     return local_options
 
 
-def write_beautified_output(pretty, local_options, outfile):
-    if outfile == "stdout":
-        stream = sys.stdout
+def get_stdout_stream():
+    stream = sys.stdout
 
-        # python automatically converts newlines in text to "\r\n" when on windows
-        # switch to binary to prevent this
-        if platform.platform().lower().startswith("windows"):
-            if sys.version_info.major >= 3:
-                # for python 3 on windows this prevents conversion
-                stream = io.TextIOWrapper(sys.stdout.buffer, newline="")
-            elif platform.architecture()[0] == "32bit":
-                # for python 2 x86 on windows this prevents conversion
-                import msvcrt
+    # python automatically converts newlines in text to "\r\n" when on windows
+    # switch to binary to prevent this
+    if sys.platform == "win32":
+        if sys.version_info.major >= 3:
+            # for python 3 on windows this prevents conversion
+            stream = io.TextIOWrapper(sys.stdout.buffer, newline="")
+        elif _is_32bit():
+            # for python 2 x86 on windows this prevents conversion
+            import msvcrt
+
+            msvcrt.setmode(sys.stdout.fileno(), os.O_BINARY)
+        else:
+            raise Exception(
+                "Pipe to stdout not supported on Windows with Python 2.x 64-bit."
+            )
+
+    return stream
 
-                msvcrt.setmode(sys.stdout.fileno(), os.O_BINARY)
-            else:
-                raise Exception(
-                    "Pipe to stdout not supported on Windows with Python 2.x 64-bit."
-                )
 
+def write_beautified_output(pretty, local_options, outfile, current=None):
+    if outfile == "stdout":
+        stream = get_stdout_stream()
         stream.write(pretty)
     else:
-        if isFileDifferent(outfile, pretty):
+        if current is not None:
+            different = current != pretty
+        else:
+            different = isFileDifferent(outfile, pretty)
+
+        if different:
             mkdir_p(os.path.dirname(outfile))
 
             # python automatically converts newlines in text to "\r\n" when on windows
@@ -241,3 +295,168 @@ def write_beautified_output(pretty, local_options, outfile):
                     f.write(six.u(pretty))
         elif not local_options.keep_quiet:
             print("beautified " + outfile + " - unchanged", file=sys.stdout)
+
+
+def get_default_jobs():
+    return os.cpu_count() or 1
+
+
+class _FileJob:
+    def __init__(self, filepath, outfile, file_options):
+        self.filepath = filepath
+        self.outfile = outfile
+        self.options = file_options
+        self.input_string = None
+        self.cache_key = None
+        self.options_key = None
+        self.result = None
+
+
+def beautify_files(
+    filepaths,
+    replace,
+    outfile_param,
+    local_options,
+    file_type,
+    beautify,
+    jobs=1,
+    cache=None,
+    index=None,
+):
+    """Beautify each file and write the result where main() would.
+
+    Files are handled in sorted order. With more than one job and more than
+    one file, beautify() runs in that many worker processes, but inputs are
+    read and results written, in order, by this process. Results found in
+    cache are not beautified again. Files replaced in place that index
+    records as already beautified are skipped, and index is updated and
+    saved afterwards; files that fail are dropped from it. An error in one
+    file is reported and the remaining files are still processed. Returns
+    the number of files that failed.
+    """
+    from concurrent.futures import Future
+
+    if index is not None:
+        from jsbeautifier.core.cache import options_key
+
+    file_jobs = []
+    for filepath in sorted(filepaths):
+        outfile = filepath if replace else outfile_param
+        file_options = integrate_editorconfig_options(
+            filepath, local_options, outfile, file_type
+        )
+        file_jobs.append(_FileJob(filepath, outfile, file_options))
+
+    executor = None
+    if jobs > 1 and len(file_jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=jobs)
+
+    skipped = [0]
+
+    def start(job):
+        job.result = Future()
+        try:
+            if index is not None and job.outfile == job.filepath:
+                job.options_key = options_key(beautify, job.options)
+                if index.is_unchanged(job.filepath, job.options_key):
+                    skipped[0] += 1
+                    job.result.set_result(None)
+                    return
+
+            job.input_string = read_input(job.filepath)
+            if job.options_key is not None and index.is_beautified(
+                job.filepath, job.options_key, job.input_string
+            ):
+                # only touched since it was beautified
+                skipped[0] += 1
+                job.result.set_result(job.input_string)
+                return
+
+            if cache is not None:
+                job.cache_key = cache.key(beautify, job.input_string, job.options)
+                pretty = cache.get(job.cache_key)
+                if pretty is not None:
+                    job.cache_key = None
+                    job.result.set_result(pretty)
+                    return
+
+            if executor is not None:
+                job.result = executor.submit(beautify, job.input_string, job.options)
+            elif job.outfile == "stdout" and cache is None:
+                # lines are written out as soon as they are final
+                beautify(job.input_string, job.options, get_stdout_stream())
+                job.result.set_result(None)
+            else:
+                job.result.set_result(beautify(job.input_string, job.options))
+        except MissingInputStreamError:
+            raise
+        except Exception as ex:
+            job.result.set_exception(ex)
+
+    def finish(job):
+        try:
+            pretty = job.result.result()
+            if job.cache_key is not None:
+                cache.put(job.cache_key, pretty)
+            if pretty is not None:
+                # when replacing, the input is what the file holds now
+                current = None
+                if job.outfile == job.filepath:
+                    current = job.input_string
+                write_beautified_output(pretty, job.options, job.outfile, current)
+            if job.options_key is not None and job.input_string is not None:
+                index.record(job.filepath, job.options_key, pretty)
+
+        except Exception as ex:
+            if isinstance(ex, UnicodeError):
+                print("Error while decoding input or encoding output:", file=sys.stderr)
+            print(_describe_failure(job.filepath, ex, len(file_jobs)), file=sys.stderr)
+            if job.options_key is not None:
+                # whatever the file holds now was not beautified by this run
+                index.forget(job.filepath)
+            return 1
+
+        return 0
+
+    failures = 0
+    pending = collections.deque()
+    try:
+        for job in file_jobs:
+            start(job)
+            pending.append(job)
+            # Keep the workers busy without reading every input up front
+            if len(pending) > jobs * 4:
+                failures += finish(pending.popleft())
+
+        while pending:
+            failures += finish(pending.popleft())
+    finally:
+        if executor is not None:
+            for job in pending:
+                job.result.cancel()
+            executor.shutdown(wait=True)
+        if index is not None:
+            index.save()
+
+    # stderr, so the counters never end up in beautified output on stdout
+    if not local_options.keep_quiet:
+        if cache is not None:
+            info = cache.info()
+            print(
+                "cache: %d hits, %d misses, %d evictions"
+                % (info.hits, info.misses, info.evictions),
+                file=sys.stderr,
+            )
+        if index is not None:
+            print("skipped %d unchanged files" % skipped[0], file=sys.stderr)
+
+    return failures
+
+
+def _describe_failure(filepath, ex, file_count):
+    # Name the file only when there is more than one to tell apart
+    if file_count > 1:
+        return filepath + ": " + str(ex)
+    return str(ex)
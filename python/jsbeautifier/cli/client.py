@@ -0,0 +1,183 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Client for the daemon started with js-beautify --serve. Only the standard
+# library is used here, so the module can also be copied into an editor
+# integration as it is.
+#
+# The protocol is one JSON object per line, each way, on a unix socket. A
+# connection may send any number of requests and gets one reply to each:
+#
+#   {"path": "a.js", "content": "...", "options": {"indent_size": 2}}
+#       -> {"result": "..."}
+#   {"command": "stats"}  -> {"stats": {...}}
+#   {"command": "stop"}   -> {"stopped": true}
+#
+# path is only used in error messages, options are the library options and
+# a request that fails gets {"error": "message"} instead.
+#
+# Anyone who can put a socket at the path gets to see what is sent to it, so
+# both sides refuse one that belongs to another user.
+
+import json
+import os
+import socket
+import stat
+import struct
+
+__all__ = [
+    "Client",
+    "DaemonError",
+    "check_socket_owner",
+    "default_socket_path",
+    "options_to_dict",
+]
+
+
+class DaemonError(Exception):
+    pass
+
+
+def default_socket_path():
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if directory:
+        return os.path.join(directory, "js-beautify-%d.sock" % os.getuid())
+
+    # The shared temporary directory is writable by everyone, so the socket
+    # goes in a directory only this user can get into
+    import tempfile
+
+    directory = os.path.join(tempfile.gettempdir(), "js-beautify-%d" % os.getuid())
+    try:
+        os.mkdir(directory, 0o700)
+    except OSError:
+        if not os.path.isdir(directory):
+            raise
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise DaemonError(
+            directory + " must be a directory private to the current user"
+        )
+    return os.path.join(directory, "daemon.sock")
+
+
+def check_socket_owner(path, connection=None):
+    # Where the peer's credentials can be asked for, they are, as the file
+    # could be replaced between the check and connecting
+    if connection is not None and hasattr(socket, "SO_PEERCRED"):
+        credentials = connection.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        uid = struct.unpack("3i", credentials)[1]
+    else:
+        uid = os.stat(path).st_uid
+    if uid != os.getuid():
+        raise DaemonError(path + " belongs to another user")
+
+
+def options_to_dict(opts):
+    # raw_options only echoes what the public fields were parsed from
+    if opts is None or isinstance(opts, dict):
+        return opts
+    return dict(
+        (name, value) for name, value in vars(opts).items() if name != "raw_options"
+    )
+
+
+class Client:
+    """Connection to a js-beautify --serve daemon.
+
+    The connection is opened on the first request and kept for the ones
+    after it. beautify() has the signature of jsbeautifier.beautify(), so
+    a Client can stand in for it.
+    """
+
+    def __init__(self, socket_path=None, timeout=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self.__socket = None
+        self.__reader = None
+
+    def beautify(self, string, opts=None, sink=None, path=None):
+        reply = self.request(
+            {"path": path, "content": string, "options": options_to_dict(opts)}
+        )
+        if sink is None:
+            return reply["result"]
+        sink.write(reply["result"])
+        return ""
+
+    def stats(self):
+        return self.request({"command": "stats"})["stats"]
+
+    def stop(self):
+        return self.request({"command": "stop"})["stopped"]
+
+    def request(self, message):
+        if self.__socket is None:
+            self.__connect()
+
+        try:
+            self.__socket.sendall(json.dumps(message).encode("UTF-8") + b"\n")
+            line = self.__reader.readline()
+        except (OSError, socket.error):
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise DaemonError("connection closed by " + self.socket_path)
+
+        reply = json.loads(line.decode("UTF-8"))
+        if "error" in reply:
+            raise DaemonError(reply["error"])
+        return reply
+
+    def close(self):
+        if self.__socket is not None:
+            self.__reader.close()
+            self.__socket.close()
+            self.__socket = None
+            self.__reader = None
+
+    def __connect(self):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(self.timeout)
+        try:
+            connection.connect(self.socket_path)
+            check_socket_owner(self.socket_path, connection)
+        except BaseException:
+            connection.close()
+            raise
+        self.__socket = connection
+        self.__reader = connection.makefile("rb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
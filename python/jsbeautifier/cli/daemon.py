@@ -0,0 +1,216 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+
+import jsbeautifier
+from jsbeautifier.core.aio import BeautifierPool
+from .client import check_socket_owner, default_socket_path
+
+__all__ = ["Daemon", "serve"]
+
+# Stop after this many seconds without a request
+DEFAULT_IDLE_TIMEOUT = 600
+
+# The longest request line accepted, content included
+MAX_REQUEST_SIZE = 64 * 1024 * 1024
+
+
+class Daemon:
+    """Serves the client.py protocol on a unix socket.
+
+    Requests are beautified by a BeautifierPool of worker processes, which
+    stay warm between requests, so a request only pays for the formatting.
+    The daemon stops once it had no request for idle_timeout seconds (never
+    if it is 0 or None), even if clients still hold connections open, when
+    it gets a stop request or on SIGTERM.
+    """
+
+    def __init__(self, socket_path=None, workers=None, idle_timeout=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.__pool = BeautifierPool(jsbeautifier.formatter, workers)
+        self.__started = time.time()
+        self.__last_request = time.time()
+        # the task serving each open connection, by its writer
+        self.__connections = {}
+        self.__requests = 0
+        self.__errors = 0
+        self.__characters = 0
+        self.__seconds = 0.0
+        self.__stopping = None
+
+    def stats(self):
+        return {
+            "version": jsbeautifier.__version__,
+            "pid": os.getpid(),
+            "uptime": time.time() - self.__started,
+            "workers": self.__pool.workers,
+            "pending": self.__pool.pending,
+            "connections": len(self.__connections),
+            "requests": self.__requests,
+            "errors": self.__errors,
+            "characters": self.__characters,
+            "seconds": self.__seconds,
+        }
+
+    async def run(self):
+        self.__stopping = asyncio.Event()
+        self.__remove_stale_socket()
+        self.__pool.warm_up()
+        server = await asyncio.start_unix_server(
+            self.__serve_connection, path=self.socket_path, limit=MAX_REQUEST_SIZE
+        )
+        # the socket gives access to whatever the daemon may read
+        os.chmod(self.socket_path, 0o600)
+
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, self.__stopping.set)
+        except (NotImplementedError, RuntimeError, ValueError):
+            # only possible on the main thread of a posix process
+            pass
+
+        try:
+            await self.__wait_until_stopped()
+        finally:
+            server.close()
+            # Connections left open would be cancelled by asyncio.run()
+            # with a traceback each, so they are ended here first
+            connections = list(self.__connections.values())
+            for task in connections:
+                task.cancel()
+            await asyncio.gather(*connections, return_exceptions=True)
+            await server.wait_closed()
+            self.__pool.shutdown(wait=False)
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def stop(self):
+        self.__stopping.set()
+
+    async def __wait_until_stopped(self):
+        while True:
+            timeout = None
+            if self.idle_timeout:
+                timeout = self.__last_request + self.idle_timeout - time.time()
+                if timeout <= 0 and not self.__pool.pending:
+                    return
+                timeout = max(timeout, 0.1)
+
+            try:
+                await asyncio.wait_for(self.__stopping.wait(), timeout)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+    def __remove_stale_socket(self):
+        # A socket file left by a daemon that died is removed; one that
+        # still answers means a daemon is already running. Either way one
+        # that belongs to another user is left alone.
+        if not os.path.exists(self.socket_path):
+            return
+
+        check_socket_owner(self.socket_path)
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except (OSError, socket.error):
+            os.remove(self.socket_path)
+        else:
+            raise OSError("already serving on " + self.socket_path)
+        finally:
+            probe.close()
+
+    async def __serve_connection(self, reader, writer):
+        self.__connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # longer than MAX_REQUEST_SIZE, the rest cannot be read
+                    await self.__send(writer, {"error": "request too large"})
+                    break
+                if not line:
+                    break
+
+                self.__last_request = time.time()
+                reply = await self.__answer(line)
+                self.__last_request = time.time()
+                await self.__send(writer, reply)
+        except (ConnectionError, asyncio.CancelledError):
+            # cancelled by run() when stopping: end like a closed connection,
+            # as asyncio reports a connection task that ends cancelled
+            pass
+        finally:
+            self.__connections.pop(writer, None)
+            writer.close()
+
+    async def __send(self, writer, reply):
+        writer.write(json.dumps(reply).encode("UTF-8") + b"\n")
+        await writer.drain()
+
+    async def __answer(self, line):
+        try:
+            request = json.loads(line.decode("UTF-8"))
+            command = request.get("command", "beautify")
+            if command == "stats":
+                return {"stats": self.stats()}
+            if command == "stop":
+                self.stop()
+                return {"stopped": True}
+            if command != "beautify":
+                raise ValueError("unknown command: " + str(command))
+            content = request.get("content") or ""
+            if not isinstance(content, str):
+                raise ValueError("content must be a string")
+            if not isinstance(request.get("options"), (dict, type(None))):
+                raise ValueError("options must be an object")
+        except Exception as ex:
+            self.__errors += 1
+            return {"error": str(ex)}
+
+        start = time.time()
+        self.__requests += 1
+        self.__characters += len(content)
+        try:
+            result = await self.__pool.beautify(content, request.get("options"))
+        except Exception as ex:
+            self.__errors += 1
+            path = request.get("path")
+            return {"error": "%s: %s" % (path, ex) if path else str(ex)}
+        finally:
+            self.__seconds += time.time() - start
+        return {"result": result}
+
+
+def serve(socket_path=None, workers=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    daemon = Daemon(socket_path, workers, idle_timeout)
+    asyncio.run(daemon.run())
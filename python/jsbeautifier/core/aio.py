@@ -0,0 +1,214 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import collections
+import multiprocessing
+import threading
+
+from .cache import options_key
+
+__all__ = ["BeautifierPool"]
+
+# Inputs shorter than this are beautified in the calling thread. A round
+# trip to a worker takes about a millisecond, as long as beautifying 1K of
+# javascript, so anything smaller would wait longer for the worker.
+DEFAULT_INLINE_THRESHOLD = 1024
+
+# The formatters kept by each process, one per set of options
+MAX_FORMATTERS = 16
+
+_formatters = collections.OrderedDict()
+_formatters_lock = threading.Lock()
+
+
+def _get_formatter(create_formatter, key, opts):
+    with _formatters_lock:
+        formatter = _formatters.pop(key, None)
+        if formatter is not None:
+            _formatters[key] = formatter
+            return formatter
+
+    formatter = create_formatter(opts)
+    with _formatters_lock:
+        _formatters[key] = formatter
+        while len(_formatters) > MAX_FORMATTERS:
+            _formatters.popitem(last=False)
+    return formatter
+
+
+def _initialize_worker(create_formatter):
+    # The first input a process beautifies pays for one-time setup, such as
+    # compiling patterns, about 75ms for javascript. Doing that before the
+    # first request is what makes the workers warm.
+    key = options_key(create_formatter, None)
+    _get_formatter(create_formatter, key, None).beautify("")
+
+
+def _beautify(create_formatter, key, opts, source_text):
+    return _get_formatter(create_formatter, key, opts).beautify(source_text)
+
+
+class BeautifierPool:
+    """Beautifies strings for asyncio code in a pool of worker processes.
+
+    create_formatter(opts) must be picklable; each worker keeps the
+    formatters it creates, so the options are only parsed once per worker.
+    Inputs shorter than inline_threshold are beautified right away in the
+    calling thread instead.
+
+    At most max_pending inputs are with the workers at a time, queued or
+    running. Further calls wait for one of them to finish, which is what
+    slows down a caller that sends more than the pool can take.
+
+    Cancelling a call, or a timeout, removes an input that is still queued.
+    One that is already running finishes in its worker and the result is
+    dropped; it keeps its place among the pending inputs until then. The
+    pool may be shared by threads and event loops.
+    """
+
+    def __init__(
+        self,
+        create_formatter,
+        workers=None,
+        max_pending=None,
+        inline_threshold=DEFAULT_INLINE_THRESHOLD,
+    ):
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if max_pending is None:
+            max_pending = workers * 4
+
+        self.workers = workers
+        self.max_pending = max_pending
+        self.inline_threshold = inline_threshold
+        self.__create_formatter = create_formatter
+        self.__executor = None
+        self.__pending = 0
+        self.__waiters = collections.deque()
+        self.__lock = threading.Lock()
+
+    @property
+    def pending(self):
+        return self.__pending
+
+    async def beautify(self, source_text, opts=None, timeout=None):
+        source_text = source_text or ""
+        key = options_key(self.__create_formatter, opts)
+        if len(source_text) < self.inline_threshold:
+            return _beautify(self.__create_formatter, key, opts, source_text)
+
+        if timeout is None:
+            return await self.__submit(key, opts, source_text)
+        return await asyncio.wait_for(self.__submit(key, opts, source_text), timeout)
+
+    def warm_up(self):
+        """Prepares the calling process for inline inputs, as the workers are."""
+        _initialize_worker(self.__create_formatter)
+
+    def shutdown(self, wait=True):
+        with self.__lock:
+            executor = self.__executor
+            self.__executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    async def __submit(self, key, opts, source_text):
+        await self.__acquire()
+        try:
+            executor = self.__get_executor()
+            future = executor.submit(
+                _beautify, self.__create_formatter, key, opts, source_text
+            )
+        except BaseException:
+            self.__release()
+            raise
+
+        # The place is given up once the worker is done, not when the caller
+        # stops waiting, so a cancelled call still counts while it runs
+        future.add_done_callback(lambda future: self.__finish(executor, future))
+        return await asyncio.wrap_future(future)
+
+    def __get_executor(self):
+        # Imported here so that importing the module stays cheap
+        from concurrent.futures import ProcessPoolExecutor
+
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_initialize_worker,
+                    initargs=(self.__create_formatter,),
+                )
+            return self.__executor
+
+    def __finish(self, executor, future):
+        # A worker that died takes the whole executor with it, so the next
+        # call starts a new one
+        from concurrent.futures.process import BrokenProcessPool
+
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            with self.__lock:
+                if self.__executor is executor:
+                    self.__executor = None
+        self.__release()
+
+    async def __acquire(self):
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            if self.__pending < self.max_pending and not self.__waiters:
+                self.__pending += 1
+                return
+            waiter = loop.create_future()
+            self.__waiters.append((loop, waiter))
+
+        try:
+            await waiter
+        except BaseException:
+            with self.__lock:
+                try:
+                    self.__waiters.remove((loop, waiter))
+                    queued = True
+                except ValueError:
+                    queued = False
+            # a place handed over just before the cancellation is passed on
+            if not queued and waiter.done() and not waiter.cancelled():
+                self.__release()
+            raise
+
+    def __release(self):
+        # Called from the executor's thread as well as from event loops. A
+        # freed place goes straight to the next waiter, on its own loop.
+        with self.__lock:
+            if not self.__waiters:
+                self.__pending -= 1
+                return
+            loop, waiter = self.__waiters.popleft()
+        loop.call_soon_threadsafe(self.__hand_over, waiter)
+
+    def __hand_over(self, waiter):
+        if waiter.cancelled():
+            self.__release()
+        else:
+            waiter.set_result(None)
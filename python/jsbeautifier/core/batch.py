@@ -0,0 +1,125 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import collections
+import multiprocessing
+
+__all__ = ["beautify_many"]
+
+# Inputs are sent to the workers in chunks of at least this many characters,
+# so that small files do not each pay for a round trip to another process.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# The formatter owned by a worker process, created once by _initialize_worker
+_worker_formatter = None
+
+
+def _initialize_worker(create_formatter, opts):
+    global _worker_formatter
+    _worker_formatter = create_formatter(opts)
+
+
+def _beautify_chunk(sources):
+    return [_worker_formatter.beautify(source) for source in sources]
+
+
+def _chunks(sources, chunk_size):
+    chunk = []
+    length = 0
+    for source in sources:
+        chunk.append(source)
+        length += len(source)
+        if length >= chunk_size:
+            yield chunk
+            chunk = []
+            length = 0
+
+    if chunk:
+        yield chunk
+
+
+def beautify_many(
+    create_formatter,
+    sources,
+    opts=None,
+    workers=None,
+    chunk_size=None,
+    lazy=False,
+):
+    """Beautify every string in sources, using a pool of worker processes.
+
+    Each worker calls create_formatter(opts) once and reuses the result for
+    all of its inputs, so both create_formatter and opts must be picklable.
+    Results come back in the order of sources, as a list, or as an iterator
+    when lazy is true. The iterator only reads ahead a few chunks, so sources
+    may be a generator over more inputs than fit in memory.
+
+    workers defaults to the number of CPUs and chunk_size to
+    DEFAULT_CHUNK_SIZE. With a single worker everything runs in the calling
+    process.
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    if workers <= 1:
+        formatter = create_formatter(opts)
+        results = (formatter.beautify(source) for source in sources)
+    else:
+        results = _beautify_in_pool(
+            create_formatter, sources, opts, workers, chunk_size
+        )
+
+    if lazy:
+        return results
+    return list(results)
+
+
+def _beautify_in_pool(create_formatter, sources, opts, workers, chunk_size):
+    # Imported here so that importing jsbeautifier stays cheap
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(create_formatter, opts),
+    )
+    pending = collections.deque()
+    try:
+        for chunk in _chunks(sources, chunk_size):
+            pending.append(executor.submit(_beautify_chunk, chunk))
+            # Keep every worker busy without reading all sources up front
+            if len(pending) >= workers * 2:
+                for result in pending.popleft().result():
+                    yield result
+
+        while pending:
+            for result in pending.popleft().result():
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,204 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import threading
+from collections import namedtuple, OrderedDict
+
+__all__ = ["ResultCache", "ResultCacheInfo", "options_key", "text_key"]
+
+ResultCacheInfo = namedtuple(
+    "ResultCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+# python 2 has no os.replace(); rename replaces atomically on posix
+_replace = getattr(os, "replace", os.rename)
+
+
+def _normalize_options(options):
+    if options is None:
+        items = []
+    elif isinstance(options, dict):
+        items = options.items()
+    else:
+        # raw_options only echoes what the public fields were parsed from
+        items = [
+            (name, value)
+            for name, value in vars(options).items()
+            if name != "raw_options"
+        ]
+    return repr(sorted((name.replace("-", "_"), repr(value)) for name, value in items))
+
+
+def _digest(parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("UTF-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def options_key(beautify, opts):
+    # Identifies what beautify(text, opts) does: the function, the version of
+    # its package and the options
+    module = sys.modules.get(beautify.__module__)
+    version = getattr(module, "__version__", "")
+    return _digest(
+        [
+            beautify.__module__ + "." + beautify.__name__,
+            version,
+            _normalize_options(opts),
+        ]
+    )
+
+
+def text_key(text):
+    return _digest([text])
+
+
+class ResultCache:
+    # Persistent cache of beautifier output, one file per result.
+    #
+    # Results are keyed on a hash of the beautify function and the version of
+    # its package, the options and the source text, so a hit can skip
+    # tokenizing altogether. Once the files take more than maxsize bytes the
+    # least recently used ones are removed. Several processes may share a
+    # directory; each keeps its own view of the entries and a result removed
+    # by another process is simply a miss.
+    def __init__(self, directory, maxsize=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = None
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def key(self, beautify, source_text, opts):
+        return _digest([options_key(beautify, opts), source_text])
+
+    def get(self, key):
+        path = self.__path(key)
+        with self.__lock:
+            entries = self.__load()
+            size = entries.get(key)
+            if size is not None:
+                try:
+                    with io.open(path, "rt", newline="", encoding="UTF-8") as f:
+                        result = f.read()
+                    os.utime(path, None)
+                except (IOError, OSError):
+                    # removed by another process sharing the directory
+                    result = None
+
+                del entries[key]
+                if result is not None:
+                    entries[key] = size
+                    self.hits += 1
+                    return result
+                self.__size -= size
+
+            self.misses += 1
+            return None
+
+    def put(self, key, result):
+        path = self.__path(key)
+        with self.__lock:
+            entries = self.__load()
+            directory = os.path.dirname(path)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            # write to the side and rename so readers never see part of a file
+            fd, temp_path = tempfile.mkstemp(dir=directory)
+            try:
+                with io.open(fd, "wt", newline="", encoding="UTF-8") as f:
+                    f.write(result)
+                _replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+            self.__size -= entries.pop(key, 0)
+            entries[key] = os.path.getsize(path)
+            self.__size += entries[key]
+
+            while self.__size > self.maxsize and len(entries) > 1:
+                old_key, old_size = entries.popitem(last=False)
+                self.__size -= old_size
+                self.evictions += 1
+                try:
+                    os.remove(self.__path(old_key))
+                except OSError:
+                    pass
+
+    def beautify(self, beautify, source_text, opts, sink=None):
+        key = self.key(beautify, source_text, opts)
+        result = self.get(key)
+        if result is None:
+            result = beautify(source_text, opts)
+            self.put(key, result)
+
+        if sink is None:
+            return result
+        sink.write(result)
+        return ""
+
+    def info(self):
+        with self.__lock:
+            self.__load()
+            return ResultCacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, self.__size
+            )
+
+    def __path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def __load(self):
+        # The directory is read once, oldest entries first
+        if self.__entries is None:
+            found = []
+            if os.path.isdir(self.directory):
+                for root, dirs, files in os.walk(self.directory):
+                    for name in files:
+                        if len(name) != 64:
+                            continue
+                        try:
+                            stat = os.stat(os.path.join(root, name))
+                        except OSError:
+                            continue
+                        found.append((stat.st_mtime, name, stat.st_size))
+
+            found.sort()
+            self.__entries = OrderedDict((name, size) for _, name, size in found)
+            self.__size = sum(size for _, _, size in found)
+        return self.__entries
@@ -0,0 +1,110 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import os
+import tempfile
+
+from .cache import text_key
+
+__all__ = ["FileIndex"]
+
+# python 2 has no os.replace(); rename replaces atomically on posix
+_replace = getattr(os, "replace", os.rename)
+
+
+def _stat_key(stat):
+    # nanoseconds where available, so quick successive edits are still seen
+    mtime = getattr(stat, "st_mtime_ns", None)
+    if mtime is None:
+        mtime = int(stat.st_mtime * 1000000000)
+    return [mtime, stat.st_size]
+
+
+class FileIndex:
+    # Remembers which files are already beautified with which options.
+    #
+    # For every file written (or found already beautified) it records the
+    # mtime and size, a hash of the content and the options_key() it was
+    # beautified with. A file whose mtime and size still match is unchanged
+    # and need not even be read; one that was only touched is recognised by
+    # its content hash.
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.__files = {}
+        try:
+            with io.open(path, "rt", encoding="UTF-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.__files = data["files"]
+        except (IOError, OSError, ValueError, KeyError):
+            # a missing or unreadable index only means nothing is skipped
+            pass
+
+    def is_unchanged(self, filepath, options_key):
+        entry = self.__entry(filepath, options_key)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        return entry[:2] == _stat_key(stat)
+
+    def is_beautified(self, filepath, options_key, text):
+        entry = self.__entry(filepath, options_key)
+        return entry is not None and entry[2] == text_key(text)
+
+    def record(self, filepath, options_key, text):
+        self.__files[os.path.abspath(filepath)] = _stat_key(os.stat(filepath)) + [
+            text_key(text),
+            options_key,
+        ]
+
+    def forget(self, filepath):
+        self.__files.pop(os.path.abspath(filepath), None)
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with io.open(fd, "wt", encoding="UTF-8") as f:
+                # json.dumps() returns bytes on python 2
+                f.write(
+                    "" + json.dumps({"version": self.VERSION, "files": self.__files})
+                )
+            _replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def __entry(self, filepath, options_key):
+        entry = self.__files.get(os.path.abspath(filepath))
+        if entry is None or entry[3] != options_key:
+            return None
+        return entry
@@ -0,0 +1,49 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+
+__all__ = ["Formatter"]
+
+
+class Formatter:
+    """Beautifier bound to a single set of options.
+
+    Each thread gets its own beautifier the first time it formats something.
+    That beautifier parses the options and compiles its patterns once and is
+    then only rebound to each new source text, so a single Formatter can be
+    shared between threads and reused for any number of inputs.
+    """
+
+    def __init__(self, create_beautifier):
+        self.__create_beautifier = create_beautifier
+        self.__local = threading.local()
+
+    def beautify(self, source_text):
+        beautifier = getattr(self.__local, "beautifier", None)
+        if beautifier is None:
+            beautifier = self.__create_beautifier()
+            self.__local.beautifier = beautifier
+
+        return beautifier.beautify(source_text)
@@ -23,11 +23,66 @@
 # SOFTWARE.
 
 import re
+import threading
+from collections import namedtuple, OrderedDict
+
+RegexpCacheInfo = namedtuple(
+    "RegexpCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class RegexpCache:
+    # Bounded LRU of compiled regular expressions keyed on (pattern, flags).
+    # Every pattern derivation goes through here, so the same source strings
+    # are only compiled once per process.
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, pattern, flags=0):
+        key = (pattern, flags)
+        with self.__lock:
+            result = self.__entries.get(key)
+            if result is not None:
+                self.hits += 1
+                # python 2 OrderedDict has no move_to_end()
+                del self.__entries[key]
+                self.__entries[key] = result
+                return result
+            self.misses += 1
+
+        result = re.compile(pattern, flags)
+        with self.__lock:
+            self.__entries[key] = result
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+        return result
+
+    def info(self):
+        with self.__lock:
+            return RegexpCacheInfo(
+                self.hits, self.misses, self.maxsize, len(self.__entries)
+            )
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+regexp_cache = RegexpCache()
 
 
 class InputScanner:
     def __init__(self, input_string):
-        self.__six = __import__("six")
+        self.set_input(input_string)
+
+    def set_input(self, input_string):
+        # Swapping the text lets one scanner be reused on a new input.
         if input_string is None:
             input_string = ""
         self.__input = input_string
@@ -116,15 +171,46 @@ class InputScanner:
     def readUntilAfter(self, pattern):
         return self.readUntil(pattern, True)
 
-    def get_regexp(self, pattern, match_from=False):
+    def readUntilLiteral(self, literal, include_match=False, stop_chars=""):
+        # str.find() counterpart of readUntil() for a plain string delimiter,
+        # which keeps long runs of text such as data: urls off the regex
+        # engine. If any of stop_chars comes before the delimiter nothing is
+        # read and None is returned, so the caller can fall back to a pattern.
+        match_index = self.__input.find(literal, self.__position)
+        if match_index == -1:
+            match_index = self.__input_length
+
+        for c in stop_chars:
+            if self.__input.find(c, self.__position, match_index) != -1:
+                return None
+
+        if include_match and match_index < self.__input_length:
+            match_index += len(literal)
+
+        val = self.__input[self.__position : match_index]
+        self.__position = match_index
+        return val
+
+    @staticmethod
+    def get_regexp(pattern, match_from=False, flags=0):
         result = None
         # strings are converted to regexp
-        if isinstance(pattern, self.__six.string_types) and pattern != "":
-            result = re.compile(pattern)
+        if isinstance(pattern, __import__("six").string_types) and pattern != "":
+            result = regexp_cache.get(pattern, flags)
         elif pattern is not None:
-            result = re.compile(pattern.pattern)
+            # compiled patterns are immutable, so they are reused as-is
+            # (keeping their flags) instead of being recompiled
+            result = pattern
         return result
 
+    @staticmethod
+    def get_literal_regexp(literal_string):
+        return regexp_cache.get(re.escape(literal_string))
+
+    @staticmethod
+    def get_regexp_cache_info():
+        return regexp_cache.info()
+
     # css beautifier legacy helpers
     def peekUntilAfter(self, pattern):
         start = self.__position
@@ -85,8 +85,27 @@ class Options:
             ["auto"],
         )
 
+    # raw_options may be a namedtuple built on the fly, which pickle cannot
+    # look up by name, so it is stored as a dict and rebuilt on load.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if isinstance(self.raw_options, tuple):
+            state["raw_options"] = dict(self.raw_options._asdict())
+        return state
+
+    def __setstate__(self, state):
+        raw_options = state["raw_options"]
+        if isinstance(raw_options, dict):
+            state["raw_options"] = namedtuple("CustomOptions", raw_options.keys())(
+                *raw_options.values()
+            )
+        self.__dict__.update(state)
+
     def _get_array(self, name, default_value=[]):
         option_value = getattr(self.raw_options, name, default_value)
+        # null means "use the default", as in the javascript implementation
+        if option_value is None:
+            option_value = default_value
         result = []
         if isinstance(option_value, list):
             result = copy.copy(option_value)
@@ -107,6 +126,8 @@ class Options:
 
     def _get_characters(self, name, default_value=""):
         option_value = getattr(self.raw_options, name, default_value)
+        if option_value is None:
+            option_value = default_value
         result = ""
         if isinstance(option_value, str):
             result = (
@@ -119,6 +140,8 @@ class Options:
 
     def _get_number(self, name, default_value=0):
         option_value = getattr(self.raw_options, name, default_value)
+        if option_value is None:
+            option_value = default_value
         result = 0
         try:
             result = int(option_value)
@@ -55,6 +55,12 @@ class OutputLine:
     def is_empty(self):
         return len(self.__items) == 0
 
+    def has_match(self, pattern):
+        for item in reversed(self.__items):
+            if re.search(pattern, item):
+                return True
+        return False
+
     def set_indent(self, indent=0, alignment=0):
         if self.is_empty():
             self.__indent_count = indent
@@ -82,6 +88,7 @@ class OutputLine:
 
     def _allow_wrap(self):
         if self._should_wrap():
+            self.__parent.wrap_count += 1
             self.__parent.add_new_line()
             next = self.__parent.current_line
             next.set_indent(
@@ -124,6 +131,12 @@ class OutputLine:
             self.__character_count -= len(item)
         return item
 
+    def _freeze(self):
+        # Only the indent of a line before the previous line can still
+        # change, so its items can be kept as a single string.
+        if len(self.__items) > 1:
+            self.__items = ["".join(self.__items)]
+
     def _remove_indent(self):
         if self.__indent_count > 0:
             self.__indent_count -= 1
@@ -203,8 +216,14 @@ class IndentStringCache:
 
 
 class Output:
-    def __init__(self, options, baseIndentString=""):
+    # With a sink (any object with a write method), lines that can no longer
+    # change are written out as the caller commits them, instead of all being
+    # held until get_code.
+    def __init__(self, options, baseIndentString="", sink=None):
         self.__indent_cache = IndentStringCache(options, baseIndentString)
+        self.__sink = sink
+        self.__committed_line_count = 0
+        self.__frozen_line_count = 0
         self.raw = False
         self._end_with_newline = options.end_with_newline
         self.indent_size = options.indent_size
@@ -217,6 +236,8 @@ class Output:
         self.space_before_token = False
         self.non_breaking_space = False
         self.previous_token_wrapped = False
+        # lines broken at a wrap point, for BeautifierStats
+        self.wrap_count = 0
         # initialize
         self.__add_outputline()
 
@@ -226,7 +247,49 @@ class Output:
         self.__lines.append(self.current_line)
 
     def get_line_number(self):
-        return len(self.__lines)
+        return self.__committed_line_count + len(self.__lines)
+
+    def get_committed_line_number(self):
+        # Lines before this number have been written to the sink.
+        return self.__committed_line_count
+
+    def commit(self, line_index, eol="\n"):
+        # Write lines before line_index to the sink. The caller promises
+        # not to touch them again (remove_indent and ensure_empty_line_above
+        # reach back into earlier lines). trim(True) can eat back through
+        # empty lines to the last line with content and then trim it, and
+        # previous_line must stay available, so lines from just before that
+        # one on are always kept.
+        if self.__sink is None:
+            return
+
+        last_content_index = len(self.__lines) - 2
+        while last_content_index > 0 and (
+            self.__lines[last_content_index].is_empty()
+            or self.__lines[last_content_index].last() == " "
+        ):
+            last_content_index -= 1
+        stable_count = max(0, last_content_index - 1)
+
+        # Lines that cannot be written yet only wait for remove_indent
+        for line in self.__lines[self.__frozen_line_count : stable_count]:
+            line._freeze()
+        self.__frozen_line_count = max(self.__frozen_line_count, stable_count)
+
+        count = min(line_index - self.__committed_line_count, stable_count)
+        if count <= 0:
+            return
+
+        committed_code = "".join(
+            line.toString() + "\n" for line in self.__lines[:count]
+        )
+        if not eol == "\n":
+            committed_code = committed_code.replace("\n", eol)
+        self.__sink.write(committed_code)
+
+        del self.__lines[:count]
+        self.__committed_line_count += count
+        self.__frozen_line_count -= count
 
     def get_indent_string(self, indent, column=0):
         return self.__indent_cache.get_indent_string(indent, column)
@@ -268,6 +331,10 @@ class Output:
         if not eol == "\n":
             sweet_code = sweet_code.replace("\n", eol)
 
+        if self.__sink is not None:
+            self.__sink.write(sweet_code)
+            return ""
+
         return sweet_code
 
     def set_wrap_point(self):
@@ -278,7 +345,7 @@ class Output:
         self.next_line.set_indent(indent, alignment)
 
         # Never indent your first output indent at the start of the file
-        if len(self.__lines) > 1:
+        if self.get_line_number() > 1:
             self.current_line.set_indent(indent, alignment)
             return True
         self.current_line.set_indent()
@@ -310,6 +377,9 @@ class Output:
         self.space_before_token = False
 
     def remove_indent(self, index):
+        index -= self.__committed_line_count
+        if index < 0:
+            raise ValueError("remove_indent reaches into committed lines")
         while index < len(self.__lines):
             self.__lines[index]._remove_indent()
             index += 1
@@ -22,62 +22,66 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from ..core.inputscanner import InputScanner
+
 __all__ = ["Pattern"]
 
 
+# Patterns are immutable descriptions: every derivation returns a new pattern
+# and the input scanner is only passed in when reading. A pattern tree can
+# therefore be built once and shared by every tokenizer and thread.
 class Pattern:
-    def __init__(self, input_scanner, parent=None):
-        self._input = input_scanner
+    def __init__(self, parent=None):
         self._starting_pattern = None
         self._match_pattern = None
         self._until_pattern = None
         self._until_after = False
 
         if parent is not None:
-            self._starting_pattern = self._input.get_regexp(parent._starting_pattern)
-            self._match_pattern = self._input.get_regexp(parent._match_pattern)
-            self._until_pattern = self._input.get_regexp(parent._until_pattern)
+            self._starting_pattern = parent._starting_pattern
+            self._match_pattern = parent._match_pattern
+            self._until_pattern = parent._until_pattern
             self._until_after = parent._until_after
 
-    def read(self):
-        result = self._input.read(self._starting_pattern)
+    def read(self, input_scanner):
+        result = input_scanner.read(self._starting_pattern)
         if (self._starting_pattern is None) or result:
-            result += self._input.read(
+            result += input_scanner.read(
                 self._match_pattern, self._until_pattern, self._until_after
             )
         return result
 
-    def read_match(self):
-        return self._input.match(self._match_pattern)
+    def read_match(self, input_scanner):
+        return input_scanner.match(self._match_pattern)
 
     def until_after(self, pattern):
         result = self._create()
         result._until_after = True
-        result._until_pattern = self._input.get_regexp(pattern)
+        result._until_pattern = InputScanner.get_regexp(pattern)
         result._update()
         return result
 
     def until(self, pattern):
         result = self._create()
         result._until_after = False
-        result._until_pattern = self._input.get_regexp(pattern)
+        result._until_pattern = InputScanner.get_regexp(pattern)
         result._update()
         return result
 
     def starting_with(self, pattern):
         result = self._create()
-        result._starting_pattern = self._input.get_regexp(pattern)
+        result._starting_pattern = InputScanner.get_regexp(pattern)
         result._update()
         return result
 
     def matching(self, pattern):
         result = self._create()
-        result._match_pattern = self._input.get_regexp(pattern)
+        result._match_pattern = InputScanner.get_regexp(pattern)
         result._update()
         return result
 
     def _create(self):
-        return Pattern(self._input, self)
+        return Pattern(self)
 
     def _update(self):
         pass
@@ -0,0 +1,135 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import marshal
+import sys
+import time
+
+__all__ = ["HandlerProfile"]
+
+_clock = getattr(time, "perf_counter", time.time)
+
+
+class HandlerProfile:
+    """Call counts and times for a chosen set of beautifier methods.
+
+    Unlike cProfile only the wrapped methods are measured, so the numbers
+    are not distorted by instrumenting every call. Results can be printed
+    as a flat table, or read with pstats.Stats(profile) or saved with
+    dump_stats() in the format cProfile uses.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # key -> [primitive calls, calls, own time, cumulative time, callers]
+        # where callers maps caller key -> [primitive calls, calls, own time,
+        # cumulative time] for calls made from there
+        self.__entries = {}
+        self.__stack = []
+        self.__active = {}
+
+    def wrap(self, method):
+        code = getattr(method, "__func__", method).__code__
+        key = (code.co_filename, code.co_firstlineno, code.co_name)
+
+        def profiled(*args, **kwargs):
+            self.__enter(key)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.__exit(key)
+
+        return profiled
+
+    def __enter(self, key):
+        self.__active[key] = self.__active.get(key, 0) + 1
+        # [key, start, time spent in wrapped callees]
+        self.__stack.append([key, _clock(), 0.0])
+
+    def __exit(self, key):
+        now = _clock()
+        _, start, child_time = self.__stack.pop()
+        elapsed = now - start
+        own_time = elapsed - child_time
+        self.__active[key] -= 1
+        # recursive calls are already inside the outer call's time
+        primitive = self.__active[key] == 0
+
+        caller = self.__stack[-1][0] if self.__stack else None
+        if self.__stack:
+            self.__stack[-1][2] += elapsed
+
+        entry = self.__entries.get(key)
+        if entry is None:
+            entry = self.__entries[key] = [0, 0, 0.0, 0.0, {}]
+        entry[1] += 1
+        entry[2] += own_time
+        if primitive:
+            entry[0] += 1
+            entry[3] += elapsed
+
+        if caller is not None:
+            edge = entry[4].get(caller)
+            if edge is None:
+                edge = entry[4][caller] = [0, 0, 0.0, 0.0]
+            edge[1] += 1
+            edge[2] += own_time
+            if primitive:
+                edge[0] += 1
+                edge[3] += elapsed
+
+    def table(self):
+        """Rows of (name, calls, own seconds, cumulative seconds), slowest
+        cumulative time first."""
+        rows = [
+            (key[2], entry[1], entry[2], entry[3])
+            for key, entry in self.__entries.items()
+        ]
+        rows.sort(key=lambda row: (-row[3], row[0]))
+        return rows
+
+    def print_table(self, stream=None):
+        stream = stream or sys.stdout
+        stream.write(
+            "%-40s %10s %12s %12s\n" % ("function", "calls", "tottime", "cumtime")
+        )
+        for name, calls, own_time, cumulative in self.table():
+            stream.write(
+                "%-40s %10d %12.6f %12.6f\n" % (name, calls, own_time, cumulative)
+            )
+
+    def create_stats(self):
+        # Called by pstats.Stats(profile); builds the same layout cProfile does
+        self.stats = {}
+        for key, entry in self.__entries.items():
+            callers = dict((caller, tuple(edge)) for caller, edge in entry[4].items())
+            self.stats[key] = (entry[0], entry[1], entry[2], entry[3], callers)
+
+    def dump_stats(self, file_name):
+        self.create_stats()
+        with open(file_name, "wb") as f:
+            marshal.dump(self.stats, f)
@@ -0,0 +1,146 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2007-2018 Einar Lielmanis, Liam Newman, and contributors.
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge,
+# publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import time
+
+from .profile import HandlerProfile
+
+__all__ = ["BeautifierStats"]
+
+_clock = getattr(time, "perf_counter", time.time)
+
+
+class BeautifierStats:
+    """Counters and phase timings collected by beautify(..., stats=...).
+
+    phases maps a phase name to wall time in seconds: "setup", "unpack",
+    "tokenize", "handle" (token handling, including writing to a sink) and
+    "output" (Output.get_code) for JavaScript; "setup", "handle" and
+    "output" for CSS; "setup", "tokenize", "handle" and "output" for HTML.
+    Producing tokens is counted as "tokenize" whichever phase asked for
+    them. token_counts maps token type names to the number of tokens,
+    comments included. Every call adds to the totals; callback, if given,
+    is called with this object at the end of each one.
+
+    delegated maps a language ("javascript", "css" or "html") to the
+    number of blocks embedded in HTML that were handed to its beautifier.
+    The time spent on them is kept out of "handle" and counted as a phase
+    named after the language.
+
+    With profile_handlers, handlers is a HandlerProfile with call counts
+    and times for each JavaScript token handler and the output methods
+    they call; otherwise it is None.
+
+    Nothing is measured for a call made without stats.
+    """
+
+    def __init__(self, callback=None, profile_handlers=False):
+        self.callback = callback
+        self.handlers = HandlerProfile() if profile_handlers else None
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.phases = {}
+        self.token_counts = {}
+        self.delegated = {}
+        self.output_lines = 0
+        self.wraps = 0
+        if self.handlers is not None:
+            self.handlers.reset()
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "phases": dict(self.phases),
+            "token_counts": dict(self.token_counts),
+            "delegated": dict(self.delegated),
+            "output_lines": self.output_lines,
+            "wraps": self.wraps,
+        }
+
+    def begin(self):
+        return _StatsRecorder(self)
+
+
+class _StatsRecorder:
+    # Measures a single beautify() call for a BeautifierStats
+
+    def __init__(self, stats):
+        self.__stats = stats
+        self.__tokenize_time = 0.0
+        self.__delegated_time = 0.0
+        self.__last = _clock()
+
+    def lap(self, phase):
+        now = _clock()
+        elapsed = now - self.__last - self.__tokenize_time - self.__delegated_time
+        self.__last = now
+        self.__delegated_time = 0.0
+
+        phases = self.__stats.phases
+        phases[phase] = phases.get(phase, 0.0) + elapsed
+        if self.__tokenize_time:
+            phases["tokenize"] = phases.get("tokenize", 0.0) + self.__tokenize_time
+            self.__tokenize_time = 0.0
+
+    def delegate(self, language, beautify, source_text):
+        start = _clock()
+        result = beautify(source_text)
+        elapsed = _clock() - start
+        self.__delegated_time += elapsed
+
+        stats = self.__stats
+        stats.phases[language] = stats.phases.get(language, 0.0) + elapsed
+        stats.delegated[language] = stats.delegated.get(language, 0) + 1
+        return result
+
+    def tokens(self, tokens):
+        counts = self.__stats.token_counts
+        tokens = iter(tokens)
+        while True:
+            start = _clock()
+            try:
+                token = next(tokens)
+            except StopIteration:
+                self.__tokenize_time += _clock() - start
+                return
+            self.__tokenize_time += _clock() - start
+
+            name = token.type.name
+            counts[name] = counts.get(name, 0) + 1
+            if token.comments_before is not None:
+                for comment in token.comments_before:
+                    name = comment.type.name
+                    counts[name] = counts.get(name, 0) + 1
+            yield token
+
+    def finish(self, output):
+        stats = self.__stats
+        stats.calls += 1
+        stats.output_lines += output.get_line_number()
+        stats.wraps += output.wrap_count
+        if stats.callback is not None:
+            stats.callback(stats)
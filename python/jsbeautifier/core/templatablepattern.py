@@ -23,10 +23,14 @@
 # SOFTWARE.
 
 import copy
+import re
+from ..core.inputscanner import InputScanner
 from ..core.pattern import Pattern
 
 __all__ = ["TemplatablePattern"]
 
+_literal = re.compile(r"[^\\.^$*+?{}\[\]|()]+\Z")
+
 
 class TemplateNames:
     def __init__(self):
@@ -39,8 +43,8 @@ class TemplateNames:
 
 
 class TemplatePatterns:
-    def __init__(self, input_scanner):
-        pattern = Pattern(input_scanner)
+    def __init__(self):
+        pattern = Pattern()
         self.handlebars_comment = pattern.starting_with(r"{{!--").until_after(r"--}}")
         self.handlebars_unescaped = pattern.starting_with(r"{{{").until_after(r"}}}")
         self.handlebars = pattern.starting_with(r"{{").until_after(r"}}")
@@ -50,29 +54,45 @@ class TemplatePatterns:
         self.django = pattern.starting_with(r"{%").until_after(r"%}")
         self.django_value = pattern.starting_with(r"{{").until_after(r"}}")
         self.django_comment = pattern.starting_with(r"{#").until_after(r"#}")
-        self.smarty_value = pattern.starting_with(r"{(?=[^}{\s\n])").until_after(r"}")
+        self.smarty = pattern.starting_with(r"{(?=[^}{\s\n])").until_after(r"[^\s\n]}")
         self.smarty_comment = pattern.starting_with(r"{\*").until_after(r"\*}")
         self.smarty_literal = pattern.starting_with(r"{literal}").until_after(
             r"{/literal}"
         )
 
 
+# The template patterns never change, so every TemplatablePattern shares one
+# set. It is built on first use rather than at import time.
+_template_patterns = None
+
+
+def _get_template_patterns():
+    global _template_patterns
+    if _template_patterns is None:
+        _template_patterns = TemplatePatterns()
+    return _template_patterns
+
+
 class TemplatablePattern(Pattern):
-    def __init__(self, input_scanner, parent=None):
-        Pattern.__init__(self, input_scanner, parent)
+    def __init__(self, parent=None):
+        Pattern.__init__(self, parent)
         self.__template_pattern = None
+        self.__until_literal = None
+        self.__template_start_chars = ""
         self._disabled = TemplateNames()
         self._excluded = TemplateNames()
 
         if parent is not None:
-            self.__template_pattern = self._input.get_regexp(parent.__template_pattern)
+            self.__template_pattern = parent.__template_pattern
+            self.__until_literal = parent.__until_literal
+            self.__template_start_chars = parent.__template_start_chars
             self._disabled = copy.copy(parent._disabled)
             self._excluded = copy.copy(parent._excluded)
 
-        self.__patterns = TemplatePatterns(input_scanner)
+        self.__patterns = _get_template_patterns()
 
     def _create(self):
-        return TemplatablePattern(self._input, self)
+        return TemplatablePattern(self)
 
     def _update(self):
         self.__set_templated_pattern()
@@ -96,26 +116,36 @@ class TemplatablePattern(Pattern):
         result._update()
         return result
 
-    def read(self):
+    def read(self, input_scanner):
+        if self.__until_literal is not None:
+            # Without a template start before the delimiter the text is a
+            # single slice, and str.find() gets there much faster than the
+            # template pattern does on long values.
+            result = input_scanner.readUntilLiteral(
+                self.__until_literal, self._until_after, self.__template_start_chars
+            )
+            if result is not None:
+                return result
+
         result = ""
         if bool(self._match_pattern):
-            result = self._input.read(self._starting_pattern)
+            result = input_scanner.read(self._starting_pattern)
         else:
-            result = self._input.read(self._starting_pattern, self.__template_pattern)
+            result = input_scanner.read(self._starting_pattern, self.__template_pattern)
 
-        next = self._read_template()
+        next = self._read_template(input_scanner)
 
         while bool(next):
             if self._match_pattern is not None:
-                next += self._input.read(self._match_pattern)
+                next += input_scanner.read(self._match_pattern)
             else:
-                next += self._input.readUntil(self.__template_pattern)
+                next += input_scanner.readUntil(self.__template_pattern)
 
             result += next
-            next = self._read_template()
+            next = self._read_template(input_scanner)
 
         if self._until_after:
-            result += self._input.readUntilAfter(self._until_after)
+            result += input_scanner.readUntilAfter(self._until_pattern)
 
         return result
 
@@ -128,6 +158,10 @@ class TemplatablePattern(Pattern):
         if not self._disabled.handlebars:
             items.append(self.__patterns.handlebars._starting_pattern.pattern)
 
+        if not self._disabled.angular:
+            # Handlebars ('{{' and '}}') are also special tokens in Angular
+            items.append(self.__patterns.handlebars._starting_pattern.pattern)
+
         if not self._disabled.erb:
             items.append(self.__patterns.erb._starting_pattern.pattern)
 
@@ -144,49 +178,94 @@ class TemplatablePattern(Pattern):
         if self._until_pattern:
             items.append(self._until_pattern.pattern)
 
-        self.__template_pattern = self._input.get_regexp(r"(?:" + "|".join(items) + ")")
-
-    def _read_template(self):
+        self.__template_pattern = InputScanner.get_regexp(
+            r"(?:" + "|".join(items) + ")"
+        )
+        self.__set_until_literal()
+
+    def __set_until_literal(self):
+        start_chars = ""
+        if not (self._disabled.php and self._disabled.erb):
+            start_chars += "<"
+        if not (
+            self._disabled.handlebars
+            and self._disabled.angular
+            and self._disabled.django
+            and self._disabled.smarty
+        ):
+            start_chars += "{"
+        self.__template_start_chars = start_chars
+
+        # Only a plain "until" string, with nothing to match before it, can
+        # be searched for with str.find()
+        self.__until_literal = None
+        if (
+            self._until_pattern is not None
+            and self._starting_pattern is None
+            and self._match_pattern is None
+            and not (self._until_pattern.flags & ~re.UNICODE)
+            and _literal.match(self._until_pattern.pattern)
+            and self._until_pattern.pattern[0] not in start_chars
+        ):
+            self.__until_literal = self._until_pattern.pattern
+
+    def _read_template(self, input_scanner):
         resulting_string = ""
-        c = self._input.peek()
+        c = input_scanner.peek()
         if c == "<":
-            peek1 = self._input.peek(1)
+            peek1 = input_scanner.peek(1)
             if not self._disabled.php and not self._excluded.php and peek1 == "?":
-                resulting_string = resulting_string or self.__patterns.php.read()
+                resulting_string = resulting_string or self.__patterns.php.read(
+                    input_scanner
+                )
 
             if not self._disabled.erb and not self._excluded.erb and peek1 == "%":
-                resulting_string = resulting_string or self.__patterns.erb.read()
+                resulting_string = resulting_string or self.__patterns.erb.read(
+                    input_scanner
+                )
         elif c == "{":
             if not self._disabled.handlebars and not self._excluded.handlebars:
                 resulting_string = (
-                    resulting_string or self.__patterns.handlebars_comment.read()
+                    resulting_string
+                    or self.__patterns.handlebars_comment.read(input_scanner)
                 )
                 resulting_string = (
-                    resulting_string or self.__patterns.handlebars_unescaped.read()
+                    resulting_string
+                    or self.__patterns.handlebars_unescaped.read(input_scanner)
+                )
+                resulting_string = resulting_string or self.__patterns.handlebars.read(
+                    input_scanner
                 )
-                resulting_string = resulting_string or self.__patterns.handlebars.read()
             if not self._disabled.django:
                 # django coflicts with handlebars a bit.
                 if not self._excluded.django and not self._excluded.handlebars:
                     resulting_string = (
-                        resulting_string or self.__patterns.django_value.read()
+                        resulting_string
+                        or self.__patterns.django_value.read(input_scanner)
                     )
                 if not self._excluded.django:
                     resulting_string = (
-                        resulting_string or self.__patterns.django_comment.read()
+                        resulting_string
+                        or self.__patterns.django_comment.read(input_scanner)
+                    )
+                    resulting_string = resulting_string or self.__patterns.django.read(
+                        input_scanner
                     )
-                    resulting_string = resulting_string or self.__patterns.django.read()
             if not self._disabled.smarty:
                 # smarty cannot be enabled with django or handlebars enabled
 
                 if self._disabled.django and self._disabled.handlebars:
                     resulting_string = (
-                        resulting_string or self.__patterns.smarty_comment.read()
+                        resulting_string
+                        or self.__patterns.smarty_comment.read(input_scanner)
                     )
                     resulting_string = (
-                        resulting_string or self.__patterns.smarty_literal.read()
+                        resulting_string
+                        or self.__patterns.smarty_literal.read(input_scanner)
                     )
 
-                    resulting_string = resulting_string or self.__patterns.smarty.read()
+                    resulting_string = resulting_string or self.__patterns.smarty.read(
+                        input_scanner
+                    )
 
         return resulting_string
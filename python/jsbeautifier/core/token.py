@@ -24,6 +24,22 @@
 
 
 class Token:
+    # A large file produces tens of thousands of tokens; slots drop the
+    # per-instance __dict__, which is most of each token's memory.
+    __slots__ = (
+        "type",
+        "text",
+        "comments_before",
+        "newlines",
+        "whitespace_before",
+        "parent",
+        "next",
+        "previous",
+        "opened",
+        "closed",
+        "directives",
+    )
+
     def __init__(self, type, text, newlines=0, whitespace_before=""):
         self.type = type
         self.text = text
@@ -25,17 +25,46 @@
 import re
 from ..core.inputscanner import InputScanner
 from ..core.token import Token
-from ..core.tokenstream import TokenStream
+from ..core.tokenstream import TokenStream, LazyTokenStream
 from ..core.pattern import Pattern
 from ..core.whitespacepattern import WhitespacePattern
 
-__all__ = ["TOKEN", "Tokenizer", "TokenizerPatterns", "TokenTypes"]
+__all__ = ["TOKEN", "Tokenizer", "TokenizerPatterns", "TokenType", "TokenTypes"]
+
+
+class TokenType(str):
+    # A token type is its "TK_" name, so it compares equal to the plain
+    # strings token types used to be, and types of different languages are
+    # only equal when they have the same name. Comparisons and dict lookups
+    # stay in C and cheap: the names are short and their hashes are cached.
+    # Each type also has a number, unique across languages, for int() and
+    # for indexing tables: 0-2 are shared, JavaScript uses 3-17 and HTML
+    # 18-28.
+    def __new__(cls, value, name):
+        result = str.__new__(cls, name)
+        result.value = value
+        result.name = name
+        return result
+
+    def __getnewargs__(self):
+        return (self.value, self.name)
+
+    def __int__(self):
+        return self.value
+
+    __index__ = __int__
+
+    def __repr__(self):
+        return self.name
+
+    def __str__(self):
+        return self.name
 
 
 class TokenTypes:
-    START = "TK_START"
-    RAW = "TK_RAW"
-    EOF = "TK_EOF"
+    START = TokenType(0, "TK_START")
+    RAW = TokenType(1, "TK_RAW")
+    EOF = TokenType(2, "TK_EOF")
 
     def __init__(self):
         pass
@@ -45,27 +74,51 @@ TOKEN = TokenTypes()
 
 
 class TokenizerPatterns:
-    def __init__(self, input_scanner):
-        self.whitespace = WhitespacePattern(input_scanner)
+    def __init__(self):
+        self.whitespace = WhitespacePattern()
 
 
 class Tokenizer:
     def __init__(self, input_string, options):
         self._input = InputScanner(input_string)
         self._options = options
-        self.__tokens = None
-
-        self._patterns = TokenizerPatterns(self._input)
-
-    def tokenize(self):
+        self.__first_token = True
+        self._newline_count = 0
+        self._whitespace_before_token = ""
+
+        self._patterns = TokenizerPatterns()
+
+    def set_input(self, input_string):
+        self._input.set_input(input_string)
+
+    def tokenize(self, observe=None):
+        # observe, if given, wraps the token generator, as in stream()
+        tokens = TokenStream()
+        generated = self.generate()
+        if observe is not None:
+            generated = observe(generated)
+        for token in generated:
+            tokens.add(token)
+        return tokens
+
+    def stream(self, observe=None):
+        # Tokens are read as the stream is consumed, so only a small window
+        # around the current position is kept in memory. observe, if given,
+        # wraps the token generator.
+        tokens = self.generate()
+        if observe is not None:
+            tokens = observe(tokens)
+        return LazyTokenStream(tokens, release=self._release_token)
+
+    def generate(self):
         self._input.restart()
-        self.__tokens = TokenStream()
+        self.__first_token = True
+        self._reset()
 
         current = None
         previous = Token(TOKEN.START, "")
         open_token = None
         open_stack = []
-        comments = TokenStream()
 
         while previous.type != TOKEN.EOF:
             current = self.__get_next_token_with_comments(previous, open_token)
@@ -79,9 +132,20 @@ class Tokenizer:
                 open_token = open_stack.pop()
                 current.parent = open_token
 
-            self.__tokens.add(current)
+            self.__first_token = False
+            yield current
             previous = current
-        return self.__tokens
+
+    def _release_token(self, token):
+        # Called once a token falls out of the stream's history. Unlinking it
+        # from its neighbours lets it be collected; otherwise an opening
+        # token that is still a parent would reach every later token through
+        # next. Opening tokens keep their previous link so closing tokens can
+        # still look at what came before the matching opener.
+        following = token.next
+        token.next = None
+        if following is not None and not self._is_opening(following):
+            following.previous = None
 
     def __get_next_token_with_comments(self, previous, open_token):
         current = self._get_next_token(previous, open_token)
@@ -103,7 +167,7 @@ class Tokenizer:
         return current
 
     def _is_first_token(self):
-        return self.__tokens.isEmpty()
+        return self.__first_token
 
     def _reset(self):
         pass
@@ -129,10 +193,15 @@ class Tokenizer:
         token = Token(
             token_type,
             text,
-            self._patterns.whitespace.newline_count,
-            self._patterns.whitespace.whitespace_before_token,
+            self._newline_count,
+            self._whitespace_before_token,
         )
         return token
 
     def _readWhitespace(self):
-        return self._patterns.whitespace.read()
+        resulting_string = self._patterns.whitespace.read(self._input)
+        (
+            self._newline_count,
+            self._whitespace_before_token,
+        ) = self._patterns.whitespace.measure(resulting_string)
+        return resulting_string
@@ -23,11 +23,14 @@
 # SOFTWARE.
 
 import re
+from collections import deque
 from ..core.inputscanner import InputScanner
 from ..core.token import Token
 
 
 class TokenStream:
+    __slots__ = ("__tokens", "__tokens_length", "__position", "__parent_token")
+
     def __init__(self, parent_token=None):
         self.__tokens = []
         self.__tokens_length = len(self.__tokens)
@@ -72,3 +75,68 @@ class TokenStream:
 
     def __next__(self):
         return self.next()
+
+
+class LazyTokenStream:
+    # A TokenStream over a token iterator. Tokens are pulled as they are
+    # needed; peek() with a negative index only reaches back `history`
+    # tokens. Each token dropped from the history is passed to `release`.
+    __slots__ = ("__source", "__ahead", "__behind", "__history", "__release")
+
+    def __init__(self, tokens, history=8, release=None):
+        self.__source = iter(tokens)
+        self.__ahead = deque()
+        self.__behind = deque()
+        self.__history = history
+        self.__release = release
+
+    def __fill(self, count):
+        while len(self.__ahead) < count and self.__source is not None:
+            try:
+                self.__ahead.append(next(self.__source))
+            except StopIteration:
+                self.__source = None
+
+    def isEmpty(self):
+        return not self.__behind and not self.hasNext()
+
+    def hasNext(self):
+        if not self.__ahead:
+            self.__fill(1)
+        return len(self.__ahead) > 0
+
+    def next(self):
+        ahead = self.__ahead
+        if not ahead:
+            self.__fill(1)
+            if not ahead:
+                raise StopIteration
+
+        val = ahead.popleft()
+        behind = self.__behind
+        behind.append(val)
+        if len(behind) > self.__history:
+            dropped = behind.popleft()
+            if self.__release is not None:
+                self.__release(dropped)
+        return val
+
+    def peek(self, index=0):
+        val = None
+        if index >= 0:
+            self.__fill(index + 1)
+            if index < len(self.__ahead):
+                val = self.__ahead[index]
+        else:
+            if -index > self.__history:
+                raise IndexError("peek(" + str(index) + ") is beyond the history")
+            index += len(self.__behind)
+            if index >= 0:
+                val = self.__behind[index]
+
+        return val
+
+    def __iter__(self):
+        return self
+
+    __next__ = next
@@ -23,45 +23,47 @@
 # SOFTWARE.
 
 import re
+from ..core.inputscanner import InputScanner
 from ..core.pattern import Pattern
 
 __all__ = ["WhitespacePattern"]
 
 
 class WhitespacePattern(Pattern):
-    def __init__(self, input_scanner, parent=None):
-        Pattern.__init__(self, input_scanner, parent)
+    def __init__(self, parent=None):
+        Pattern.__init__(self, parent)
 
         if parent is not None:
-            self._newline_regexp = self._input.get_regexp(parent._newline_regexp)
+            self._newline_regexp = parent._newline_regexp
         else:
             self.__set_whitespace_patterns("", "")
 
-        self.newline_count = 0
-        self.whitespace_before_token = ""
-
     def __set_whitespace_patterns(self, whitespace_chars, newline_chars):
         whitespace_chars += "\\t "
         newline_chars += "\\n\\r"
 
-        self._match_pattern = self._input.get_regexp(
+        self._match_pattern = InputScanner.get_regexp(
             "[" + whitespace_chars + newline_chars + "]+"
         )
-        self._newline_regexp = self._input.get_regexp("\\r\\n|[" + newline_chars + "]")
+        self._newline_regexp = InputScanner.get_regexp("\\r\\n|[" + newline_chars + "]")
+
+    def read(self, input_scanner):
+        return input_scanner.read(self._match_pattern)
 
-    def read(self):
-        self.newline_count = 0
-        self.whitespace_before_token = ""
+    def measure(self, whitespace):
+        # Returns the number of newlines in whitespace read by this pattern
+        # and the whitespace following the last of them.
+        newline_count = 0
+        whitespace_before_token = ""
 
-        resulting_string = self._input.read(self._match_pattern)
-        if resulting_string == " ":
-            self.whitespace_before_token = " "
-        elif bool(resulting_string):
-            lines = self._newline_regexp.split(resulting_string)
-            self.newline_count = len(lines) - 1
-            self.whitespace_before_token = lines[-1]
+        if whitespace == " ":
+            whitespace_before_token = " "
+        elif bool(whitespace):
+            lines = self._newline_regexp.split(whitespace)
+            newline_count = len(lines) - 1
+            whitespace_before_token = lines[-1]
 
-        return resulting_string
+        return newline_count, whitespace_before_token
 
     def matching(self, whitespace_chars, newline_chars):
         result = self._create()
@@ -70,4 +72,4 @@ class WhitespacePattern(Pattern):
         return result
 
     def _create(self):
-        return WhitespacePattern(self._input, self)
+        return WhitespacePattern(self)
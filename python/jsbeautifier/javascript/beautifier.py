@@ -26,7 +26,7 @@ import re
 import string
 import copy
 from ..core.token import Token
-from .tokenizer import Tokenizer
+from .tokenizer import Tokenizer, MasterRegexTokenizer
 from .tokenizer import TOKEN
 from .options import BeautifierOptions
 from ..core.output import Output
@@ -96,17 +96,21 @@ class MODE:
     ) = range(7)
 
 
+def keeps_redundant_indentation(frame):
+    return (
+        frame.multiline_frame
+        or frame.mode == MODE.ForInitializer
+        or frame.mode == MODE.Conditional
+    )
+
+
 def remove_redundant_indentation(output, frame):
     # This implementation is effective but has some issues:
     #     - can cause line wrap to happen too soon due to indent removal
     #           after wrap points are calculated
     # These issues are minor compared to ugly indentation.
 
-    if (
-        frame.multiline_frame
-        or frame.mode == MODE.ForInitializer
-        or frame.mode == MODE.Conditional
-    ):
+    if keeps_redundant_indentation(frame):
         return
 
     # remove one indent from each line inside this section
@@ -143,10 +147,73 @@ class Beautifier:
 
         self.acorn = acorn
         self._options = BeautifierOptions(opts)
+        self._tokenizer = None
 
+        self._build_handlers()
         self._blank_state()
 
-    def _blank_state(self, js_source_text=None):
+    def _build_handlers(self):
+        # handle_token looks the handler up by token type
+        self._handlers = {
+            TOKEN.START_EXPR: self.handle_start_expr,
+            TOKEN.END_EXPR: self.handle_end_expr,
+            TOKEN.START_BLOCK: self.handle_start_block,
+            TOKEN.END_BLOCK: self.handle_end_block,
+            TOKEN.WORD: self.handle_word,
+            TOKEN.RESERVED: self.handle_word,
+            TOKEN.SEMICOLON: self.handle_semicolon,
+            TOKEN.STRING: self.handle_string,
+            TOKEN.EQUALS: self.handle_equals,
+            TOKEN.OPERATOR: self.handle_operator,
+            TOKEN.COMMA: self.handle_comma,
+            TOKEN.DOT: self.handle_dot,
+            TOKEN.EOF: self.handle_eof,
+        }
+        self._handlers_with_flags = {
+            TOKEN.BLOCK_COMMENT: self.handle_block_comment,
+            TOKEN.COMMENT: self.handle_comment,
+            TOKEN.UNKNOWN: self.handle_unknown,
+        }
+
+    # Methods timed when beautify() is given a BeautifierStats with
+    # profile_handlers
+    _profiled_methods = (
+        "handle_token",
+        "handle_whitespace_and_comments",
+        "handle_start_expr",
+        "handle_end_expr",
+        "handle_start_block",
+        "handle_end_block",
+        "handle_word",
+        "handle_semicolon",
+        "handle_string",
+        "handle_equals",
+        "handle_operator",
+        "handle_comma",
+        "handle_block_comment",
+        "handle_comment",
+        "handle_dot",
+        "handle_unknown",
+        "handle_eof",
+        "allow_wrap_or_preserved_newline",
+        "print_newline",
+        "print_token",
+        "restore_mode",
+    )
+
+    def _start_profile(self, profile):
+        # Shadow the methods with timed wrappers on this instance only, so
+        # an unprofiled call pays nothing
+        for name in self._profiled_methods:
+            setattr(self, name, profile.wrap(getattr(self, name)))
+        self._build_handlers()
+
+    def _stop_profile(self):
+        for name in self._profiled_methods:
+            self.__dict__.pop(name, None)
+        self._build_handlers()
+
+    def _blank_state(self, js_source_text=None, sink=None):
         if js_source_text is None:
             js_source_text = ""
 
@@ -156,15 +223,18 @@ class Beautifier:
         self._flag_store = []
         self._tokens = None
 
-        if self._options.eol == "auto":
-            self._options.eol = "\n"
+        # Detect into a local field, so the options stay reusable for the
+        # next input given to this beautifier.
+        self._eol = self._options.eol
+        if self._eol == "auto":
+            self._eol = "\n"
             if self.acorn.lineBreak.search(js_source_text or ""):
-                self._options.eol = self.acorn.lineBreak.search(js_source_text).group()
+                self._eol = self.acorn.lineBreak.search(js_source_text).group()
 
         baseIndentString = re.search("^[\t ]*", js_source_text).group(0)
         self._last_last_text = ""  # pre-last token text
 
-        self._output = Output(self._options, baseIndentString)
+        self._output = Output(self._options, baseIndentString, sink)
         # If testing the ignore directive, start with output disable set to
         # true
         self._output.raw = self._options.test_output_raw
@@ -172,65 +242,108 @@ class Beautifier:
         self.set_mode(MODE.BlockStatement)
         return js_source_text
 
-    def beautify(self, source_text="", opts=None):
+    def beautify(self, source_text="", opts=None, sink=None, stats=None):
+        # With a sink, the result is written to it as it is produced and
+        # an empty string is returned. With a BeautifierStats, the phases of
+        # this call are timed and counted into it.
         if opts is not None:
             self._options = BeautifierOptions(opts)
+            self._tokenizer = None
 
         source_text = source_text or ""
         if self._options.disabled:
+            if sink is not None:
+                sink.write(source_text)
+                return ""
             return source_text
 
-        source_text = self._blank_state(source_text)
+        recorder = None
+        if stats is not None:
+            recorder = stats.begin()
 
-        source_text = self.unpack(source_text, self._options.eval_code)
+        source_text = self._blank_state(source_text, sink)
+        if recorder is not None:
+            recorder.lap("setup")
 
-        self._tokens = Tokenizer(source_text, self._options).tokenize()
+        if self._options.unpack:
+            source_text = self.unpack(source_text, self._options.eval_code)
+        if recorder is not None:
+            recorder.lap("unpack")
 
+        # The tokenizer patterns only depend on the options, so keep them
+        # compiled between calls and just hand over the new source text.
+        if self._tokenizer is None:
+            if self._options.tokenizer == "master-regex":
+                self._tokenizer = MasterRegexTokenizer(source_text, self._options)
+            else:
+                self._tokenizer = Tokenizer(source_text, self._options)
+        else:
+            self._tokenizer.set_input(source_text)
+
+        # Tokens are produced as they are handled and dropped once they are
+        # out of the lookback window, so the whole token graph of a large
+        # file is never in memory at once.
+        self._tokens = self._tokenizer.stream(
+            recorder.tokens if recorder is not None else None
+        )
+
+        profile = stats.handlers if stats is not None else None
+        if profile is not None:
+            self._start_profile(profile)
+        try:
+            self._handle_tokens(sink)
+        finally:
+            if profile is not None:
+                self._stop_profile()
+
+        if recorder is not None:
+            recorder.lap("handle")
+
+        sweet_code = self._output.get_code(self._eol)
+
+        if recorder is not None:
+            recorder.lap("output")
+            recorder.finish(self._output)
+
+        return sweet_code
+
+    def _handle_tokens(self, sink):
+        commit_at_line = self._commit_batch_size
         for current_token in self._tokens:
             self.handle_token(current_token)
 
             self._last_last_text = self._flags.last_token.text
             self._flags.last_token = current_token
 
-        sweet_code = self._output.get_code(self._options.eol)
+            if sink is not None and self._output.get_line_number() >= commit_at_line:
+                self._output.commit(self._committable_line_index(), self._eol)
+                commit_at_line = (
+                    self._output.get_line_number() + self._commit_batch_size
+                )
 
-        return sweet_code
+    # Lines added between attempts to write output to a sink
+    _commit_batch_size = 100
+
+    def _committable_line_index(self):
+        # Closing a frame may remove an indent from every line since the
+        # frame started, so nothing from the start of the oldest open frame
+        # that could still need it can be written yet. The outermost frame
+        # is never closed.
+        line_index = self._output.get_line_number()
+        if self._flag_store:
+            for frame in self._flag_store[1:] + [self._flags]:
+                if not keeps_redundant_indentation(frame):
+                    line_index = min(line_index, frame.start_line_index)
+        return line_index
 
     def handle_token(self, current_token, preserve_statement_flags=False):
-        if current_token.type == TOKEN.START_EXPR:
-            self.handle_start_expr(current_token)
-        elif current_token.type == TOKEN.END_EXPR:
-            self.handle_end_expr(current_token)
-        elif current_token.type == TOKEN.START_BLOCK:
-            self.handle_start_block(current_token)
-        elif current_token.type == TOKEN.END_BLOCK:
-            self.handle_end_block(current_token)
-        elif current_token.type == TOKEN.WORD:
-            self.handle_word(current_token)
-        elif current_token.type == TOKEN.RESERVED:
-            self.handle_word(current_token)
-        elif current_token.type == TOKEN.SEMICOLON:
-            self.handle_semicolon(current_token)
-        elif current_token.type == TOKEN.STRING:
-            self.handle_string(current_token)
-        elif current_token.type == TOKEN.EQUALS:
-            self.handle_equals(current_token)
-        elif current_token.type == TOKEN.OPERATOR:
-            self.handle_operator(current_token)
-        elif current_token.type == TOKEN.COMMA:
-            self.handle_comma(current_token)
-        elif current_token.type == TOKEN.BLOCK_COMMENT:
-            self.handle_block_comment(current_token, preserve_statement_flags)
-        elif current_token.type == TOKEN.COMMENT:
-            self.handle_comment(current_token, preserve_statement_flags)
-        elif current_token.type == TOKEN.DOT:
-            self.handle_dot(current_token)
-        elif current_token.type == TOKEN.EOF:
-            self.handle_eof(current_token)
-        elif current_token.type == TOKEN.UNKNOWN:
-            self.handle_unknown(current_token, preserve_statement_flags)
+        handler = self._handlers.get(current_token.type)
+        if handler is not None:
+            handler(current_token)
         else:
-            self.handle_unknown(current_token, preserve_statement_flags)
+            self._handlers_with_flags.get(current_token.type, self.handle_unknown)(
+                current_token, preserve_statement_flags
+            )
 
     def handle_whitespace_and_comments(
         self, current_token, preserve_statement_flags=False
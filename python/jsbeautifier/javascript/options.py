@@ -26,6 +26,7 @@
 from ..core.options import Options as BaseOptions
 
 OPERATOR_POSITION = ["before-newline", "after-newline", "preserve-newline"]
+TOKENIZER = ["default", "master-regex"]
 
 
 class BeautifierOptions(BaseOptions):
@@ -90,6 +91,9 @@ class BeautifierOptions(BaseOptions):
         self.operator_position = self._get_selection(
             "operator_position", OPERATOR_POSITION
         )
+        self.tokenizer = self._get_selection("tokenizer", TOKENIZER)
+        # Look for packed or obfuscated scripts and unpack them first
+        self.unpack = self._get_boolean("unpack", True)
 
         # For testing of beautify preserve:start directive
         self.test_output_raw = False
@@ -24,6 +24,7 @@
 
 import re
 from ..core.inputscanner import InputScanner
+from ..core.tokenizer import TokenType
 from ..core.tokenizer import TokenTypes as BaseTokenTypes
 from ..core.tokenizer import Tokenizer as BaseTokenizer
 from ..core.tokenizer import TokenizerPatterns as BaseTokenizerPatterns
@@ -32,26 +33,25 @@ from ..core.directives import Directives
 from ..core.pattern import Pattern
 from ..core.templatablepattern import TemplatablePattern
 
-
-__all__ = ["TOKEN", "Tokenizer", "TokenTypes"]
+__all__ = ["TOKEN", "Tokenizer", "MasterRegexTokenizer", "TokenTypes"]
 
 
 class TokenTypes(BaseTokenTypes):
-    START_EXPR = "TK_START_EXPR"
-    END_EXPR = "TK_END_EXPR"
-    START_BLOCK = "TK_START_BLOCK"
-    END_BLOCK = "TK_END_BLOCK"
-    WORD = "TK_WORD"
-    RESERVED = "TK_RESERVED"
-    SEMICOLON = "TK_SEMICOLON"
-    STRING = "TK_STRING"
-    EQUALS = "TK_EQUALS"
-    OPERATOR = "TK_OPERATOR"
-    COMMA = "TK_COMMA"
-    BLOCK_COMMENT = "TK_BLOCK_COMMENT"
-    COMMENT = "TK_COMMENT"
-    DOT = "TK_DOT"
-    UNKNOWN = "TK_UNKNOWN"
+    START_EXPR = TokenType(3, "TK_START_EXPR")
+    END_EXPR = TokenType(4, "TK_END_EXPR")
+    START_BLOCK = TokenType(5, "TK_START_BLOCK")
+    END_BLOCK = TokenType(6, "TK_END_BLOCK")
+    WORD = TokenType(7, "TK_WORD")
+    RESERVED = TokenType(8, "TK_RESERVED")
+    SEMICOLON = TokenType(9, "TK_SEMICOLON")
+    STRING = TokenType(10, "TK_STRING")
+    EQUALS = TokenType(11, "TK_EQUALS")
+    OPERATOR = TokenType(12, "TK_OPERATOR")
+    COMMA = TokenType(13, "TK_COMMA")
+    BLOCK_COMMENT = TokenType(14, "TK_BLOCK_COMMENT")
+    COMMENT = TokenType(15, "TK_COMMENT")
+    DOT = TokenType(16, "TK_DOT")
+    UNKNOWN = TokenType(17, "TK_UNKNOWN")
 
     def __init__(self):
         pass
@@ -128,8 +128,8 @@ xmlRegExp = re.compile(
 
 
 class TokenizerPatterns(BaseTokenizerPatterns):
-    def __init__(self, input_scanner, acorn, options):
-        BaseTokenizerPatterns.__init__(self, input_scanner)
+    def __init__(self, acorn, options):
+        BaseTokenizerPatterns.__init__(self)
 
         # This is not pretty, but given how we did the version import
         # it is the only way to do this without having setup.py fail on a missing
@@ -142,8 +142,8 @@ class TokenizerPatterns(BaseTokenizerPatterns):
             six.u(r"\u2028\u2029"),
         )
 
-        pattern = Pattern(input_scanner)
-        templatable = TemplatablePattern(input_scanner).read_options(options)
+        pattern = Pattern()
+        templatable = TemplatablePattern().read_options(options)
 
         self.identifier = templatable.starting_with(acorn.identifier).matching(
             acorn.identifierMatch
@@ -164,6 +164,52 @@ class TokenizerPatterns(BaseTokenizerPatterns):
         self.template_text = templatable.until(r"[`\\$]")
         self.template_expression = templatable.until(r"[`}\\]")
 
+        # Templates may appear inside words and strings, so the master regex
+        # is only available when templating is off.
+        self.master = None
+        if not any(
+            language in options.templating
+            for language in ["django", "erb", "handlebars", "php", "smarty", "angular"]
+        ):
+            self.master = re.compile(
+                "|".join(
+                    "(?P<" + name + ">" + source + ")"
+                    for name, source in [
+                        ("word", acorn.identifier.pattern),
+                        ("number", number_pattern.pattern),
+                        (
+                            "string",
+                            six.u(
+                                r"'[^'\\\n\r\u2028\u2029]*'|\"[^\"\\\n\r\u2028\u2029]*\""
+                            ),
+                        ),
+                        ("dot", r"\.(?=[^\d\.])"),
+                        ("start_expr", r"[(\[]"),
+                        ("end_expr", r"[)\]]"),
+                        ("start_block", r"{"),
+                        ("end_block", r"}"),
+                        ("semicolon", r";"),
+                        ("comma", r","),
+                        ("punct", punct_pattern.pattern),
+                    ]
+                )
+            )
+
+
+# Patterns do not hold on to the text they read, so the compiled set for a
+# given templating configuration is built once per process and shared by
+# every Tokenizer.
+_patterns_cache = {}
+
+
+def _get_patterns(acorn, options):
+    key = frozenset(options.templating)
+    patterns = _patterns_cache.get(key)
+    if patterns is None:
+        patterns = TokenizerPatterns(acorn, options)
+        _patterns_cache[key] = patterns
+    return patterns
+
 
 class Tokenizer(BaseTokenizer):
     positionable_operators = positionable_operators
@@ -179,7 +225,7 @@ class Tokenizer(BaseTokenizer):
         self.in_html_comment = False
         self.has_char_escapes = False
 
-        self._patterns = TokenizerPatterns(self._input, self.acorn, opts)
+        self._patterns = _get_patterns(self.acorn, opts)
 
     def _reset(self):
         self.in_html_comment = False
@@ -211,27 +257,23 @@ class Tokenizer(BaseTokenizer):
         )
 
     def _get_next_token(self, previous_token, open_token):
-        token = None
         self._readWhitespace()
 
         c = self._input.peek()
         if c is None:
-            token = self._create_token(TOKEN.EOF, "")
-
-        token = token or self._read_non_javascript(c)
-        token = token or self._read_string(c)
-        token = token or self._read_pair(
-            c, self._input.peek(1)
-        )  # Issue #2062 hack for record type '#{'
-        token = token or self._read_word(previous_token)
-        token = token or self._read_singles(c)
-        token = token or self._read_comment(c)
-        token = token or self._read_regexp(c, previous_token)
-        token = token or self._read_xml(c, previous_token)
-        token = token or self._read_punctuation()
-        token = token or self._create_token(TOKEN.UNKNOWN, self._input.next())
+            return self._create_token(TOKEN.EOF, "")
 
-        return token
+        return self._read_token(c, previous_token)
+
+    def _read_token(self, c, previous_token):
+        token = None
+        # only try the readers that can start with this character
+        for reader in _readers_by_char.get(c, _all_readers):
+            token = reader(self, c, previous_token)
+            if token:
+                break
+
+        return token or self._create_token(TOKEN.UNKNOWN, self._input.next())
 
     def _read_singles(self, c):
         token = None
@@ -273,38 +315,40 @@ class Tokenizer(BaseTokenizer):
         return token
 
     def _read_word(self, previous_token):
-        resulting_string = self._patterns.identifier.read()
+        resulting_string = self._patterns.identifier.read(self._input)
 
         if bool(resulting_string):
             resulting_string = re.sub(self.acorn.allLineBreaks, "\n", resulting_string)
-            if not (
-                previous_token.type == TOKEN.DOT
-                or (
-                    previous_token.type == TOKEN.RESERVED
-                    and (previous_token.text == "set" or previous_token.text == "get")
-                )
-            ) and reserved_word_pattern.match(resulting_string):
-                if (resulting_string == "in" or resulting_string == "of") and (
-                    previous_token.type == TOKEN.WORD
-                    or previous_token.type == TOKEN.STRING
-                ):
-                    # in and of are operators, need to hack
-                    return self._create_token(TOKEN.OPERATOR, resulting_string)
-
-                return self._create_token(TOKEN.RESERVED, resulting_string)
-
-            return self._create_token(TOKEN.WORD, resulting_string)
+            return self._create_word_token(resulting_string, previous_token)
 
-        resulting_string = self._patterns.number.read()
+        resulting_string = self._patterns.number.read(self._input)
         if resulting_string != "":
             return self._create_token(TOKEN.WORD, resulting_string)
 
+    def _create_word_token(self, resulting_string, previous_token):
+        if not (
+            previous_token.type == TOKEN.DOT
+            or (
+                previous_token.type == TOKEN.RESERVED
+                and (previous_token.text == "set" or previous_token.text == "get")
+            )
+        ) and reserved_word_pattern.match(resulting_string):
+            if (resulting_string == "in" or resulting_string == "of") and (
+                previous_token.type == TOKEN.WORD or previous_token.type == TOKEN.STRING
+            ):
+                # in and of are operators, need to hack
+                return self._create_token(TOKEN.OPERATOR, resulting_string)
+
+            return self._create_token(TOKEN.RESERVED, resulting_string)
+
+        return self._create_token(TOKEN.WORD, resulting_string)
+
     def _read_comment(self, c):
         token = None
         if c == "/":
             comment = ""
             if self._input.peek(1) == "*":  # peek /* .. */ comment
-                comment = self._patterns.block_comment.read()
+                comment = self._patterns.block_comment.read(self._input)
 
                 directives = directives_core.get_directives(comment)
                 if directives and directives.get("ignore") == "start":
@@ -314,7 +358,7 @@ class Tokenizer(BaseTokenizer):
                 token.directives = directives
 
             elif self._input.peek(1) == "/":  # peek // comment
-                comment = self._patterns.comment.read()
+                comment = self._patterns.comment.read(self._input)
                 token = self._create_token(TOKEN.COMMENT, comment)
 
         return token
@@ -381,7 +425,7 @@ class Tokenizer(BaseTokenizer):
         if self._options.e4x and c == "<" and self.allowRegExOrXML(previous_token):
             # handle e4x xml literals
             xmlStr = ""
-            match = self._patterns.xml.read_match()
+            match = self._patterns.xml.read_match(self._input)
             if match and not match.group(1):
                 rootTag = match.group(2)
                 rootTag = re.sub(r"^{\s+", "{", re.sub(r"\s+}$", "}", rootTag))
@@ -409,7 +453,7 @@ class Tokenizer(BaseTokenizer):
                     if depth <= 0:
                         break
 
-                    match = self._patterns.xml.read_match()
+                    match = self._patterns.xml.read_match(self._input)
 
                 # if we didn't close correctly, keep unformatted.
                 if not match:
@@ -426,14 +470,14 @@ class Tokenizer(BaseTokenizer):
         if c == "#":
             # she-bang
             if self._is_first_token():
-                resulting_string = self._patterns.shebang.read()
+                resulting_string = self._patterns.shebang.read(self._input)
                 if resulting_string:
                     return self._create_token(
                         TOKEN.UNKNOWN, resulting_string.strip() + "\n"
                     )
 
             # handles extendscript #includes
-            resulting_string = self._patterns.include.read()
+            resulting_string = self._patterns.include.read(self._input)
 
             if resulting_string:
                 return self._create_token(
@@ -469,7 +513,7 @@ class Tokenizer(BaseTokenizer):
             self._input.back()
 
         elif c == "<" and self._is_first_token():
-            if self._patterns.html_comment_start.read():
+            if self._patterns.html_comment_start.read(self._input):
                 c = "<!--"
                 while self._input.hasNext() and not self._input.testChar(
                     self.acorn.newline
@@ -480,7 +524,9 @@ class Tokenizer(BaseTokenizer):
                 return self._create_token(TOKEN.COMMENT, c)
 
         elif (
-            c == "-" and self.in_html_comment and self._patterns.html_comment_end.read()
+            c == "-"
+            and self.in_html_comment
+            and self._patterns.html_comment_end.read(self._input)
         ):
             self.in_html_comment = False
             return self._create_token(TOKEN.COMMENT, "-->")
@@ -489,17 +535,20 @@ class Tokenizer(BaseTokenizer):
 
     def _read_punctuation(self):
         token = None
-        resulting_string = self._patterns.punct.read()
+        resulting_string = self._patterns.punct.read(self._input)
         if resulting_string != "":
-            if resulting_string == "=":
-                token = self._create_token(TOKEN.EQUALS, resulting_string)
-            elif resulting_string == "?.":
-                token = self._create_token(TOKEN.DOT, resulting_string)
-            else:
-                token = self._create_token(TOKEN.OPERATOR, resulting_string)
+            token = self._create_punctuation_token(resulting_string)
 
         return token
 
+    def _create_punctuation_token(self, resulting_string):
+        if resulting_string == "=":
+            return self._create_token(TOKEN.EQUALS, resulting_string)
+        elif resulting_string == "?.":
+            return self._create_token(TOKEN.DOT, resulting_string)
+        else:
+            return self._create_token(TOKEN.OPERATOR, resulting_string)
+
     __regexTokens = {
         TOKEN.COMMENT,
         TOKEN.START_EXPR,
@@ -538,7 +587,7 @@ class Tokenizer(BaseTokenizer):
             pattern = self._patterns.template_text
         elif delimiter == "}":
             pattern = self._patterns.template_expression
-        resulting_string = pattern.read()
+        resulting_string = pattern.read(self._input)
         next = ""
         while self._input.hasNext():
             next = self._input.next()
@@ -568,7 +617,7 @@ class Tokenizer(BaseTokenizer):
                     if self._input.hasNext():
                         next += self._input.next()
 
-            next += pattern.read()
+            next += pattern.read(self._input)
             resulting_string += next
         return resulting_string
 
@@ -632,3 +681,118 @@ class Tokenizer(BaseTokenizer):
                 out += self.acorn.six.unichr(escaped)
 
         return out
+
+
+class MasterRegexTokenizer(Tokenizer):
+    # Reads context-free tokens with a single match of one combined regex.
+    # Characters whose meaning depends on context (regex literals and
+    # comments, template strings, e4x, #-prefixed and html comment tokens)
+    # and anything the regex does not match go to the regular readers.
+    def _read_token(self, c, previous_token):
+        if self._patterns.master is not None and not (
+            c in "#`/"
+            or (c == "<" and (self._options.e4x or self._is_first_token()))
+            or (c == "-" and self.in_html_comment)
+        ):
+            match = self._input.match(self._patterns.master)
+            if match:
+                kind = match.lastgroup
+                resulting_string = match.group(0)
+                if kind == "word":
+                    return self._create_word_token(resulting_string, previous_token)
+                elif kind == "punct":
+                    return self._create_punctuation_token(resulting_string)
+                return self._create_token(_master_token_types[kind], resulting_string)
+
+        return Tokenizer._read_token(self, c, previous_token)
+
+
+_master_token_types = {
+    "number": TOKEN.WORD,
+    "string": TOKEN.STRING,
+    "dot": TOKEN.DOT,
+    "start_expr": TOKEN.START_EXPR,
+    "end_expr": TOKEN.END_EXPR,
+    "start_block": TOKEN.START_BLOCK,
+    "end_block": TOKEN.END_BLOCK,
+    "semicolon": TOKEN.SEMICOLON,
+    "comma": TOKEN.COMMA,
+}
+
+
+# Adapters giving each reader the same signature for the dispatch table.
+def _read_non_javascript(tokenizer, c, previous_token):
+    return tokenizer._read_non_javascript(c)
+
+
+def _read_string(tokenizer, c, previous_token):
+    return tokenizer._read_string(c)
+
+
+def _read_pair(tokenizer, c, previous_token):
+    # Issue #2062 hack for record type '#{'
+    return tokenizer._read_pair(c, tokenizer._input.peek(1))
+
+
+def _read_word(tokenizer, c, previous_token):
+    return tokenizer._read_word(previous_token)
+
+
+def _read_singles(tokenizer, c, previous_token):
+    return tokenizer._read_singles(c)
+
+
+def _read_comment(tokenizer, c, previous_token):
+    return tokenizer._read_comment(c)
+
+
+def _read_regexp(tokenizer, c, previous_token):
+    return tokenizer._read_regexp(c, previous_token)
+
+
+def _read_xml(tokenizer, c, previous_token):
+    return tokenizer._read_xml(c, previous_token)
+
+
+def _read_punctuation(tokenizer, c, previous_token):
+    return tokenizer._read_punctuation()
+
+
+# The full chain, in order. Used for any character not in the table below,
+# which covers non-ASCII identifiers and anything unexpected.
+_all_readers = (
+    _read_non_javascript,
+    _read_string,
+    _read_pair,
+    _read_word,
+    _read_singles,
+    _read_comment,
+    _read_regexp,
+    _read_xml,
+    _read_punctuation,
+)
+
+# First character -> the readers that can match it, in chain order.
+# Words include identifiers (which may start with # $ @ or a \u escape),
+# numbers (which may start with .), and templates (which start with < or {).
+_readers_by_char = {}
+
+
+def _add_readers(chars, readers):
+    for c in chars:
+        _readers_by_char[c] = readers
+
+
+_add_readers(
+    "$@\\_0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    (_read_word,),
+)
+_add_readers("`'\"", (_read_string,))
+_add_readers("()[]};,", (_read_singles,))
+_add_readers("{", (_read_word, _read_singles))
+_add_readers(".", (_read_word, _read_singles, _read_punctuation))
+_add_readers("#", (_read_non_javascript, _read_pair, _read_word))
+_add_readers("<", (_read_non_javascript, _read_word, _read_xml, _read_punctuation))
+_add_readers("-", (_read_non_javascript, _read_punctuation))
+_add_readers("/", (_read_comment, _read_regexp, _read_punctuation))
+_add_readers("=!?>:^+*&%~|", (_read_punctuation,))
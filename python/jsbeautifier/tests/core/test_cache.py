@@ -0,0 +1,72 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import jsbeautifier
+from ...core.cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hit_skips_beautify(self):
+        calls = []
+
+        def beautify(source_text, opts):
+            calls.append(source_text)
+            return jsbeautifier.beautify(source_text, opts)
+
+        cache = ResultCache(self.directory)
+        options = jsbeautifier.default_options()
+        self.assertEqual(cache.beautify(beautify, "a=1", options), "a = 1")
+        self.assertEqual(cache.beautify(beautify, "a=1", options), "a = 1")
+        self.assertEqual(calls, ["a=1"])
+
+        options.indent_size = 2
+        cache.beautify(beautify, "a=1", options)
+        self.assertEqual(len(calls), 2)
+
+        # entries persist for a new cache on the same directory
+        cache = ResultCache(self.directory)
+        sink = io.StringIO()
+        self.assertEqual(cache.beautify(beautify, "a=1", options, sink), "")
+        self.assertEqual(sink.getvalue(), "a = 1")
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cache.info().hits, 1)
+
+    def test_key(self):
+        cache = ResultCache(self.directory)
+        key = cache.key(jsbeautifier.beautify, "a", {"indent_size": 2})
+
+        self.assertEqual(key, cache.key(jsbeautifier.beautify, "a", {"indent-size": 2}))
+        self.assertNotEqual(
+            key, cache.key(jsbeautifier.beautify, "a", {"indent_size": 3})
+        )
+        self.assertNotEqual(
+            key, cache.key(jsbeautifier.beautify, "b", {"indent_size": 2})
+        )
+        self.assertNotEqual(
+            key, cache.key(jsbeautifier.beautify_file, "a", {"indent_size": 2})
+        )
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(self.directory, maxsize=10)
+        cache.put("a" * 64, "1234")
+        cache.put("b" * 64, "1234")
+        self.assertEqual(cache.get("a" * 64), "1234")
+        cache.put("c" * 64, "1234")
+
+        self.assertIsNone(cache.get("b" * 64))
+        self.assertEqual(cache.get("a" * 64), "1234")
+        self.assertEqual(cache.get("c" * 64), "1234")
+        self.assertFalse(os.path.exists(os.path.join(self.directory, "bb", "b" * 64)))
+        self.assertEqual(tuple(cache.info()), (3, 1, 1, 10, 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -172,11 +172,48 @@ class TestInputScanner(unittest.TestCase):
         patternmatch = self.inputscanner.readUntilAfter(pattern)
         self.assertEqual(patternmatch, "how")
 
+    def test_readUntilLiteral(self):
+        # should read up to the literal, or past it when include_match is true
+        self.assertEqual(self.inputscanner.readUntilLiteral("wd"), "ho")
+        self.assertEqual(self.inputscanner.readUntilLiteral("d", True), "wd")
+        self.assertEqual(self.inputscanner.readUntilLiteral("z"), "y")
+        self.assertEqual(self.inputscanner.hasNext(), False)
+
+        # should read nothing if a stop character comes first
+        self.inputscanner.restart()
+        self.assertEqual(self.inputscanner.readUntilLiteral("y", False, "w"), None)
+        self.assertEqual(self.inputscanner.peek(), "h")
+        self.assertEqual(self.inputscanner.readUntilLiteral("w", False, "y"), "ho")
+
     def test_get_regexp(self):
         # should return regex pattern for string passed
         pattern = re.compile(r"ow")
         self.assertEqual(self.inputscanner.get_regexp("ow"), pattern)
 
+    def test_get_regexp_cache(self):
+        # should compile each (pattern, flags) once and count hits and misses
+        before = InputScanner.get_regexp_cache_info()
+        first = InputScanner.get_regexp(r"cache[-]test")
+        second = InputScanner.get_regexp(r"cache[-]test")
+        ignorecase = InputScanner.get_regexp(r"cache[-]test", flags=re.I)
+        after = InputScanner.get_regexp_cache_info()
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, ignorecase)
+        self.assertEqual(after.hits - before.hits, 1)
+        self.assertEqual(after.misses - before.misses, 2)
+        self.assertLessEqual(after.currsize, after.maxsize)
+
+        # compiled patterns are reused, flags included
+        pattern = re.compile(r"HOW", re.I)
+        self.assertIs(InputScanner.get_regexp(pattern), pattern)
+
+    def test_get_literal_regexp(self):
+        # should match the literal text, special characters included
+        pattern = InputScanner.get_literal_regexp("^^(.)")
+        self.assertEqual(pattern.search("a ^^(.) b").group(0), "^^(.)")
+        self.assertIsNone(pattern.search("^^(a)"))
+
     def test_peekUntilAfter(self):
         # should return matched substring and retain index position
         pattern = re.compile(r"how")
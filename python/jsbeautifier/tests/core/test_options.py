@@ -67,6 +67,10 @@ class TestOptions(unittest.TestCase):
         self.assertEqual(
             Options({"a": "char"})._get_characters("a", "character"), "char"
         )
+        # should return default value for null option
+        self.assertEqual(
+            Options({"a": None})._get_characters("a", "character"), "character"
+        )
 
     def test__get_number(self):
         # should return default value since no option
@@ -79,6 +83,8 @@ class TestOptions(unittest.TestCase):
         self.assertEqual(Options({"a": "abc"})._get_number("a"), 0)
         # should return 0 for NaN as in default
         self.assertEqual(Options()._get_number("a", "abc"), 0)
+        # should return default value for null option
+        self.assertEqual(Options({"a": None})._get_number("a", 1), 1)
 
     def test__get_array(self):
         # should return [] with no option
@@ -91,6 +97,8 @@ class TestOptions(unittest.TestCase):
         )
         # should return [\'c\',\'d\'] as in option comma separated
         self.assertEqual(Options({"a": "c,d"})._get_array("a", ["a", "b"]), ["c", "d"])
+        # should return default value for null option
+        self.assertEqual(Options({"a": None})._get_array("a", ["a", "b"]), ["a", "b"])
 
     def test__is_valid_selection(self):
         # should return false with empty selection
@@ -0,0 +1,80 @@
+import io
+import os
+import unittest
+import jsbeautifier
+from ...core.options import Options
+from ...core.output import Output
+from ...javascript.beautifier import Beautifier
+
+
+class TestOutputSink(unittest.TestCase):
+    def setUp(self):
+        self.sink = io.StringIO()
+        self.output = Output(Options(), "", self.sink)
+        for text in ["a", "b", "c", "d"]:
+            self.output.add_token(text)
+            self.output.add_new_line()
+
+    def test_commit_watermark(self):
+        self.assertEqual(self.output.get_line_number(), 5)
+
+        # previous_line and the line before the last one with content stay
+        self.output.commit(5)
+        self.assertEqual(self.output.get_committed_line_number(), 2)
+        self.assertEqual(self.sink.getvalue(), "a\nb\n")
+
+        # never past the line the caller asks for
+        self.output.add_token("e")
+        self.output.add_new_line()
+        self.output.commit(3, "\r\n")
+        self.assertEqual(self.output.get_committed_line_number(), 3)
+        self.assertEqual(self.output.get_line_number(), 6)
+
+        self.assertEqual(self.output.get_code("\r\n"), "")
+        self.assertEqual(self.sink.getvalue(), "a\nb\nc\r\nd\r\ne")
+
+    def test_remove_indent_before_watermark(self):
+        self.output.commit(5)
+        self.assertRaises(ValueError, self.output.remove_indent, 1)
+
+
+class TestOutputLine(unittest.TestCase):
+    def test_has_match(self):
+        output = Output(Options())
+        output.add_token("{{#if")
+        output.space_before_token = True
+        output.add_token("a}}")
+        self.assertTrue(output.current_line.has_match(r"{{#if"))
+        self.assertTrue(output.current_line.has_match(r"a}"))
+        self.assertFalse(output.current_line.has_match(r"{{#each"))
+
+        output.add_new_line()
+        self.assertFalse(output.current_line.has_match(r"{{#if"))
+
+
+class TestBeautifierSink(unittest.TestCase):
+    def test_matches_beautify(self):
+        resources = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "..",
+            "..",
+            "..",
+            "..",
+            "test",
+            "resources",
+        )
+        with io.open(os.path.join(resources, "underscore.js"), encoding="UTF-8") as f:
+            source = f.read()
+
+        for options in [{}, {"comma_first": True, "brace_style": "expand"}]:
+            expected = jsbeautifier.beautify(source, options)
+
+            beautifier = Beautifier(options)
+            beautifier._commit_batch_size = 1
+            sink = io.StringIO()
+            self.assertEqual(beautifier.beautify(source, sink=sink), "")
+            self.assertEqual(sink.getvalue(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
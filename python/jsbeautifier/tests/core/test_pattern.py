@@ -0,0 +1,69 @@
+import unittest
+from ...core.inputscanner import InputScanner
+from ...core.pattern import Pattern
+from ...core.templatablepattern import TemplatablePattern
+from ...core.whitespacepattern import WhitespacePattern
+
+
+class TestPattern(unittest.TestCase):
+    def test_read_from_any_scanner(self):
+        pattern = Pattern().matching(r"[a-z]+")
+        first = InputScanner("abc def")
+        second = InputScanner("xyz")
+
+        self.assertEqual(pattern.read(first), "abc")
+        self.assertEqual(pattern.read(second), "xyz")
+        first.next()
+        self.assertEqual(pattern.read(first), "def")
+
+    def test_derived_patterns_are_independent(self):
+        pattern = Pattern()
+        comment = pattern.starting_with(r"/\*").until_after(r"\*/")
+        word = pattern.matching(r"\w+")
+        scanner = InputScanner("/* a */b")
+
+        self.assertEqual(word.read(scanner), "")
+        self.assertEqual(comment.read(scanner), "/* a */")
+        self.assertEqual(word.read(scanner), "b")
+
+    def test_read_match(self):
+        pattern = Pattern().matching(r"(\d+)-(\d+)")
+        scanner = InputScanner("12-34")
+        match = pattern.read_match(scanner)
+
+        self.assertEqual(match.group(2), "34")
+        self.assertFalse(scanner.hasNext())
+
+
+class TestWhitespacePattern(unittest.TestCase):
+    def test_measure(self):
+        pattern = WhitespacePattern()
+        scanner = InputScanner("  \n\n\t x")
+        whitespace = pattern.read(scanner)
+
+        self.assertEqual(whitespace, "  \n\n\t ")
+        self.assertEqual(pattern.measure(whitespace), (2, "\t "))
+        self.assertEqual(pattern.measure(" "), (0, " "))
+        self.assertEqual(pattern.measure(""), (0, ""))
+
+
+class TestTemplatablePattern(unittest.TestCase):
+    def test_read_skips_templates(self):
+        pattern = TemplatablePattern().disable("smarty").until(r"[;]")
+        scanner = InputScanner("a{{ b; }}c;")
+
+        self.assertEqual(pattern.read(scanner), "a{{ b; }}c")
+        self.assertEqual(pattern.read(InputScanner("x;")), "x")
+
+    def test_read_until_literal(self):
+        pattern = TemplatablePattern().disable("smarty").until_after(r'"')
+        value = "data:image/png;base64," + "A" * 1000
+
+        # plain text is read with str.find(), templates still fall back
+        self.assertEqual(pattern.read(InputScanner(value + '" b')), value + '"')
+        self.assertEqual(pattern.read(InputScanner('a{{ "b" }}c" d')), 'a{{ "b" }}c"')
+        self.assertEqual(pattern.read(InputScanner("a < b")), "a < b")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from ...core.token import Token
+from ...core.tokenstream import TokenStream, LazyTokenStream
+
+
+class TestLazyTokenStream(unittest.TestCase):
+    def setUp(self):
+        self.tokens = [Token("TK_WORD", str(i)) for i in range(10)]
+        self.released = []
+        self.stream = LazyTokenStream(
+            iter(self.tokens), history=3, release=self.released.append
+        )
+
+    def test_matches_token_stream(self):
+        eager = TokenStream()
+        for token in self.tokens:
+            eager.add(token)
+
+        while eager.hasNext():
+            self.assertTrue(self.stream.hasNext())
+            for index in [-3, -2, -1, 0, 1, 5]:
+                self.assertIs(self.stream.peek(index), eager.peek(index))
+            self.assertIs(self.stream.next(), eager.next())
+        self.assertFalse(self.stream.hasNext())
+        self.assertRaises(StopIteration, self.stream.next)
+
+    def test_history(self):
+        list(self.stream)
+        self.assertEqual(self.released, self.tokens[:7])
+        self.assertIs(self.stream.peek(-3), self.tokens[7])
+        self.assertRaises(IndexError, self.stream.peek, -4)
+
+    def test_empty(self):
+        self.assertTrue(LazyTokenStream(iter([])).isEmpty())
+        self.assertFalse(self.stream.isEmpty())
+
+
+if __name__ == "__main__":
+    unittest.main()
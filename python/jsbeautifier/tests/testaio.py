@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+import jsbeautifier
+import jsbeautifier.aio
+from jsbeautifier.core.aio import BeautifierPool
+
+
+class TestAio(unittest.TestCase):
+    options = {"indent_size": 2}
+    small = "if(a){b()}"
+    large = "function f(){if(a){b(c,d);}}\n" * 300
+
+    def setUp(self):
+        self.pool = BeautifierPool(jsbeautifier.formatter, workers=1, max_pending=1)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    async def wait_until_idle(self):
+        while self.pool.pending:
+            await asyncio.sleep(0.01)
+
+    def test_matches_beautify(self):
+        async def run():
+            return await asyncio.gather(
+                self.pool.beautify(self.small, self.options),
+                self.pool.beautify(self.large, self.options),
+                self.pool.beautify(self.large),
+            )
+
+        self.assertEqual(
+            self.run_async(run()),
+            [
+                jsbeautifier.beautify(self.small, self.options),
+                jsbeautifier.beautify(self.large, self.options),
+                jsbeautifier.beautify(self.large, None),
+            ],
+        )
+        self.assertEqual(self.pool.pending, 0)
+
+    def test_bounded_queue_and_cancel(self):
+        async def run():
+            tasks = [
+                asyncio.ensure_future(self.pool.beautify(self.large)) for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            # only the first one got to the workers, the others wait for it
+            self.assertEqual(self.pool.pending, 1)
+            tasks[1].cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            self.assertIsInstance(results[1], asyncio.CancelledError)
+            return [results[0], results[2]]
+
+        self.assertEqual(self.run_async(run()), [jsbeautifier.beautify(self.large)] * 2)
+        self.assertEqual(self.pool.pending, 0)
+
+    def test_timeout(self):
+        async def run():
+            with self.assertRaises(asyncio.TimeoutError):
+                await self.pool.beautify(self.large, timeout=0.001)
+            # the running input keeps its place until its worker is done
+            await self.wait_until_idle()
+            return await self.pool.beautify(self.large, timeout=60)
+
+        self.assertEqual(self.run_async(run()), jsbeautifier.beautify(self.large))
+
+    def test_default_pool(self):
+        try:
+            result = self.run_async(jsbeautifier.aio.beautify(self.small))
+            self.assertEqual(result, jsbeautifier.beautify(self.small))
+            self.assertIs(jsbeautifier.aio.get_pool(), jsbeautifier.aio.get_pool())
+        finally:
+            jsbeautifier.aio.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
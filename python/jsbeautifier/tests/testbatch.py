@@ -0,0 +1,45 @@
+import pickle
+import unittest
+import jsbeautifier
+
+
+class TestJSBeautifierBatch(unittest.TestCase):
+    def setUp(self):
+        self.options = jsbeautifier.default_options()
+        self.options.indent_size = 2
+        self.options.brace_style = "expand,preserve-inline"
+        self.sources = ["var a%d={b:%d};if(a){b()}" % (i, i) for i in range(50)]
+        self.expected = [
+            jsbeautifier.beautify(source, self.options) for source in self.sources
+        ]
+
+    def test_options_pickle(self):
+        options = pickle.loads(pickle.dumps(self.options))
+        self.assertEqual(
+            jsbeautifier.beautify("{a()}", options),
+            jsbeautifier.beautify("{a()}", self.options),
+        )
+
+    def test_in_process(self):
+        results = jsbeautifier.beautify_many(self.sources, self.options, workers=1)
+        self.assertEqual(results, self.expected)
+
+    def test_pool_keeps_order(self):
+        results = jsbeautifier.beautify_many(
+            iter(self.sources), self.options, workers=2, chunk_size=100, lazy=True
+        )
+        self.assertFalse(isinstance(results, list))
+        self.assertEqual(list(results), self.expected)
+
+    def test_pool_with_dict_options(self):
+        results = jsbeautifier.beautify_many(
+            self.sources[:3], {"indent_size": 1}, workers=2, chunk_size=1
+        )
+        self.assertEqual(
+            results,
+            [jsbeautifier.beautify(s, {"indent_size": 1}) for s in self.sources[:3]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import jsbeautifier
+import jsbeautifier.cli
+from jsbeautifier.cli import beautify_files, read_input
+from jsbeautifier.core.cache import options_key
+from jsbeautifier.core.fileindex import FileIndex
+
+
+class TestBeautifyFiles(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filepaths = []
+        for name, content in [
+            ("a.js", b"var a={b:1};"),
+            ("b.js", b"var b=\xff;"),
+            ("c.js", b"if(c){d()}"),
+        ]:
+            filepath = os.path.join(self.directory, name)
+            with open(filepath, "wb") as f:
+                f.write(content)
+            self.filepaths.append(filepath)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read(self, index):
+        with io.open(self.filepaths[index], encoding="UTF-8") as f:
+            return f.read()
+
+    def check_failure_does_not_stop_others(self, jobs):
+        options = jsbeautifier.default_options()
+        options.keep_quiet = True
+
+        failures = beautify_files(
+            set(self.filepaths),
+            True,
+            "stdout",
+            options,
+            "js",
+            jsbeautifier.beautify,
+            jobs,
+        )
+
+        self.assertEqual(failures, 1)
+        self.assertEqual(self.read(0), "var a = {\n    b: 1\n};")
+        self.assertEqual(self.read(2), "if (c) {\n    d()\n}")
+
+    def test_sequential(self):
+        self.check_failure_does_not_stop_others(1)
+
+    def test_parallel(self):
+        self.check_failure_does_not_stop_others(2)
+
+    def test_skip_unchanged(self):
+        options = jsbeautifier.default_options()
+        options.keep_quiet = True
+        index_path = os.path.join(self.directory, "index.json")
+        filepaths = [self.filepaths[0], self.filepaths[2]]
+        calls = []
+
+        def beautify(string, opts, sink=None):
+            calls.append(string)
+            return jsbeautifier.beautify(string, opts, sink)
+
+        def run():
+            del calls[:]
+            return beautify_files(
+                filepaths,
+                True,
+                "stdout",
+                options,
+                "js",
+                beautify,
+                1,
+                None,
+                FileIndex(index_path),
+            )
+
+        self.assertEqual(run(), 0)
+        self.assertEqual(len(calls), 2)
+
+        self.assertEqual(run(), 0)
+        self.assertEqual(calls, [])
+
+        # a touched file is read, but not beautified again
+        os.utime(filepaths[0], (0, 0))
+        self.assertEqual(run(), 0)
+        self.assertEqual(calls, [])
+
+        with open(filepaths[1], "a") as f:
+            f.write("e()")
+        self.assertEqual(run(), 0)
+        self.assertEqual(calls, ["if (c) {\n    d()\n}e()"])
+
+        options.indent_size = 2
+        self.assertEqual(run(), 0)
+        self.assertEqual(len(calls), 2)
+
+    def test_skip_unchanged_forgets_failures(self):
+        options = jsbeautifier.default_options()
+        options.keep_quiet = True
+        index_path = os.path.join(self.directory, "index.json")
+        filepath = self.filepaths[0]
+
+        def run():
+            return beautify_files(
+                [filepath],
+                True,
+                "stdout",
+                options,
+                "js",
+                jsbeautifier.beautify,
+                1,
+                None,
+                FileIndex(index_path),
+            )
+
+        self.assertEqual(run(), 0)
+        pretty = self.read(0)
+        key = options_key(jsbeautifier.beautify, options)
+        self.assertTrue(FileIndex(index_path).is_beautified(filepath, key, pretty))
+
+        with open(filepath, "wb") as f:
+            f.write(b"var a=\xff;")
+        self.assertEqual(run(), 1)
+        self.assertFalse(FileIndex(index_path).is_beautified(filepath, key, pretty))
+
+    def test_read_input_mapped(self):
+        filepath = os.path.join(self.directory, "mapped.js")
+        content = "var a = '\u00e9\u4e2d';\r\nb();\n" * 10
+        with io.open(filepath, "w", newline="", encoding="UTF-8") as f:
+            f.write(content)
+
+        threshold = jsbeautifier.cli.MMAP_THRESHOLD
+        try:
+            jsbeautifier.cli.MMAP_THRESHOLD = 1
+            self.assertEqual(read_input(filepath), content)
+            self.assertRaises(UnicodeError, read_input, self.filepaths[1])
+        finally:
+            jsbeautifier.cli.MMAP_THRESHOLD = threshold
+
+        self.assertEqual(read_input(filepath), content)
+
+
+if __name__ == "__main__":
+    unittest.main()
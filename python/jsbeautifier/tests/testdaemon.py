@@ -0,0 +1,240 @@
+import ast
+import io
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import jsbeautifier
+from jsbeautifier.cli import beautify_files
+from jsbeautifier.cli.client import Client, DaemonError, default_socket_path
+from jsbeautifier.cli.daemon import serve
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.directory, "daemon.sock")
+        self.thread = None
+
+    def tearDown(self):
+        if self.thread is not None and self.thread.is_alive():
+            Client(self.socket_path).stop()
+            self.thread.join()
+        shutil.rmtree(self.directory)
+
+    def start(self, idle_timeout=None):
+        self.thread = threading.Thread(
+            target=serve, args=(self.socket_path, 1, idle_timeout)
+        )
+        self.thread.start()
+        deadline = time.time() + 30
+        while not os.path.exists(self.socket_path):
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.01)
+
+    def test_beautify_and_stats(self):
+        self.start()
+        small = "if(a){b()}"
+        large = "function f(){if(a){b(c,d);}}\n" * 100
+        options = jsbeautifier.default_options()
+        options.indent_size = 2
+
+        with Client(self.socket_path) as client:
+            self.assertEqual(client.beautify(small), jsbeautifier.beautify(small))
+            self.assertEqual(
+                client.beautify(large, options), jsbeautifier.beautify(large, options)
+            )
+            with self.assertRaises(DaemonError) as context:
+                client.beautify(small, {"brace_style": "bogus"}, path="bad.js")
+            self.assertTrue(str(context.exception).startswith("bad.js: "))
+            # path is only echoed, whatever its type
+            with self.assertRaises(DaemonError) as context:
+                client.request(
+                    {"path": 5, "content": small, "options": {"brace_style": "bogus"}}
+                )
+            self.assertTrue(str(context.exception).startswith("5: "))
+
+            stats = client.stats()
+            self.assertEqual(stats["requests"], 4)
+            self.assertEqual(stats["errors"], 2)
+            self.assertEqual(stats["connections"], 1)
+            self.assertEqual(stats["characters"], len(small) * 3 + len(large))
+
+    def test_invalid_requests(self):
+        self.start()
+        with Client(self.socket_path) as client:
+            for request in [
+                {"content": 5},
+                {"content": "a", "options": [1]},
+                {"command": "bogus"},
+                [],
+            ]:
+                self.assertRaises(DaemonError, client.request, request)
+
+            # the connection is still usable, and nothing was beautified
+            self.assertEqual(client.beautify("a=1"), "a = 1")
+            stats = client.stats()
+            self.assertEqual(stats["requests"], 1)
+            self.assertEqual(stats["errors"], 4)
+
+    def test_connect_from_beautify_files(self):
+        self.start()
+        filepath = os.path.join(self.directory, "a.js")
+        with open(filepath, "wb") as f:
+            f.write(b"var a={b:1};")
+        options = jsbeautifier.default_options()
+        options.keep_quiet = True
+
+        with Client(self.socket_path) as client:
+            failures = beautify_files(
+                [filepath], True, "stdout", options, "js", client.beautify
+            )
+
+        self.assertEqual(failures, 0)
+        with io.open(filepath, encoding="UTF-8") as f:
+            self.assertEqual(f.read(), "var a = {\n    b: 1\n};")
+
+    def test_connect_with_cache(self):
+        self.start()
+        filepath = os.path.join(self.directory, "a.js")
+        cache_directory = os.path.join(self.directory, "cache")
+
+        def run(*args):
+            with open(filepath, "wb") as f:
+                f.write(b"var a={b:1};")
+            argv, stderr = sys.argv, sys.stderr
+            try:
+                sys.argv = ["js-beautify", "--cache-dir=" + cache_directory]
+                sys.argv += list(args) + ["--replace", filepath]
+                sys.stderr = io.StringIO()
+                self.assertEqual(jsbeautifier.main(), 0)
+                return sys.stderr.getvalue()
+            finally:
+                sys.argv, sys.stderr = argv, stderr
+
+        connect = ["--connect", "--socket=" + self.socket_path]
+        self.assertIn("0 hits, 1 misses", run(*connect))
+        # what the daemon returned is stored as jsbeautifier.beautify's result
+        self.assertIn("1 hits, 0 misses", run())
+        self.assertIn("1 hits, 0 misses", run(*connect))
+        with io.open(filepath, encoding="UTF-8") as f:
+            self.assertEqual(f.read(), "var a = {\n    b: 1\n};")
+
+    def test_connect_imports(self):
+        # the daemon does the beautifying, so the client doesn't load it
+        self.start()
+        filepath = os.path.join(self.directory, "a.js")
+        with open(filepath, "wb") as f:
+            f.write(b"var a={b:1};")
+        heavy = [
+            "jsbeautifier.javascript.beautifier",
+            "jsbeautifier.core.batch",
+            "jsbeautifier.core.cache",
+            "multiprocessing",
+            "platform",
+        ]
+
+        environ = dict(os.environ)
+        environ["PYTHONPATH"] = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys, jsbeautifier; code = jsbeautifier.main(); "
+                "sys.stderr.write(repr(sorted(sys.modules))); sys.exit(code)",
+                "--connect",
+                "--socket=" + self.socket_path,
+                "--replace",
+                "--quiet",
+                filepath,
+            ],
+            env=environ,
+            stderr=subprocess.PIPE,
+        )
+        modules = ast.literal_eval(process.communicate()[1].decode("UTF-8"))
+
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual([name for name in heavy if name in modules], [])
+        with io.open(filepath, encoding="UTF-8") as f:
+            self.assertEqual(f.read(), "var a = {\n    b: 1\n};")
+
+    def test_stop_with_open_connections(self):
+        # connections still open are ended without asyncio reporting them
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger = logging.getLogger("asyncio")
+        logger.addHandler(handler)
+        try:
+            self.start()
+            with Client(self.socket_path) as idle, Client(self.socket_path) as client:
+                idle.stats()
+                self.assertTrue(client.stop())
+                self.thread.join(30)
+        finally:
+            logger.removeHandler(handler)
+
+        self.assertFalse(self.thread.is_alive())
+        self.assertEqual(records, [])
+
+    def test_stop_and_idle_timeout(self):
+        self.start()
+        self.assertTrue(Client(self.socket_path).stop())
+        self.thread.join()
+        self.assertFalse(os.path.exists(self.socket_path))
+
+        # a connection with no requests does not keep the daemon running
+        self.start(idle_timeout=0.2)
+        client = Client(self.socket_path)
+        client.stats()
+        self.thread.join(30)
+        client.close()
+        self.assertFalse(self.thread.is_alive())
+        self.assertFalse(os.path.exists(self.socket_path))
+
+    def test_default_socket_path(self):
+        runtime_directory = os.environ.pop("XDG_RUNTIME_DIR", None)
+        tempdir = tempfile.tempdir
+        try:
+            tempfile.tempdir = self.directory
+            path = default_socket_path()
+            directory = os.path.dirname(path)
+            self.assertEqual(os.path.dirname(directory), self.directory)
+            self.assertEqual(os.stat(directory).st_mode & 0o777, 0o700)
+            self.assertEqual(default_socket_path(), path)
+
+            # not if others could replace the socket
+            os.chmod(directory, 0o777)
+            self.assertRaises(DaemonError, default_socket_path)
+            os.rmdir(directory)
+            os.symlink(self.directory, directory)
+            self.assertRaises(DaemonError, default_socket_path)
+        finally:
+            tempfile.tempdir = tempdir
+            if runtime_directory is not None:
+                os.environ["XDG_RUNTIME_DIR"] = runtime_directory
+
+    def test_socket_of_other_user(self):
+        self.start()
+        getuid = os.getuid
+        uid = getuid()
+        try:
+            os.getuid = lambda: uid + 1
+            with Client(self.socket_path) as client:
+                self.assertRaises(DaemonError, client.stats)
+            # nor is it removed by another daemon
+            self.assertRaises(DaemonError, serve, self.socket_path, 1)
+            self.assertTrue(os.path.exists(self.socket_path))
+        finally:
+            os.getuid = getuid
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import threading
+import unittest
+import jsbeautifier
+
+
+class TestJSBeautifierFormatter(unittest.TestCase):
+    def test_matches_beautify(self):
+        options = jsbeautifier.default_options()
+        options.indent_size = 2
+        formatter = jsbeautifier.formatter(options)
+
+        for source in ["var a=1;", "if(a){b()}else{c()}", "", "x = `a${b}c`"]:
+            self.assertEqual(
+                formatter.beautify(source), jsbeautifier.beautify(source, options)
+            )
+
+    def test_options_are_snapshot(self):
+        options = jsbeautifier.default_options()
+        formatter = jsbeautifier.formatter(options)
+        options.indent_size = 2
+
+        self.assertEqual(formatter.beautify("{a()}"), "{\n    a()\n}")
+
+    def test_options_parsed_once(self):
+        # parsing again would drop preserve-inline from brace_style
+        options = {"brace_style": "collapse,preserve-inline"}
+        formatter = jsbeautifier.formatter(options)
+
+        self.assertEqual(formatter.beautify("var a={b:1};"), "var a = { b: 1 };")
+        self.assertEqual(
+            formatter.beautify("var a={b:1};"),
+            jsbeautifier.beautify("var a={b:1};", options),
+        )
+
+    def test_eol_detected_per_input(self):
+        formatter = jsbeautifier.formatter()
+
+        self.assertEqual(formatter.beautify("a;\r\nb;"), "a;\r\nb;")
+        self.assertEqual(formatter.beautify("a;\nb;"), "a;\nb;")
+
+    def test_shared_between_threads(self):
+        formatter = jsbeautifier.formatter()
+        sources = ["var a%d={b:%d};" % (i, i) for i in range(20)]
+        expected = [jsbeautifier.beautify(source) for source in sources]
+        results = {}
+
+        def run(index):
+            for _ in range(5):
+                results[index] = formatter.beautify(sources[index])
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([results[i] for i in range(20)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
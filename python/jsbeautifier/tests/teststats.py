@@ -0,0 +1,85 @@
+import io
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+import jsbeautifier
+from jsbeautifier.core.stats import BeautifierStats
+
+
+class TestBeautifierStats(unittest.TestCase):
+    def test_collects_phases_and_counts(self):
+        calls = []
+        stats = BeautifierStats(callback=calls.append)
+        options = {"wrap_line_length": 10}
+        source = "/* a */\nvar alpha = beta + gamma + delta;\nf();"
+
+        result = jsbeautifier.beautify(source, options, stats=stats)
+
+        self.assertEqual(result, jsbeautifier.beautify(source, options))
+        self.assertEqual(calls, [stats])
+        self.assertEqual(
+            sorted(stats.phases), ["handle", "output", "setup", "tokenize", "unpack"]
+        )
+        self.assertEqual(stats.token_counts["TK_BLOCK_COMMENT"], 1)
+        self.assertEqual(stats.token_counts["TK_WORD"], 5)
+        self.assertEqual(stats.token_counts["TK_EOF"], 1)
+        self.assertEqual(stats.output_lines, len(result.split("\n")))
+        self.assertEqual(stats.wraps, 3)
+
+    def test_accumulates_over_calls(self):
+        stats = BeautifierStats()
+        sink = io.StringIO()
+        for _ in range(3):
+            jsbeautifier.beautify("a;\nb;", sink=sink, stats=stats)
+
+        self.assertEqual(stats.calls, 3)
+        self.assertEqual(stats.output_lines, 6)
+        self.assertEqual(stats.as_dict()["token_counts"]["TK_SEMICOLON"], 6)
+
+        stats.reset()
+        self.assertEqual(stats.as_dict()["calls"], 0)
+
+    def test_profiles_handlers(self):
+        stats = BeautifierStats(profile_handlers=True)
+        beautifier = jsbeautifier.javascript.beautifier.Beautifier()
+        source = "var a = f(b, c);\nif (a) {\n  g();\n}"
+        expected = beautifier.beautify(source)
+
+        self.assertEqual(beautifier.beautify(source, stats=stats), expected)
+        # the timed wrappers only live for the profiled call
+        self.assertNotIn("handle_word", beautifier.__dict__)
+        self.assertEqual(beautifier.beautify(source), expected)
+
+        calls = dict((row[0], row[1]) for row in stats.handlers.table())
+        self.assertEqual(calls["handle_token"], sum(stats.token_counts.values()))
+        self.assertEqual(calls["handle_word"], 8)
+        self.assertEqual(calls["handle_comma"], 1)
+        self.assertEqual(calls["handle_eof"], 1)
+        self.assertIn("print_newline", calls)
+        self.assertIn("restore_mode", calls)
+
+        output = io.StringIO()
+        stats.handlers.print_table(output)
+        self.assertIn("handle_word", output.getvalue())
+
+        profile = pstats.Stats(stats.handlers)
+        self.assertEqual(
+            profile.total_calls, sum(row[1] for row in stats.handlers.table())
+        )
+
+        directory = tempfile.mkdtemp()
+        try:
+            file_name = os.path.join(directory, "handlers.prof")
+            stats.handlers.dump_stats(file_name)
+            self.assertEqual(pstats.Stats(file_name).total_calls, profile.total_calls)
+        finally:
+            shutil.rmtree(directory)
+
+        stats.reset()
+        self.assertEqual(stats.handlers.table(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
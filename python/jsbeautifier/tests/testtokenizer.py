@@ -0,0 +1,92 @@
+import copy
+import io
+import os
+import pickle
+import unittest
+import jsbeautifier
+from jsbeautifier.javascript.options import BeautifierOptions
+from jsbeautifier.javascript.tokenizer import TOKEN, Tokenizer, MasterRegexTokenizer
+from .generated import tests as generated
+
+
+class TestTokenTypes(unittest.TestCase):
+    def test_codes_and_names(self):
+        types = [
+            getattr(TOKEN, name) for name in dir(TOKEN) if not name.startswith("_")
+        ]
+        self.assertEqual(len(set(int(t) for t in types)), len(types))
+        self.assertEqual(TOKEN.START_EXPR.name, "TK_START_EXPR")
+        self.assertEqual(str(TOKEN.EOF), "TK_EOF")
+        self.assertEqual(
+            Tokenizer("a", BeautifierOptions()).tokenize().next().type, TOKEN.WORD
+        )
+
+    def test_copy_and_pickle(self):
+        for token_type in [
+            copy.copy(TOKEN.WORD),
+            copy.deepcopy(TOKEN.WORD),
+            pickle.loads(pickle.dumps(TOKEN.WORD)),
+            pickle.loads(pickle.dumps(TOKEN.WORD, 0)),
+        ]:
+            self.assertEqual(token_type, TOKEN.WORD)
+            self.assertEqual(token_type.name, "TK_WORD")
+
+    def test_equality(self):
+        # token types still work as the "TK_" strings they used to be
+        self.assertEqual(TOKEN.WORD, "TK_WORD")
+        self.assertNotEqual(TOKEN.WORD, "TK_RESERVED")
+        self.assertTrue(TOKEN.WORD in ("TK_RESERVED", "TK_WORD"))
+        self.assertEqual({"TK_WORD": 1}[TOKEN.WORD], 1)
+        self.assertEqual({TOKEN.WORD: 1}["TK_WORD"], 1)
+        self.assertEqual(int(TOKEN.WORD), 7)
+        self.assertEqual(list(range(20))[TOKEN.WORD], 7)
+
+
+class TestMasterRegexTokenizer(unittest.TestCase):
+    def assertSameTokens(self, source, **opts):
+        options = BeautifierOptions(opts)
+        expected = Tokenizer(source, options).tokenize()
+        actual = MasterRegexTokenizer(source, options).tokenize()
+
+        while expected.hasNext():
+            self.assertTrue(actual.hasNext())
+            want = expected.next()
+            got = actual.next()
+            self.assertEqual(
+                (got.type, got.text, got.newlines, got.whitespace_before),
+                (want.type, want.text, want.newlines, want.whitespace_before),
+            )
+        self.assertFalse(actual.hasNext())
+
+    def test_fallback_tokens(self):
+        self.assertSameTokens(
+            "#!/usr/bin/env node\nvar a = /[/]+/g.test(`x${b}`), c = 'd\\'e';\n"
+            "/* block */ a /= 2 // line\n#1={} \\u0061 .5 ... a?.b ?.5:1"
+        )
+        self.assertSameTokens("<!--\nvar a = 1;\n-->")
+        self.assertSameTokens("var x = <a>{b}</a>;", e4x=True)
+        self.assertSameTokens("var a = '{{b}}' + c{{d}};", templating=["handlebars"])
+
+    def test_resources(self):
+        resources = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "..",
+            "..",
+            "..",
+            "test",
+            "resources",
+        )
+        for name in ["underscore.js", "underscore-min.js"]:
+            with io.open(os.path.join(resources, name), encoding="UTF-8") as f:
+                self.assertSameTokens(f.read())
+
+
+class TestJSBeautifierMasterRegex(generated.TestJSBeautifier):
+    # Runs the whole generated suite with the master regex tokenizer.
+    def reset_options(self):
+        generated.TestJSBeautifier.reset_options(self)
+        self.options.tokenizer = "master-regex"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,20 @@ class UnpackingError(Exception):
     pass
 
 
+def replace_lookups(varname, values, template, source):
+    """Replaces every `varname[index]` in source with template % the value at
+    that index, in one pass. Indexes past the end of values are kept."""
+    pattern = re.compile(re.escape(varname) + r"\[(0|[1-9][0-9]*)\]")
+
+    def lookup(match):
+        index = int(match.group(1))
+        if index < len(values):
+            return template % values[index]
+        return match.group(0)
+
+    return pattern.sub(lookup, source)
+
+
 def getunpackers():
     """Scans the unpackers dir, finds unpackers and add them to UNPACKERS list.
     An unpacker will be loaded only if it is a valid python module (name must
@@ -43,10 +57,35 @@ def getunpackers():
 
 UNPACKERS = getunpackers()
 
+# Number of characters at the start of the source given to prescreen()
+HEAD_SIZE = 256
+
+
+def candidates(source):
+    """Returns the unpackers that may detect source, judged by their optional
+    prescreen() on the head of the source and by their optional SIGNATURES,
+    without running any detect()."""
+    head = source[:HEAD_SIZE]
+    found = {}
+    result = []
+    for unpacker in UNPACKERS:
+        prescreen = getattr(unpacker, "prescreen", None)
+        if prescreen is not None and not prescreen(head):
+            continue
+        signatures = getattr(unpacker, "SIGNATURES", None)
+        if signatures is not None:
+            for signature in signatures:
+                if signature not in found:
+                    found[signature] = signature in source
+            if not any(found[signature] for signature in signatures):
+                continue
+        result.append(unpacker)
+    return result
+
 
 def run(source, evalcode=False):
     """Runs the applicable unpackers and return unpacked source as a string."""
-    for unpacker in [mod for mod in UNPACKERS if mod.detect(source)]:
+    for unpacker in [mod for mod in candidates(source) if mod.detect(source)]:
         source = unpacker.unpack(source)
     if evalcode and evalbased.detect(source):
         source = evalbased.unpack(source)
@@ -18,6 +18,8 @@
 
 import re
 
+from jsbeautifier.unpackers import replace_lookups
+
 PRIORITY = 1
 
 
@@ -42,6 +44,11 @@ def smartsplit(code):
     return strings
 
 
+def prescreen(head):
+    """Cheap test on the start of `code`, which detect() needs to match."""
+    return head.startswith("var _0x")
+
+
 def detect(code):
     """Detects if `code` is JavascriptObfuscator.com packed."""
     # prefer `is not` idiom, so that a true boolean is returned
@@ -55,7 +62,7 @@ def unpack(code):
         if matches:
             variable = matches.group(1)
             dictionary = smartsplit(matches.group(2))
-            code = code[len(matches.group(0)) :]
-            for key, value in enumerate(dictionary):
-                code = code.replace(r"%s[%s]" % (variable, key), value)
+            code = replace_lookups(
+                variable, dictionary, "%s", code[len(matches.group(0)) :]
+            )
     return code
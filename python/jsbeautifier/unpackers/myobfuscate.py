@@ -61,6 +61,8 @@ SIGNATURE = (
     r'\x6C\x65\x6E\x67\x74\x68"]'
 )
 
+SIGNATURES = (SIGNATURE,)
+
 
 def detect(source):
     """Detects MyObfuscate.com packer."""
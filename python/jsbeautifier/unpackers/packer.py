@@ -15,10 +15,29 @@
 import re
 import string
 import sys
-from jsbeautifier.unpackers import UnpackingError
+from jsbeautifier.unpackers import UnpackingError, replace_lookups
 
 PRIORITY = 1
 
+SIGNATURES = ("eval",)
+
+_HEADER = re.compile(
+    r"eval[ ]*\([ ]*function[ ]*\([ ]*p[ ]*,[ ]*a[ ]*,[ ]*c["
+    " ]*,[ ]*k[ ]*,[ ]*e[ ]*,[ ]*"
+)
+
+
+def _search_header(source):
+    # Same as _HEADER.search(source), but only tries the places where "eval"
+    # is found, which a plain substring search finds much faster
+    position = source.find("eval")
+    while position != -1:
+        match = _HEADER.match(source, position)
+        if match:
+            return match
+        position = source.find("eval", position + 4)
+    return None
+
 
 def detect(source):
     global beginstr
@@ -27,11 +46,7 @@ def detect(source):
     endstr = ""
     begin_offset = -1
     """Detects whether `source` is P.A.C.K.E.R. coded."""
-    mystr = re.search(
-        r"eval[ ]*\([ ]*function[ ]*\([ ]*p[ ]*,[ ]*a[ ]*,[ ]*c["
-        " ]*,[ ]*k[ ]*,[ ]*e[ ]*,[ ]*",
-        source,
-    )
+    mystr = _search_header(source)
     if mystr:
         begin_offset = mystr.start()
         beginstr = source[:begin_offset]
@@ -60,17 +75,30 @@ def unpack(source):
     except TypeError:
         raise UnpackingError("Unknown p.a.c.k.e.r. encoding.")
 
-    def lookup(match):
-        """Look up symbols in the synthetic symtab."""
-        word = match.group(0)
-        return symtab[unbase(word)] or word
+    symbols = _Symbols(symtab, unbase)
 
     payload = payload.replace("\\\\", "\\").replace("\\'", "'")
     if sys.version_info.major == 2:
-        source = re.sub(r"\b\w+\b", lookup, payload)
+        parts = re.split(r"\b(\w+)\b", payload)
     else:
-        source = re.sub(r"\b\w+\b", lookup, payload, flags=re.ASCII)
-    return _replacestrings(source)
+        parts = re.split(r"\b(\w+)\b", payload, flags=re.ASCII)
+    # split() puts the words at the odd indexes
+    parts[1::2] = [symbols[word] for word in parts[1::2]]
+    return _replacestrings("".join(parts))
+
+
+class _Symbols(dict):
+    """Maps payload words to the symbols they stand for. Payloads repeat the
+    same few words over and over, so each one is only decoded once."""
+
+    def __init__(self, symtab, unbase):
+        dict.__init__(self)
+        self.symtab = symtab
+        self.unbase = unbase
+
+    def __missing__(self, word):
+        symbol = self[word] = self.symtab[self.unbase(word)] or word
+        return symbol
 
 
 def _filterargs(source):
@@ -108,10 +136,7 @@ def _replacestrings(source):
         varname, strings = match.groups()
         startpoint = len(match.group(0))
         lookup = strings.split('","')
-        variable = "%s[%%d]" % varname
-        for index, value in enumerate(lookup):
-            source = source.replace(variable % index, '"%s"' % value)
-        return source[startpoint:]
+        return replace_lookups(varname, lookup, '"%s"', source[startpoint:])
     return beginstr + source + endstr
 
 
@@ -132,7 +157,7 @@ class Unbaser(object):
 
         # fill elements 37...61, if necessary
         if 36 < base < 62:
-            if not hasattr(self.ALPHABET, self.ALPHABET[62][:base]):
+            if base not in self.ALPHABET:
                 self.ALPHABET[base] = self.ALPHABET[62][:base]
         # attrs = self.ALPHABET
         # print ', '.join("%s: %s" % item for item in attrs.items())
@@ -155,7 +180,9 @@ class Unbaser(object):
 
     def _dictunbaser(self, string):
         """Decodes a  value to an integer."""
+        base = self.base
+        dictionary = self.dictionary
         ret = 0
-        for index, cipher in enumerate(string[::-1]):
-            ret += (self.base**index) * self.dictionary[cipher]
+        for cipher in string:
+            ret = ret * base + dictionary[cipher]
         return ret
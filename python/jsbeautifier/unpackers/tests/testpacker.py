@@ -6,7 +6,7 @@
 """Tests for P.A.C.K.E.R. unpacker."""
 
 import unittest
-from jsbeautifier.unpackers.packer import detect, unpack
+from jsbeautifier.unpackers.packer import Unbaser, detect, unpack
 
 # pylint: disable=R0904
 
@@ -68,6 +68,21 @@ class TestPacker(unittest.TestCase):
             "$(document).ready(function(){ $('.r8ce6').html(52136); $('.rfab0').html(8088); $('.rb0de').html(555); $('.r542c').html(65103)})",
         )
 
+    def test_unbaser(self):
+        """Test Unbaser for the radixes p.a.c.k.e.r. emits."""
+
+        def equals(base, string, number):
+            return self.assertEqual(Unbaser(base)(string), number)
+
+        equals(10, "1234", 1234)
+        equals(36, "zz", 35 * 36 + 35)
+        equals(50, "N", 49)
+        equals(62, "0", 0)
+        equals(62, "Z", 61)
+        equals(62, "10", 62)
+        equals(62, "Zz1", 61 * 62 * 62 + 35 * 62 + 1)
+        equals(95, "~ ", 94 * 95)
+
 
 if __name__ == "__main__":
     unittest.main()
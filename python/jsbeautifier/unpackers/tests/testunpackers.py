@@ -0,0 +1,74 @@
+#
+# Tests for the unpacker pre-screen and the unpack option.
+#
+
+"""Tests for choosing which unpackers run."""
+
+import unittest
+
+import jsbeautifier
+from jsbeautifier import unpackers
+from jsbeautifier.unpackers import javascriptobfuscator, myobfuscate, packer, urlencode
+
+# pylint: disable=R0904
+
+
+class TestCandidates(unittest.TestCase):
+    """candidates() test case."""
+
+    def test_candidates(self):
+        """Test candidates() against detect() of every unpacker."""
+
+        def names(source):
+            return [mod.__name__ for mod in unpackers.candidates(source)]
+
+        self.assertEqual(names(""), [urlencode.__name__])
+        self.assertEqual(names("var a = b; " * 1000), [])
+        self.assertEqual(names("var%20a=b"), [urlencode.__name__])
+        self.assertEqual(
+            names('var _0xaaaa = ["a", "b"]'), [javascriptobfuscator.__name__]
+        )
+        self.assertEqual(
+            names("var a = 1;\neval(function(p,a,c,k,e,r){})"), [packer.__name__]
+        )
+        self.assertEqual(
+            names("var s = " + myobfuscate.SIGNATURE), [myobfuscate.__name__]
+        )
+
+        for source in [
+            "var a = b",
+            "var%20a=b",
+            'var _0xaaaa = ["a", "b"]',
+            "eval(function(p,a,c,k,e,r){})",
+            "x = 1; eval(s)",
+            myobfuscate.SIGNATURE,
+        ]:
+            detected = [mod for mod in unpackers.UNPACKERS if mod.detect(source)]
+            for mod in detected:
+                self.assertIn(mod, unpackers.candidates(source))
+
+    def test_replace_lookups(self):
+        """Test replace_lookups() function."""
+        self.assertEqual(
+            unpackers.replace_lookups(
+                "_x", ["a", "b"], '"%s"', "f(_x[1],_x[0],_x[2],_x[01],_y[0])"
+            ),
+            'f("b","a",_x[2],_x[01],_y[0])',
+        )
+        # replaced values are not looked at again
+        self.assertEqual(
+            unpackers.replace_lookups("_x", ["_x[1]", "b"], "%s", "_x[0]"), "_x[1]"
+        )
+
+    def test_unpack_option(self):
+        """Test that unpacking can be switched off."""
+        source = 'var _0x8df3=["a"];alert(_0x8df3[0]);'
+        self.assertEqual(jsbeautifier.beautify(source), 'alert("a");')
+        self.assertEqual(
+            jsbeautifier.beautify(source, {"unpack": False}),
+            'var _0x8df3 = ["a"];\nalert(_0x8df3[0]);',
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,6 +24,11 @@ except ImportError:
 PRIORITY = 0
 
 
+def prescreen(head):
+    """Cheap test on the start of `code`: a space rules out detect()."""
+    return " " not in head
+
+
 def detect(code):
     """Detects if a scriptlet is urlencoded."""
     # the fact that script doesn't contain any space, but has %20 instead
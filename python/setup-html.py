@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+from setuptools import setup
+from htmlbeautifier.__version__ import __version__
+
+from setuptools.command.test import test as TestCommand
+
+DIR = "htmlbeautifier/tests/"
+
+
+class PyTestHTML(TestCommand):
+    user_options = [("pytest-args=", "a", "Arguments to pass to py.test")]
+
+    def initialize_options(self):
+        TestCommand.initialize_options(self)
+        self.pytest_args = ["--assert=plain"] + [
+            DIR + x for x in os.listdir(DIR) if x.endswith(".py") and x[0] not in "._"
+        ]
+
+    def run_tests(self):
+        # import here, cause outside the eggs aren't loaded
+        import pytest
+
+        errno = pytest.main(self.pytest_args)
+        sys.exit(errno)
+
+
+setup(
+    name="htmlbeautifier",
+    version=__version__,
+    description="HTML beautifier.",
+    long_description=(
+        "Beautify HTML, including embedded JavaScript and CSS, "
+        "without shelling out to Node"
+    ),
+    author="Liam Newman, Einar Lielmanis, et al.",
+    author_email="team@beautifier.io",
+    url="https://beautifier.io",
+    packages=[
+        "htmlbeautifier",
+        "htmlbeautifier.tests",
+        "htmlbeautifier.tests.generated",
+        "htmlbeautifier.html",
+    ],
+    install_requires=[
+        "jsbeautifier",
+        "cssbeautifier",
+        "six>=1.13.0",
+        "editorconfig>=0.12.2",
+    ],
+    license="MIT",
+    test_suite="pytest.collector",
+    cmdclass={"test": PyTestHTML},
+)
@@ -5,6 +5,7 @@ import io
 import os
 import copy
 import cssbeautifier
+from benchmarks.memory import report_peak_rss
 
 options = cssbeautifier.default_options()
 options.wrap_line_length = 80
@@ -34,3 +35,5 @@ if __name__ == "__main__":
     beautifier_test_github_css()
 
     report_perf("beautifier_test_github_css")
+
+    report_peak_rss()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import copy
+import htmlbeautifier
+from benchmarks.memory import report_peak_rss
+
+options = {}
+options["wrap_line_length"] = 80
+data = ""
+data_attr = ""
+
+
+def beautifier_test_github_html():
+    htmlbeautifier.beautify(data, options)
+
+
+def beautifier_test_base64_image():
+    htmlbeautifier.beautify(data_attr, options)
+
+
+def report_perf(fn):
+    import timeit
+
+    iter = 5
+    time = timeit.timeit(
+        fn + "()", setup="from __main__ import " + fn + "; gc.enable()", number=iter
+    )
+    print(fn + ": " + str(iter / time) + " cycles/sec")
+
+
+if __name__ == "__main__":
+    dirname = os.path.dirname(os.path.abspath(__file__))
+    github_file = os.path.join(dirname, "../", "test/resources/github.html")
+    data = copy.copy("".join(io.open(github_file, encoding="utf-8").readlines()))
+    data_attr_file = os.path.join(
+        dirname, "../", "test/resources/html-with-base64image.html"
+    )
+    data_attr = copy.copy(
+        "".join(io.open(data_attr_file, encoding="utf-8").readlines())
+    )
+
+    # warm up
+    beautifier_test_github_html()
+    beautifier_test_base64_image()
+
+    report_perf("beautifier_test_github_html")
+    report_perf("beautifier_test_base64_image")
+
+    report_peak_rss()
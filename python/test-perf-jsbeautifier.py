@@ -4,12 +4,18 @@
 import io
 import os
 import copy
+import tempfile
 import jsbeautifier
+from benchmarks.memory import report_peak_rss
+from jsbeautifier.cli import read_input
+from jsbeautifier.javascript.options import BeautifierOptions
+from jsbeautifier.javascript.tokenizer import Tokenizer, MasterRegexTokenizer
 
 options = jsbeautifier.default_options()
 options.wrap_line_length = 80
 data = ""
 data_min = ""
+tokenizer_options = BeautifierOptions(options)
 
 
 def beautifier_test_underscore():
@@ -24,6 +30,18 @@ def beautifier_test_github_min():
     jsbeautifier.beautify(github_min, options)
 
 
+def tokenizer_test_github_min():
+    Tokenizer(github_min, tokenizer_options).tokenize()
+
+
+def tokenizer_test_github_min_master_regex():
+    MasterRegexTokenizer(github_min, tokenizer_options).tokenize()
+
+
+def input_test_large_file():
+    read_input(large_file)
+
+
 def report_perf(fn):
     import timeit
 
@@ -32,6 +50,20 @@ def report_perf(fn):
         fn + "()", setup="from __main__ import " + fn + "; gc.enable()", number=iter
     )
     print(fn + ": " + str(iter / time) + " cycles/sec")
+    return time / iter
+
+
+def report_token_cost(fn, text):
+    token_count = sum(1 for token in Tokenizer(text, tokenizer_options).tokenize())
+    cycle = report_perf(fn)
+    print(
+        fn
+        + ": "
+        + str(token_count)
+        + " tokens, "
+        + str(cycle * 1000000 / token_count)
+        + " usec/token"
+    )
 
 
 if __name__ == "__main__":
@@ -53,7 +85,22 @@ if __name__ == "__main__":
     beautifier_test_underscore()
     beautifier_test_underscore_min()
     beautifier_test_github_min()
+    tokenizer_test_github_min()
+    tokenizer_test_github_min_master_regex()
 
     report_perf("beautifier_test_underscore")
     report_perf("beautifier_test_underscore_min")
     report_perf("beautifier_test_github_min")
+    report_token_cost("tokenizer_test_github_min", github_min)
+    report_token_cost("tokenizer_test_github_min_master_regex", github_min)
+
+    # about 20MB of generated code, enough to take the memory-mapped path
+    with tempfile.NamedTemporaryFile(suffix=".js", delete=False) as f:
+        large_file = f.name
+        f.write((github_min * 100).encode("UTF-8"))
+    try:
+        report_perf("input_test_large_file")
+    finally:
+        os.remove(large_file)
+
+    report_peak_rss()
@@ -24,6 +24,8 @@ release_python()
     python setup.py sdist || exit 1
     cp setup-css.py setup.py || exit 1
     python setup.py sdist || exit 1
+    cp setup-html.py setup.py || exit 1
+    python setup.py sdist || exit 1
     rm setup.py || exit 1
     python -m twine upload dist/* || exit 1
 }
@@ -91,6 +93,7 @@ update_versions()
 
     echo "__version__ = \"$NEW_VERSION\"" > python/jsbeautifier/__version__.py
     echo "__version__ = \"$NEW_VERSION\"" > python/cssbeautifier/__version__.py
+    echo "__version__ = \"$NEW_VERSION\"" > python/htmlbeautifier/__version__.py
     git add . || exit 1
     git commit -am "Bump version numbers for $NEW_VERSION" || exit 1
     git push || exit 1
@@ -113,6 +116,7 @@ update_release_branch()
     git add -f js/test/generated/
     git add -f python/jsbeautifier/tests/generated/
     git add -f python/cssbeautifier/tests/generated/
+    git add -f python/htmlbeautifier/tests/generated/
     
     git commit -m "Release: $NEW_VERSION"
     git tag "v$NEW_VERSION" || exit 1